@@ -0,0 +1,98 @@
+"""
+File: bench_formats.py
+
+Transcript serialization format benchmark for the content-pipeline project.
+
+Builds a synthetic TranscriptV1 (20,000 segments by default, roughly a long podcast)
+and reports, for every transcript format, the encoded size and the median encode and
+decode times (decoding detects the format from the data, as readers do). Formats whose
+optional dependency (msgpack, zstandard) is not installed are listed as skipped.
+
+Usage:
+    python -m benchmarks.bench_formats [--segments 20000] [--runs 5]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Format name fragment -> module the format needs
+OPTIONAL_MODULES = {"msgpack": "msgpack", "zst": "zstandard"}
+
+WORDS = (
+    "the pipeline extracts audio and transcribes each window so that segments arrive "
+    "while the model keeps running on long recordings with several speakers"
+).split()
+
+
+def make_transcript(segments: int):
+    """
+    Return a TranscriptV1 with `segments` segments of varied text, speakers and confidences.
+    """
+    from pipeline.transcribers.schemas.transcript_v1 import TranscriptSegment, TranscriptV1, build_transcript_metadata
+
+    rng = random.Random(0)
+    items = []
+    for index in range(segments):
+        seconds = index * 2.5
+        items.append(TranscriptSegment(
+            text=" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 18))),
+            timestamp=f"{int(seconds // 3600):02}:{int(seconds % 3600 // 60):02}:{seconds % 60:06.3f}",
+            speaker=f"SPEAKER_{rng.randint(0, 3)}",
+            confidence=round(rng.uniform(0.6, 1.0), 4),
+        ))
+    return TranscriptV1(metadata=build_transcript_metadata("whisper", "base", language="en"), transcript=items)
+
+
+def time_format(transcript, name: str, runs: int):
+    """
+    Return (encoded bytes, median encode seconds, median decode seconds) for a format.
+    """
+    from pipeline.transcribers.formats import decode_transcript, encode_transcript
+
+    encode_samples, decode_samples = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        data = encode_transcript(transcript, name)
+        encode_samples.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        decoded = decode_transcript(data)
+        decode_samples.append(time.perf_counter() - start)
+    assert decoded == transcript, f"{name} did not round-trip"
+    return len(data), statistics.median(encode_samples), statistics.median(decode_samples)
+
+
+def main() -> int:
+    """
+    Print the per-format size and speed report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=20000, help="Segments in the synthetic transcript")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per format (median is reported)")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from pipeline.transcribers.formats import TRANSCRIPT_FORMAT_NAMES
+
+    transcript = make_transcript(opts.segments)
+    print(f"Synthetic transcript: {opts.segments} segments")
+    baseline = None
+    print(f"\n  {'format':<14}{'size':>11}{'ratio':>8}{'encode':>11}{'decode':>11}")
+    for name in TRANSCRIPT_FORMAT_NAMES:
+        missing = [m for marker, m in OPTIONAL_MODULES.items() if marker in name and importlib.util.find_spec(m) is None]
+        if missing:
+            print(f"  {name:<14}skipped ({missing[0]} is not installed)")
+            continue
+        size, encode, decode = time_format(transcript, name, opts.runs)
+        baseline = baseline or size
+        print(f"  {name:<14}{size / 1024 / 1024:8.2f} MB{size / baseline:8.2f}{encode * 1000:9.1f}ms{decode * 1000:9.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
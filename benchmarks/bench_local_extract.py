@@ -0,0 +1,80 @@
+"""
+File: bench_local_extract.py
+
+Local video audio-extraction benchmark for the content-pipeline project.
+
+Generates a synthetic video (test pattern plus tone) with ffmpeg and times the
+moviepy MP3 path ("archive") against the direct ffmpeg "copy" and "asr" profiles,
+reporting median wall-clock time and output size per profile.
+
+Usage:
+    python -m benchmarks.bench_local_extract [--seconds 600] [--runs 3]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_synthetic_video(path: str, seconds: int) -> None:
+    """
+    Write an H.264/AAC MP4 of the given length with a moving test pattern and a sine tone.
+    """
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+
+    subprocess.run([
+        ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", f"testsrc=size=640x360:rate=25:duration={seconds}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={seconds}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-c:a", "aac", "-b:a", "128k",
+        "-shortest", path
+    ], check=True)
+
+
+def time_profile(video_path: str, output_dir: str, profile: str, runs: int):
+    """
+    Return (median seconds, output bytes) for extracting audio with a profile.
+    """
+    from pipeline.extractors.runner import extract_local_audio
+
+    samples = []
+    audio_path = None
+    for run in range(runs):
+        output_path = os.path.join(output_dir, f"{profile}-{run}.mp3")
+        start = time.perf_counter()
+        audio_path = extract_local_audio(video_path, output_path, profile)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), os.path.getsize(audio_path)
+
+
+def main() -> int:
+    """
+    Print the per-profile extraction report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=600, help="Length of the synthetic video")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per profile (median is reported)")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    with tempfile.TemporaryDirectory() as work_dir:
+        video_path = os.path.join(work_dir, "synthetic.mp4")
+        make_synthetic_video(video_path, opts.seconds)
+        print(f"Synthetic video: {opts.seconds}s, {os.path.getsize(video_path) / 1024 / 1024:.1f} MB")
+
+        baseline = None
+        print(f"\n  {'profile':<10}{'median':>10}{'output':>12}{'speedup':>10}")
+        for profile in ("archive", "copy", "asr"):
+            elapsed, size = time_profile(video_path, work_dir, profile, opts.runs)
+            baseline = baseline or elapsed
+            print(f"  {profile:<10}{elapsed:9.2f}s{size / 1024 / 1024:10.1f} MB{baseline / elapsed:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
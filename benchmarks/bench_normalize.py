@@ -0,0 +1,93 @@
+"""
+File: bench_normalize.py
+
+Transcript normalization micro-benchmark for the content-pipeline project.
+
+Builds a synthetic raw Whisper-style result (20,000 segments by default) and reports
+the median time of normalize_transcript_v1 with full validation against the trusted
+mode, along with per-segment format_timestamp calls against format_timestamps. Both
+paths are checked to produce equal transcripts before timing.
+
+Usage:
+    python -m benchmarks.bench_normalize [--segments 20000] [--runs 7]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class BenchAdapter:
+    """
+    Adapter stand-in that reports engine details without loading a model.
+    """
+    def get_engine_info(self):
+        return "whisper", "base"
+
+
+def make_raw(segments: int) -> dict:
+    """
+    Return a raw transcript with consecutive segments, half of them carrying a confidence.
+    """
+    rng = random.Random(0)
+    items, start = [], 0.0
+    for index in range(segments):
+        items.append({
+            "text": f" segment {index} of the synthetic transcript",
+            "start": start,
+            "confidence": round(rng.uniform(0.6, 1.0), 4) if index % 2 else None,
+        })
+        start += rng.uniform(1.0, 4.0)
+    return {"language": "en", "segments": items}
+
+
+def median_seconds(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    """
+    Print the validated-versus-trusted normalization report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=20000, help="Segments in the synthetic transcript")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per path (median is reported)")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from pipeline.transcribers.normalize import format_timestamp, format_timestamps, normalize_transcript_v1
+
+    raw, adapter = make_raw(opts.segments), BenchAdapter()
+    starts = [segment["start"] for segment in raw["segments"]]
+    validated = normalize_transcript_v1(raw, adapter)
+    trusted = normalize_transcript_v1(raw, adapter, trusted=True)
+    assert trusted.transcript == validated.transcript, "trusted normalization differs"
+
+    rows = [
+        ("normalize", "validated", lambda: normalize_transcript_v1(raw, adapter)),
+        ("normalize", "trusted", lambda: normalize_transcript_v1(raw, adapter, trusted=True)),
+        ("timestamps", "per-item", lambda: [format_timestamp(start) for start in starts]),
+        ("timestamps", "numpy", lambda: format_timestamps(starts)),
+    ]
+    print(f"Synthetic transcript: {opts.segments} segments")
+    print(f"\n  {'step':<12}{'path':<11}{'median':>10}{'per segment':>14}{'speedup':>9}")
+    baseline = None
+    for step, path, fn in rows:
+        elapsed = median_seconds(fn, opts.runs)
+        if path in ("validated", "per-item"):
+            baseline = elapsed
+        print(f"  {step:<12}{path:<11}{elapsed * 1000:8.1f}ms{elapsed / opts.segments * 1e6:11.2f}us{baseline / elapsed:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+File: bench_startup.py
+
+Cold-start benchmark for the content-pipeline CLI.
+
+Reports the slowest imports of the CLI (parsed from `python -X importtime`) and the
+wall-clock time of each subcommand's `--help`, which is the floor every short-lived
+batch job pays before doing real work.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--top 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_PATH = os.path.join(REPO_ROOT, "main_cli.py")
+
+# Modules that must never be imported just to start the CLI
+HEAVY_MODULES = ("whisper", "torch", "moviepy", "yt_dlp")
+
+
+def import_time_report(args: List[str]) -> List[Tuple[int, str]]:
+    """
+    Run the CLI under `python -X importtime` and return (cumulative microseconds, module)
+    for every import, slowest first.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", CLI_PATH, *args],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        entries.append((int(cumulative_us), name))
+    entries.sort(reverse=True)
+    return entries
+
+
+def heavy_modules(entries: List[Tuple[int, str]]) -> List[str]:
+    """
+    Return the heavy top-level packages present in an import-time report.
+    """
+    loaded = {name.split(".")[0] for _, name in entries}
+    return [module for module in HEAVY_MODULES if module in loaded]
+
+
+def time_command(args: List[str], runs: int) -> float:
+    """
+    Return the median wall-clock seconds of running the CLI with the given arguments.
+    """
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, CLI_PATH, *args], cwd=REPO_ROOT, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    """
+    Print the import-time and per-subcommand wall-clock report.
+    Returns a non-zero exit code if a heavy module is imported at startup.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per subcommand (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to show")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from main_cli import LAZY_SUBCOMMANDS
+
+    entries = import_time_report(["--help"])
+    print("Slowest imports for `main_cli.py --help` (cumulative):")
+    for cumulative_us, name in entries[:opts.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    heavy = set(heavy_modules(entries))
+    print("\nWall-clock per subcommand (median of %d runs):" % opts.runs)
+    print(f"  {'--help':<24}{time_command(['--help'], opts.runs) * 1000:8.1f} ms")
+    for command in sorted(LAZY_SUBCOMMANDS):
+        elapsed = time_command([command, "--help"], opts.runs)
+        heavy.update(heavy_modules(import_time_report([command, "--help"])))
+        print(f"  {command + ' --help':<24}{elapsed * 1000:8.1f} ms")
+
+    if heavy:
+        print(f"\nHeavy modules imported at startup: {', '.join(sorted(heavy))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
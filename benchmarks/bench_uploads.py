@@ -0,0 +1,110 @@
+"""
+File: bench_uploads.py
+
+Object-storage upload benchmark for the content-pipeline project.
+
+Starts the S3-compatible stand-in used by the tests, with a simulated round trip per
+connection and per request and a per-connection bandwidth cap (object stores limit
+each connection well below a host's total bandwidth), and uploads two workloads: many small transcripts and a
+few large audio artifacts. Each is uploaded twice: sequentially with a new connection
+per request (what a naive client does), and through the UploadQueue CloudPersistence
+uses (pooled keep-alive connections, batched small puts, parallel multipart parts).
+Reports MB/s and objects/s for each mode.
+
+Usage:
+    python -m benchmarks.bench_uploads [--transcripts 200] [--artifacts 4] [--artifact-mb 24] [--latency-ms 2] [--connection-mbps 50]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_workload(transcripts: int, artifacts: int, artifact_mb: int):
+    """
+    Return {name: [(key, data)]} for the small-transcript and large-artifact workloads.
+    """
+    transcript = b'{"metadata": {"engine": "whisper"}, "transcript": [' + b", ".join(
+        b'{"timestamp": "00:00:%02d.000", "text": "benchmark segment text"}' % (n % 60) for n in range(40)
+    ) + b"]}"
+    artifact = os.urandom(1024 * 1024) * artifact_mb
+    return {
+        "transcripts": [(f"bench/{n:05d}.transcript.json", transcript) for n in range(transcripts)],
+        "artifacts": [(f"bench/{n:03d}.flac", artifact) for n in range(artifacts)],
+    }
+
+
+def upload_naive(server, items):
+    """
+    PUT each object in turn on a fresh connection. Returns elapsed seconds.
+    """
+    from pipeline.utils.object_storage import HTTPConnectionPool, ObjectStorageClient
+
+    client = ObjectStorageClient(s3_endpoint=server.endpoint, pool=HTTPConnectionPool(max_idle_per_host=0))
+    start = time.perf_counter()
+    for key, data in items:
+        client.put_object(f"s3://bucket/{key}", data)
+    return time.perf_counter() - start
+
+
+def upload_queued(server, items):
+    """
+    Upload through an UploadQueue. Returns elapsed seconds.
+    """
+    from pipeline.utils.object_storage import ObjectStorageClient
+    from pipeline.utils.uploads import UploadQueue
+
+    client = ObjectStorageClient(s3_endpoint=server.endpoint)
+    start = time.perf_counter()
+    with UploadQueue(client) as uploads:
+        for key, data in items:
+            uploads.put_bytes(data, f"s3://bucket/{key}")
+        uploads.flush()
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+def main() -> int:
+    """
+    Print the naive-versus-queued upload report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transcripts", type=int, default=200, help="Small transcript objects to upload")
+    parser.add_argument("--artifacts", type=int, default=4, help="Large artifacts to upload")
+    parser.add_argument("--artifact-mb", type=int, default=24, help="Size of each artifact in MiB")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated round trip per connection and request")
+    parser.add_argument("--connection-mbps", type=float, default=50.0, help="Upload bandwidth of each connection in MB/s")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from tests.conftest import start_s3_standin
+
+    logging.disable(logging.INFO)
+    server = start_s3_standin()
+    server.latency = opts.latency_ms / 1000
+    server.bandwidth = opts.connection_mbps * 1e6
+    workloads = make_workload(opts.transcripts, opts.artifacts, opts.artifact_mb)
+    print(
+        f"S3 stand-in at {server.endpoint}, {opts.latency_ms:g}ms simulated round trip, "
+        f"{opts.connection_mbps:g} MB/s per connection"
+    )
+    print(f"\n  {'workload':<13}{'mode':<8}{'seconds':>9}{'MB/s':>10}{'objects/s':>12}{'connections':>13}")
+    for name, items in workloads.items():
+        total_bytes = sum(len(data) for _, data in items)
+        for mode, upload in (("naive", upload_naive), ("queued", upload_queued)):
+            server.connections.clear()
+            elapsed = upload(server, items)
+            print(
+                f"  {name:<13}{mode:<8}{elapsed:9.2f}{total_bytes / 1e6 / elapsed:10.1f}"
+                f"{len(items) / elapsed:12.1f}{len(server.connections):13d}"
+            )
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
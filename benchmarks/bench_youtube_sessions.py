@@ -0,0 +1,130 @@
+"""
+File: bench_youtube_sessions.py
+
+Pooled yt_dlp session benchmark for the content-pipeline project.
+
+Serves the YouTube stand-in used by the extractor tests over HTTPS (self-signed
+certificate generated with openssl) and times a batch of metadata lookups and asr
+extractions twice: with a fresh YoutubeDL per video (a pool that keeps no idle sessions)
+and with the pooled sessions YouTubeExtractor uses by default. Reports the per-video
+time and TLS connections opened for each mode.
+
+Usage:
+    python -m benchmarks.bench_youtube_sessions [--videos 20]
+"""
+import argparse
+import logging
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_certificate(work_dir: str):
+    """
+    Write a self-signed certificate for 127.0.0.1 and return (cert path, key path).
+    """
+    openssl = shutil.which("openssl")
+    if not openssl:
+        raise RuntimeError("openssl is required to generate the benchmark certificate")
+    cert, key = os.path.join(work_dir, "cert.pem"), os.path.join(work_dir, "key.pem")
+    subprocess.run([
+        openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+        "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert
+    ], check=True, capture_output=True)
+    return cert, key
+
+
+def start_https_standin(work_dir: str) -> ThreadingHTTPServer:
+    """
+    Generate the stand-in media and serve it over HTTPS on an ephemeral port.
+    """
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+    from tests.pipeline.extractors.youtube.conftest import MEDIA_FILES, StandInHandler, StandInIE
+
+    media_dir = os.path.join(work_dir, "media")
+    os.makedirs(media_dir)
+    for name, output_args in MEDIA_FILES.items():
+        subprocess.run([
+            ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=2",
+            "-f", "lavfi", "-i", "sine=frequency=330:sample_rate=48000:duration=2",
+            *output_args, "-shortest", os.path.join(media_dir, name)
+        ], check=True)
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*make_certificate(work_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.media_dir = media_dir
+    server.base_url = f"https://127.0.0.1:{server.server_address[1]}"
+    server.requests = []
+    server.connections = set()
+    server.media_delay = 0
+    StandInIE.base_url = server.base_url
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_batch(server, pool, operation: str, videos: int, output_dir: str):
+    """
+    Return (seconds per video, connections opened) for one batch.
+    """
+    from pipeline.extractors.youtube.extractor import YouTubeExtractor
+
+    server.connections.clear()
+    extractor = YouTubeExtractor("asr", sessions=pool)
+    start = time.perf_counter()
+    for index in range(videos):
+        url = f"https://www.youtube.com/watch?v=bench{index:04d}"
+        if operation == "metadata":
+            extractor.extract_metadata(url)
+        else:
+            extractor.extract(url, os.path.join(output_dir, f"{operation}-{index}.mp3"))
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed / videos, len(server.connections)
+
+
+def main() -> int:
+    """
+    Print the fresh-versus-pooled session report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=20, help="Videos per batch")
+    opts = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from pipeline.extractors.youtube import extractor as extractor_module
+    from pipeline.extractors.youtube.sessions import YoutubeDLSessionPool
+    from tests.pipeline.extractors.youtube.conftest import StandInYoutubeDL
+
+    class BenchYoutubeDL(StandInYoutubeDL):
+        def __init__(self, params=None, auto_init=True):
+            super().__init__({**(params or {}), "quiet": True, "noprogress": True, "nocheckcertificate": True}, auto_init)
+
+    logging.disable(logging.INFO)
+    extractor_module.YoutubeDL = BenchYoutubeDL
+    with tempfile.TemporaryDirectory() as work_dir:
+        server = start_https_standin(work_dir)
+        print(f"HTTPS stand-in at {server.base_url}, {opts.videos} videos per batch")
+        print(f"\n  {'operation':<10}{'mode':<8}{'per video':>11}{'connections':>13}")
+        for operation in ("metadata", "extract"):
+            fresh, fresh_connections = run_batch(server, YoutubeDLSessionPool(max_idle_per_key=0), operation, opts.videos, work_dir)
+            pooled, pooled_connections = run_batch(server, YoutubeDLSessionPool(), operation, opts.videos, work_dir)
+            print(f"  {operation:<10}{'fresh':<8}{fresh * 1000:9.1f}ms{fresh_connections:13d}")
+            print(f"  {operation:<10}{'pooled':<8}{pooled * 1000:9.1f}ms{pooled_connections:13d}")
+            print(f"  {'':<10}{'saved':<8}{(fresh - pooled) * 1000:9.1f}ms")
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+File: cache.py
+
+Implements the `cache` subcommand group of the content-pipeline CLI.
+
+Reports hit-rate statistics for the transcript cache used by `transcribe --cache` and
+prunes it to a size budget.
+"""
+import click
+from cli.help_texts import CACHE_DIR_HELP, CACHE_PRUNE_MAX_MB_HELP
+
+
+@click.group()
+@click.option("--cache-dir", default=None, help=CACHE_DIR_HELP)
+@click.pass_context
+def cache(ctx, cache_dir):
+    """
+    Inspect and prune the transcript cache.
+    """
+    ctx.obj = cache_dir
+
+
+@cache.command()
+@click.pass_obj
+def stats(cache_dir):
+    """
+    Show cache size and hit/miss statistics.
+    """
+    from pipeline.transcribers.cache import TranscriptCache
+
+    store = TranscriptCache(cache_dir)
+    summary = store.stats()
+    print(f"Cache:    {store.cache_dir}")
+    print(f"Entries:  {summary.entries}")
+    print(f"Size:     {summary.size_bytes / 1024 / 1024:.1f} MB of {summary.max_bytes / 1024 / 1024:.1f} MB")
+    print(f"Hits:     {summary.hits}")
+    print(f"Misses:   {summary.misses}")
+    print(f"Hit rate: {summary.hit_rate:.1%}")
+
+
+@cache.command()
+@click.option("--max-mb", default=None, type=click.FloatRange(min=0), help=CACHE_PRUNE_MAX_MB_HELP)
+@click.pass_obj
+def prune(cache_dir, max_mb):
+    """
+    Evict least recently used transcripts until the cache fits its size budget.
+    """
+    from pipeline.transcribers.cache import TranscriptCache
+
+    max_bytes = int(max_mb * 1024 * 1024) if max_mb is not None else None
+    result = TranscriptCache(cache_dir).prune(max_bytes)
+    print(f"\n Done. Removed {result.removed} transcript(s), freed {result.freed_bytes / 1024 / 1024:.1f} MB.")
@@ -0,0 +1,49 @@
+"""
+File: expand.py
+
+Implements the `expand` subcommand of the content-pipeline CLI.
+
+Indexes a YouTube playlist or channel: lists its videos with flat extraction and writes
+each video's metadata to a JSON Lines file as concurrent, rate-limited lookups complete.
+"""
+import json
+import os
+import sys
+import time
+import click
+from cli.help_texts import EXPAND_SOURCE_HELP, EXPAND_OUTPUT_HELP, EXPAND_WORKERS_HELP, EXPAND_RATE_HELP
+
+
+@click.command()
+@click.option("--source", required=True, help=EXPAND_SOURCE_HELP)
+@click.option("--output", default="metadata.jsonl", help=EXPAND_OUTPUT_HELP)
+@click.option("--workers", default=4, show_default=True, type=click.IntRange(min=1), help=EXPAND_WORKERS_HELP)
+@click.option("--rate", default=5.0, show_default=True, type=click.FloatRange(min=0, min_open=True), help=EXPAND_RATE_HELP)
+def expand(source, output, workers, rate):
+    """
+    Index the metadata of every video in a playlist or channel.
+    """
+    from pipeline.extractors.youtube.collection import iter_collection_metadata
+
+    os.makedirs("output", exist_ok=True)
+    output_path = os.path.join("output", output)
+    failures = []
+
+    def report_failure(url, error):
+        failures.append(url)
+        print(f"[failed] {url}: {error}")
+
+    start = time.perf_counter()
+    indexed = 0
+    try:
+        with open(output_path, "w") as f:
+            for metadata in iter_collection_metadata(source, workers=workers, rate=rate, on_error=report_failure):
+                f.write(json.dumps(metadata) + "\n")
+                indexed += 1
+    except RuntimeError as e:
+        print(f"Error: Could not list {source}: {e}")
+        sys.exit(1)
+
+    print(f"\n Done. {indexed} indexed, {len(failures)} failed in {time.perf_counter() - start:.1f}s -> {output_path}")
+    if failures:
+        sys.exit(1)
@@ -0,0 +1,114 @@
+"""
+File: extract.py
+
+Implements the `extract` subcommand of the content-pipeline CLI.
+
+Stage modules (yt_dlp, moviepy) are imported inside the branch that needs them so that
+help output and unrelated source types stay cheap to start. Several sources (repeated
+--source, --source-list, --source-dir) and YouTube playlists or channels are extracted
+concurrently in bulk mode. The extraction index lets re-runs skip finished sources.
+Object-storage sources (s3://, gs://) are streamed into ffmpeg without a local copy.
+"""
+import os
+import sys
+import logging
+import click
+from pipeline.extractors.dispatch import classify_source
+from pipeline.extractors.profiles import DEFAULT_PROFILE, EXTRACTION_PROFILES
+from pipeline.extractors.runner import is_collection_url
+from cli.help_texts import (
+    EXTRACT_SOURCE_HELP,
+    EXTRACT_OUTPUT_HELP,
+    EXTRACT_SOURCE_LIST_HELP,
+    EXTRACT_SOURCE_DIR_HELP,
+    EXTRACT_WORKERS_HELP,
+    EXTRACT_PER_HOST_HELP,
+    EXTRACT_PROFILE_HELP,
+    EXTRACT_INDEX_HELP
+)
+
+
+@click.command()
+@click.option("--source", "sources", multiple=True, help=EXTRACT_SOURCE_HELP)
+@click.option("--source-list", default=None, type=click.File("r"), help=EXTRACT_SOURCE_LIST_HELP)
+@click.option("--source-dir", default=None, type=click.Path(exists=True, file_okay=False), help=EXTRACT_SOURCE_DIR_HELP)
+@click.option("--output", default="output.mp3", help=EXTRACT_OUTPUT_HELP)
+@click.option("--workers", default=4, show_default=True, type=click.IntRange(min=1), help=EXTRACT_WORKERS_HELP)
+@click.option("--per-host", default=2, show_default=True, type=click.IntRange(min=1), help=EXTRACT_PER_HOST_HELP)
+@click.option("--profile", default=DEFAULT_PROFILE, show_default=True, type=click.Choice(EXTRACTION_PROFILES), help=EXTRACT_PROFILE_HELP)
+@click.option("--index/--no-index", "use_index", default=True, show_default=True, help=EXTRACT_INDEX_HELP)
+def extract(sources, source_list, source_dir, output, workers, per_host, profile, use_index):
+    """
+    Extract audio from the source file and save it to the specified output path.
+    """
+    if not sources and source_list is None and not source_dir:
+        raise click.UsageError("Provide at least one --source, --source-list, or --source-dir.")
+
+    if len(sources) == 1 and source_list is None and not source_dir and not is_collection_url(sources[0]):
+        _extract_single(sources[0], output, profile, use_index)
+    else:
+        _extract_bulk(sources, source_list, source_dir, workers, per_host, profile, _open_index() if use_index else None)
+
+
+def _open_index():
+    """
+    Open the persistent extraction index at its default location.
+    """
+    from pipeline.extractors.index import ExtractionIndex
+    return ExtractionIndex()
+
+
+def _extract_single(source, output, profile, use_index=True):
+    """
+    Extract one source to output/<output> with its metadata alongside.
+    """
+    from pipeline.extractors.runner import extract_source
+
+    if classify_source(source) == "file_system" and not os.path.exists(source):
+        logging.error(f"Input file not found: {source}")
+        print("Error: Input file does not exist.")
+        sys.exit(1)
+
+    os.makedirs("output", exist_ok=True)
+    output_path = os.path.join("output", output)
+    try:
+        result = extract_source(source, output_path, profile, _open_index() if use_index else None)
+    except Exception as e:
+        logging.error(f"Failed to extract audio: {e}")
+        print("Warning: Audio extraction failed.")
+    else:
+        if result.metadata_path is None:
+            print("Warning: Could not save metadata.")
+
+    print("\n Done. You may continue using the terminal.")
+
+
+def _extract_bulk(sources, source_list, source_dir, workers, per_host, profile, index=None):
+    """
+    Extract many sources concurrently into output/ under unique per-source names.
+    """
+    from functools import partial
+    from itertools import chain
+    from pipeline.extractors.bulk import expand_collections, extract_many, iter_directory_sources, iter_stream_sources
+    from pipeline.extractors.runner import extract_source
+
+    all_sources = expand_collections(chain(
+        sources,
+        iter_stream_sources(source_list) if source_list is not None else (),
+        iter_directory_sources(source_dir) if source_dir else ()
+    ))
+
+    def report_progress(result):
+        if result.status == "ok":
+            print(f"[ok]     {result.source} -> {result.audio_path} ({result.seconds:.1f}s)")
+        else:
+            print(f"[failed] {result.source}: {result.error}")
+
+    report = extract_many(
+        all_sources, "output", workers=workers, per_host=per_host,
+        on_result=report_progress, extract_fn=partial(extract_source, profile=profile, index=index)
+    )
+
+    print(f"\n Done. {report.succeeded} extracted, {report.failed} failed in {report.elapsed:.1f}s.")
+    if report.failed:
+        sys.exit(1)
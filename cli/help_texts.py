@@ -6,23 +6,29 @@ Used across Click commands to ensure consistent contributor-facing descriptions.
 """
 
 EXTRACT_SOURCE_HELP = (
-    "Streaming platform URL (currently only YouTube) or a YouTube video file (.mp4) in the local file system. "
-    "Future support includes Vimeo, TikTok, and cloud-hosted video files."
+    "Streaming platform URL (currently only YouTube), a YouTube video file (.mp4) in the local file system, "
+    "or an object-storage URL (s3://, gs://), streamed with ranged reads; set CONTENT_PIPELINE_S3_ENDPOINT "
+    "for S3-compatible services. "
+    "Repeat --source to extract several sources concurrently. "
+    "Future support includes Vimeo and TikTok."
 )
 
 EXTRACT_OUTPUT_HELP = (
     "Base filename for extracted audio (.mp3) and its metadata (.json). "
+    "In bulk mode each source gets a unique name instead (video ID or file name plus hash). "
     "Currently saved to the local file system; future support includes cloud destinations."
 )
 
 TRANSCRIBE_SOURCE_HELP = (
     "Path to an audio file (.mp3) in the local file system. "
+    "Repeat --source to transcribe several files in one batch with a single model load. "
     "Future support includes cloud-hosted audio files."
 )
 
 TRANSCRIBE_OUTPUT_HELP = (
     "Base filename for transcript (.json) generated from audio. Uses TranscriptV1 schema. "
-    "Currently saved to the local file system; future support includes cloud destinations."
+    "Currently saved to the local file system; future support includes cloud destinations. "
+    "Single --source only; batch transcripts are named after each input."
 )
 
 TRANSCRIBE_LANGUAGE_HELP = (
@@ -30,3 +36,152 @@ TRANSCRIBE_LANGUAGE_HELP = (
     "Improves accuracy when language is known. If omitted, language will be auto-detected."
 )
 
+TRANSCRIBE_GLOB_HELP = (
+    "Glob pattern selecting audio files to transcribe as a batch (e.g., 'audio/**/*.mp3'). "
+    "Transcripts are saved as <audio name>.json in the output directory."
+)
+
+TRANSCRIBE_MANIFEST_HELP = (
+    "Manifest file listing audio files to transcribe as a batch: one path per line, "
+    "or JSONL objects with a 'path' key."
+)
+
+TRANSCRIBE_MODEL_HELP = (
+    "Whisper model variant to use (e.g., 'tiny', 'base', 'small'). Defaults to 'base'."
+)
+
+TRANSCRIBE_DAEMON_HELP = (
+    "Send jobs to a running `serve` daemon that keeps the model loaded. "
+    "Falls back to in-process transcription when no daemon is listening."
+)
+
+SOCKET_HELP = (
+    "Unix socket path of the transcription daemon. Defaults to $CONTENT_PIPELINE_SOCKET, "
+    "or a per-user socket in the runtime/temp directory."
+)
+
+SERVE_MODEL_HELP = (
+    "Whisper model variant to preload and keep resident. Repeat to serve several models; "
+    "other models are loaded on first request."
+)
+
+RUN_SOURCE_HELP = (
+    "Streaming platform URL or local video file to extract and transcribe. "
+    "Repeat --source to process several sources in one pipelined run."
+)
+
+SOURCE_LIST_HELP = (
+    "File listing sources, one per line ('#' comments allowed). Use '-' to read from stdin."
+)
+
+RUN_EXTRACT_WORKERS_HELP = (
+    "Number of concurrent extraction (download/decode) workers."
+)
+
+RUN_TRANSCRIBE_WORKERS_HELP = (
+    "Number of concurrent transcription workers. Each worker loads its own model."
+)
+
+RUN_QUEUE_SIZE_HELP = (
+    "Maximum number of items buffered between stages. A full queue pauses the upstream stage."
+)
+
+RUN_UPLOAD_TO_HELP = (
+    "Also upload each transcript and its audio to this object-storage prefix (s3://bucket/prefix, "
+    "gs://bucket/prefix or an https URL). Uploads run in the background and are awaited before exit."
+)
+
+EXTRACT_SOURCE_LIST_HELP = (
+    "File listing sources to extract in bulk, one per line ('#' comments allowed). "
+    "Use '-' to read sources from stdin."
+)
+
+EXTRACT_SOURCE_DIR_HELP = (
+    "Directory to walk for local video files (.mp4, .mkv, .mov, .webm, .avi, .m4v) to extract in bulk."
+)
+
+EXTRACT_WORKERS_HELP = (
+    "Maximum number of sources extracted concurrently in bulk mode."
+)
+
+EXTRACT_PER_HOST_HELP = (
+    "Maximum concurrent extractions against a single host (e.g. youtube.com) in bulk mode."
+)
+
+TRANSCRIBE_CHUNKED_HELP = (
+    "Split long audio at quiet points into windows and transcribe them in parallel worker processes. "
+    "A failed window is retried on its own."
+)
+
+TRANSCRIBE_WINDOW_HELP = (
+    "Target window length in seconds for --chunked transcription."
+)
+
+TRANSCRIBE_WORKERS_HELP = (
+    "Number of worker processes for --chunked transcription (each loads its own model). "
+    "Defaults to the number of CPU cores."
+)
+
+TRANSCRIBE_VAD_HELP = (
+    "Detect speech with an energy/zero-crossing voice-activity filter and transcribe only speech regions, "
+    "skipping silence and low-level music. Timestamps still refer to the original audio."
+)
+
+TRANSCRIPT_FORMAT_HELP = (
+    "Transcript encoding: formatted json, json-compact, jsonl (one segment per line), msgpack, "
+    "or a gzip (.gz) or zstd (.zst) compressed variant. Sets the output file extension; "
+    "readers detect the format automatically."
+)
+
+TRANSCRIBE_STREAM_HELP = (
+    "Write segments to a JSONL file (one segment per line, then a metadata footer) as each "
+    "30-second window is transcribed, instead of writing JSON once at the end."
+)
+
+TRANSCRIBE_CACHE_HELP = (
+    "Reuse transcripts from the local content-addressed cache, keyed by audio hash, engine, model, "
+    "language and output-affecting options. Location and size come from CONTENT_PIPELINE_CACHE_DIR "
+    "and CONTENT_PIPELINE_CACHE_MAX_MB."
+)
+
+CACHE_DIR_HELP = (
+    "Transcript cache directory. Defaults to CONTENT_PIPELINE_CACHE_DIR or ~/.cache/content-pipeline/transcripts."
+)
+
+CACHE_PRUNE_MAX_MB_HELP = (
+    "Size budget in MB to prune down to. Defaults to CONTENT_PIPELINE_CACHE_MAX_MB (512); 0 empties the cache."
+)
+
+EXTRACT_PROFILE_HELP = (
+    "Audio extraction profile: 'archive' re-encodes to MP3 for listening; 'copy' keeps the original "
+    "audio track without re-encoding; 'asr' is optimized for transcription (16 kHz mono FLAC for local "
+    "files, the smallest adequate audio-only stream for YouTube). 'copy' and 'asr' may change the output extension."
+)
+
+EXPAND_SOURCE_HELP = (
+    "YouTube playlist or channel URL (e.g. https://www.youtube.com/@handle or a playlist?list= URL). "
+    "Entries are listed with flat extraction, then each video's metadata is fetched concurrently."
+)
+
+EXPAND_OUTPUT_HELP = (
+    "Filename for the metadata index, saved under output/ as JSON Lines (one metadata object per video, "
+    "in completion order)."
+)
+
+EXPAND_WORKERS_HELP = "Maximum number of concurrent metadata requests."
+
+EXPAND_RATE_HELP = (
+    "Maximum metadata requests started per second across all workers (token bucket; short bursts up to --workers)."
+)
+
+EXTRACT_INDEX_HELP = (
+    "Record extractions in a persistent index (output/.extraction_index.sqlite, or CONTENT_PIPELINE_EXTRACTION_INDEX) "
+    "and skip sources whose audio is already at the requested location, without contacting the platform. "
+    "Playlist and channel URLs are expanded into videos, so re-runs only fetch new uploads."
+)
+
+INDEX_PATH_HELP = (
+    "Extraction index database. Defaults to CONTENT_PIPELINE_EXTRACTION_INDEX or output/.extraction_index.sqlite."
+)
+
+INDEX_VERIFY_DRY_RUN_HELP = "Report missing or changed files without removing their index entries."
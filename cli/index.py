@@ -0,0 +1,61 @@
+"""
+File: index.py
+
+Implements the `index` subcommand group of the content-pipeline CLI.
+
+Inspects the persistent extraction index used by `extract` and checks it against the
+filesystem, dropping entries whose audio was deleted or modified outside the pipeline.
+"""
+import sys
+import click
+from cli.help_texts import INDEX_PATH_HELP, INDEX_VERIFY_DRY_RUN_HELP
+
+
+@click.group()
+@click.option("--index-path", default=None, help=INDEX_PATH_HELP)
+@click.pass_context
+def index(ctx, index_path):
+    """
+    Inspect and verify the extraction index.
+    """
+    ctx.obj = index_path
+
+
+@index.command()
+@click.pass_obj
+def stats(index_path):
+    """
+    Show indexed extractions per profile.
+    """
+    from collections import Counter
+    from pipeline.extractors.index import ExtractionIndex
+
+    with ExtractionIndex(index_path) as store:
+        entries = store.entries()
+        print(f"Index:    {store.path}")
+    print(f"Entries:  {len(entries)}")
+    print(f"Size:     {sum(entry.size_bytes for entry in entries) / 1024 / 1024:.1f} MB")
+    for profile, count in sorted(Counter(entry.profile for entry in entries).items()):
+        print(f"  {profile:<8}{count}")
+
+
+@index.command()
+@click.option("--dry-run", is_flag=True, default=False, help=INDEX_VERIFY_DRY_RUN_HELP)
+@click.pass_obj
+def verify(index_path, dry_run):
+    """
+    Check every indexed audio file and drop entries that no longer match.
+    """
+    from pipeline.extractors.index import ExtractionIndex
+
+    with ExtractionIndex(index_path) as store:
+        report = store.verify(remove=not dry_run)
+    for path in report.missing:
+        print(f"[missing] {path}")
+    for path in report.changed:
+        print(f"[changed] {path}")
+
+    action = "found" if dry_run else "removed"
+    print(f"\n Done. Checked {report.checked} entries, {action} {report.removed} stale.")
+    if dry_run and report.removed:
+        sys.exit(1)
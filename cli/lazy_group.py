@@ -0,0 +1,50 @@
+"""
+File: lazy_group.py
+
+Lazy-loading Click group for the content-pipeline CLI.
+
+Subcommands are registered as dotted import paths and only imported when Click
+resolves them, so `--help` and short-lived invocations do not pay for modules
+(Whisper, torch, moviepy, yt_dlp) that the selected command never touches.
+"""
+import importlib
+from typing import Dict, List, Optional
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that resolves subcommands from "module.path:attribute" strings on demand.
+    """
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize the group with a mapping of command name to import path.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Return eagerly registered and lazy command names in sorted order.
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Return the named command, importing its module the first time it is requested.
+        """
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """
+        Import and cache the command object referenced by the lazy registry.
+        """
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' did not resolve to a click.Command")
+        self.commands[cmd_name] = command
+        del self.lazy_subcommands[cmd_name]
+        return command
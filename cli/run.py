@@ -0,0 +1,143 @@
+"""
+File: run.py
+
+Implements the `run` subcommand of the content-pipeline CLI.
+
+Extracts and transcribes many sources end to end, overlapping downloads with inference
+through a bounded producer/consumer pipeline. Transcripts are written behind by a
+background writer, so transcription workers move straight to the next source. With
+--upload-to, transcripts and audio are also queued for upload to object storage while
+the pipeline keeps running.
+"""
+import os
+import sys
+import logging
+import click
+from cli.help_texts import (
+    RUN_SOURCE_HELP,
+    SOURCE_LIST_HELP,
+    RUN_EXTRACT_WORKERS_HELP,
+    RUN_TRANSCRIBE_WORKERS_HELP,
+    RUN_QUEUE_SIZE_HELP,
+    RUN_UPLOAD_TO_HELP,
+    TRANSCRIPT_FORMAT_HELP,
+    TRANSCRIBE_LANGUAGE_HELP,
+    TRANSCRIBE_MODEL_HELP,
+    EXTRACT_PROFILE_HELP
+)
+from pipeline.extractors.profiles import DEFAULT_PROFILE, EXTRACTION_PROFILES
+from pipeline.transcribers.formats import DEFAULT_FORMAT, TRANSCRIPT_FORMAT_NAMES
+
+
+@click.command()
+@click.option("--source", "sources", multiple=True, help=RUN_SOURCE_HELP)
+@click.option("--source-list", default=None, type=click.File("r"), help=SOURCE_LIST_HELP)
+@click.option("--extract-workers", default=4, show_default=True, type=click.IntRange(min=1), help=RUN_EXTRACT_WORKERS_HELP)
+@click.option("--transcribe-workers", default=1, show_default=True, type=click.IntRange(min=1), help=RUN_TRANSCRIBE_WORKERS_HELP)
+@click.option("--queue-size", default=8, show_default=True, type=click.IntRange(min=1), help=RUN_QUEUE_SIZE_HELP)
+@click.option("--language", default=None, help=TRANSCRIBE_LANGUAGE_HELP)
+@click.option("--model", default="base", show_default=True, help=TRANSCRIBE_MODEL_HELP)
+@click.option("--profile", default=DEFAULT_PROFILE, show_default=True, type=click.Choice(EXTRACTION_PROFILES), help=EXTRACT_PROFILE_HELP)
+@click.option("--upload-to", default=None, help=RUN_UPLOAD_TO_HELP)
+@click.option("--format", "output_format", default=DEFAULT_FORMAT, show_default=True, type=click.Choice(TRANSCRIPT_FORMAT_NAMES), help=TRANSCRIPT_FORMAT_HELP)
+def run(sources, source_list, extract_workers, transcribe_workers, queue_size, language, model, profile, upload_to, output_format):
+    """
+    Extract and transcribe sources concurrently, saving artifacts under output/.
+    """
+    from pipeline.extractors.bulk import iter_stream_sources
+    from pipeline.extractors.runner import extract_source, output_stem_for, unique_sources
+    from pipeline.orchestration.streaming import StreamingPipeline
+    from pipeline.transcribers.formats import get_format
+    from pipeline.transcribers.persistence import PersistenceError, WriteBehindPersistence
+
+    all_sources = list(sources)
+    if source_list is not None:
+        all_sources.extend(iter_stream_sources(source_list))
+    all_sources = list(unique_sources(all_sources))
+    if not all_sources:
+        raise click.UsageError("Provide at least one --source or a --source-list.")
+
+    output_dir = "output"
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Shared by the transcribe workers; transcripts are written behind the next job
+    transcript_extension = get_format(output_format).extension
+    strategy = WriteBehindPersistence(format=output_format)
+    write_failed = False
+
+    cloud = None
+    if upload_to:
+        from pipeline.transcribers.persistence import CloudPersistence
+        cloud = CloudPersistence(format=output_format)
+        upload_prefix = upload_to.rstrip("/")
+
+    def extract_fn(source):
+        output_path = os.path.join(output_dir, output_stem_for(source) + ".mp3")
+        return extract_source(source, output_path, profile).audio_path
+
+    def transcriber_factory():
+        from pipeline.transcribers.adapters.registry import ModelRegistry
+        from pipeline.transcribers.adapters.whisper import WhisperAdapter
+        from pipeline.transcribers.normalize import normalize_transcript_v1
+
+        # A private registry gives each worker its own model, so workers transcribe in parallel
+        adapter = WhisperAdapter(model_name=model, registry=ModelRegistry())
+
+        def transcribe(source, audio_path):
+            raw_transcript = adapter.transcribe(audio_path, language=language)
+            transcript = normalize_transcript_v1(raw_transcript, adapter, trusted=True)
+            transcript_path = os.path.join(output_dir, output_stem_for(source) + ".transcript" + transcript_extension)
+            saved_path = strategy.persist(transcript, transcript_path)
+            if cloud is not None:
+                cloud.persist(transcript, f"{upload_prefix}/{os.path.basename(transcript_path)}")
+                cloud.persist_file(audio_path, f"{upload_prefix}/{os.path.basename(audio_path)}")
+            return saved_path
+
+        return transcribe
+
+    def report_progress(result):
+        if result.status == "ok":
+            print(f"[ok]     {result.source} -> {result.transcript_path} "
+                  f"(extract {result.extract_seconds:.1f}s, transcribe {result.transcribe_seconds:.1f}s)")
+        else:
+            print(f"[failed] {result.source} during {result.stage}: {result.error}")
+
+    logging.info(
+        f"Running pipeline on {len(all_sources)} source(s) with {extract_workers} extract "
+        f"and {transcribe_workers} transcribe worker(s)"
+    )
+    pipeline = StreamingPipeline(
+        extract_fn, transcriber_factory,
+        extract_workers=extract_workers,
+        transcribe_workers=transcribe_workers,
+        queue_size=queue_size,
+        on_result=report_progress
+    )
+    try:
+        report = pipeline.run(all_sources)
+    finally:
+        try:
+            strategy.close()
+        except PersistenceError as e:
+            print(f"[failed] {e}")
+            write_failed = True
+
+    upload_failed = False
+    if cloud is not None:
+        from pipeline.utils.uploads import UploadError
+        try:
+            stats = cloud.close()
+            print(
+                f"[upload] {stats.objects} object(s), {stats.bytes / 1e6:.1f} MB to {upload_to} "
+                f"at {stats.megabytes_per_second:.1f} MB/s, {stats.objects_per_second:.1f} objects/s"
+            )
+        except UploadError as e:
+            print(f"[failed] upload to {upload_to}: {e}")
+            upload_failed = True
+
+    print(
+        f"\n Done. {report.succeeded} completed, {report.failed} failed in {report.elapsed:.1f}s "
+        f"(stage time: extract {report.extract_seconds:.1f}s, transcribe {report.transcribe_seconds:.1f}s)."
+    )
+    if report.failed or write_failed or upload_failed:
+        sys.exit(1)
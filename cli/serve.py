@@ -0,0 +1,22 @@
+"""
+File: serve.py
+
+Implements the `serve` subcommand of the content-pipeline CLI.
+
+Runs the warm-model transcription daemon in the foreground; `transcribe --daemon`
+submits jobs to it over a Unix domain socket.
+"""
+import click
+from cli.help_texts import SOCKET_HELP, SERVE_MODEL_HELP
+
+
+@click.command()
+@click.option("--socket", "socket_path", default=None, help=SOCKET_HELP)
+@click.option("--model", "models", multiple=True, default=("base",), show_default=True, help=SERVE_MODEL_HELP)
+def serve(socket_path, models):
+    """
+    Keep Whisper models loaded and serve transcription jobs over a Unix socket.
+    """
+    from pipeline.transcribers.daemon import serve as run_daemon
+
+    run_daemon(socket_path, models)
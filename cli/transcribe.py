@@ -0,0 +1,255 @@
+"""
+File: transcribe.py
+
+Implements the `transcribe` subcommand of the content-pipeline CLI.
+
+The Whisper adapter (and with it torch) is imported only once the command runs.
+Several inputs (repeated --source, --glob, --manifest) are transcribed as one batch
+that loads the model a single time; --daemon hands jobs to a resident `serve` process.
+"""
+import os
+import sys
+import logging
+import click
+from cli.help_texts import (
+    TRANSCRIBE_SOURCE_HELP,
+    TRANSCRIBE_OUTPUT_HELP,
+    TRANSCRIBE_LANGUAGE_HELP,
+    TRANSCRIBE_GLOB_HELP,
+    TRANSCRIBE_MANIFEST_HELP,
+    TRANSCRIBE_MODEL_HELP,
+    TRANSCRIBE_DAEMON_HELP,
+    SOCKET_HELP,
+    TRANSCRIBE_CHUNKED_HELP,
+    TRANSCRIBE_WINDOW_HELP,
+    TRANSCRIBE_WORKERS_HELP,
+    TRANSCRIBE_VAD_HELP,
+    TRANSCRIBE_STREAM_HELP,
+    TRANSCRIPT_FORMAT_HELP,
+    TRANSCRIBE_CACHE_HELP
+)
+from pipeline.transcribers.formats import TRANSCRIPT_FORMAT_NAMES
+
+
+@click.command()
+@click.option("--source", "sources", multiple=True, help=TRANSCRIBE_SOURCE_HELP)
+@click.option("--glob", "pattern", default=None, help=TRANSCRIBE_GLOB_HELP)
+@click.option("--manifest", default=None, type=click.Path(exists=True, dir_okay=False), help=TRANSCRIBE_MANIFEST_HELP)
+@click.option("--output", default="transcript.json", help=TRANSCRIBE_OUTPUT_HELP)
+@click.option("--language", default=None, help=TRANSCRIBE_LANGUAGE_HELP)
+@click.option("--model", default="base", show_default=True, help=TRANSCRIBE_MODEL_HELP)
+@click.option("--daemon", is_flag=True, default=False, help=TRANSCRIBE_DAEMON_HELP)
+@click.option("--socket", "socket_path", default=None, help=SOCKET_HELP)
+@click.option("--chunked", is_flag=True, default=False, help=TRANSCRIBE_CHUNKED_HELP)
+@click.option("--window-seconds", default=300.0, show_default=True, type=click.FloatRange(min=30.0), help=TRANSCRIBE_WINDOW_HELP)
+@click.option("--workers", default=None, type=click.IntRange(min=1), help=TRANSCRIBE_WORKERS_HELP)
+@click.option("--vad", is_flag=True, default=False, help=TRANSCRIBE_VAD_HELP)
+@click.option("--stream", is_flag=True, default=False, help=TRANSCRIBE_STREAM_HELP)
+@click.option("--cache", "use_cache", is_flag=True, default=False, help=TRANSCRIBE_CACHE_HELP)
+@click.option("--format", "output_format", default=None, type=click.Choice(TRANSCRIPT_FORMAT_NAMES), help=TRANSCRIPT_FORMAT_HELP)
+def transcribe(sources, pattern, manifest, output, language, model, daemon, socket_path, chunked, window_seconds, workers, vad, stream, use_cache, output_format):
+    """
+    Extract audio from the source, run transcription, and save the normalized transcript.
+    """
+    if not sources and not pattern and not manifest:
+        raise click.UsageError("Provide at least one --source, --glob, or --manifest.")
+    if daemon and chunked:
+        raise click.UsageError("--daemon and --chunked cannot be combined.")
+    if vad and (daemon or chunked):
+        raise click.UsageError("--vad cannot be combined with --daemon or --chunked.")
+    is_single = len(sources) == 1 and not pattern and not manifest
+    if stream and (daemon or chunked or vad or not is_single):
+        raise click.UsageError("--stream requires a single --source and cannot be combined with --daemon, --chunked or --vad.")
+    if stream and use_cache:
+        raise click.UsageError("--stream cannot be combined with --cache.")
+    if stream and output_format not in (None, "jsonl"):
+        raise click.UsageError("--stream always writes jsonl; it cannot be combined with another --format.")
+    # Batch outputs are named after each source; an explicit --output would be ignored
+    output_source = click.get_current_context().get_parameter_source("output")
+    if not is_single and output_source is not click.core.ParameterSource.DEFAULT:
+        raise click.UsageError("--output applies to a single --source; batch transcripts are written to output/ named after each input.")
+
+    # Options that change the transcript are part of the cache key; None disables the cache
+    cache_options = None
+    if use_cache:
+        cache_options = "vad" if vad else f"chunked:{window_seconds:g}" if chunked else ""
+
+    def adapter_factory():
+        if chunked:
+            from pipeline.transcribers.chunking import ChunkedTranscriber
+            return ChunkedTranscriber(model, workers=workers, window_seconds=window_seconds)
+        from pipeline.transcribers.adapters.whisper import WhisperAdapter
+        if vad:
+            from pipeline.transcribers.vad import VadTranscriber
+            return VadTranscriber(WhisperAdapter(model_name=model))
+        return WhisperAdapter(model_name=model)
+
+    if stream:
+        _transcribe_stream(sources[0], output, language, model)
+    elif is_single:
+        _transcribe_single(sources[0], output, language, adapter_factory, daemon, model, socket_path, cache_options, output_format)
+    else:
+        _transcribe_batch(sources, pattern, manifest, language, adapter_factory, daemon, model, socket_path, cache_options, output_format)
+
+
+def _transcribe_single(source, output, language, adapter_factory, daemon, model, socket_path, cache_options, output_format):
+    """
+    Transcribe one audio file and save it under output/<output>, with the extension of
+    output_format when one is given.
+    """
+    # Validate source file
+    if not os.path.exists(source):
+        logging.error(f"Audio file not found: {source}")
+        print("Error: Audio file does not exist.")
+        sys.exit(1)
+
+    from pipeline.transcribers.formats import DEFAULT_FORMAT, with_format_extension
+    from pipeline.transcribers.persistence import LocalFilePersistence
+
+    # Prepare output paths
+    os.makedirs("output", exist_ok=True)
+    output_path = os.path.join("output", output)
+    if output_format is not None:
+        output_path = with_format_extension(output_path, output_format)
+
+    # Run transcription
+    if daemon:
+        from pipeline.transcribers.daemon import DaemonFallbackTranscriber
+        transcribe_fn = DaemonFallbackTranscriber(model, socket_path)
+    else:
+        def transcribe_fn(path, lang):
+            from pipeline.transcribers.normalize import normalize_transcript_v1
+
+            adapter = adapter_factory()
+            try:
+                raw_transcript = adapter.transcribe(path, language=lang)
+            finally:
+                _close_adapter(adapter)
+            if "vad" in raw_transcript:
+                vad_stats = raw_transcript["vad"]
+                print(f"VAD skipped {vad_stats['skipped_seconds']:.1f}s of {vad_stats['total_seconds']:.1f}s of audio.")
+            return normalize_transcript_v1(raw_transcript, adapter, trusted=True)
+
+    if cache_options is not None:
+        transcribe_fn = _cached(transcribe_fn, model, cache_options)
+    transcript = transcribe_fn(source, language)
+
+    # Save transcript
+    try:
+        strategy = LocalFilePersistence(output_format or DEFAULT_FORMAT)
+        strategy.persist(transcript, output_path)
+        logging.info(f"Transcript saved to: {output_path}")
+    except Exception as e:
+        logging.error(f"Failed to save transcript: {e}")
+        print("Warning: Could not save transcript.")
+
+    print("\n Done. Transcript generated.")
+
+
+def _transcribe_stream(source, output, language, model):
+    """
+    Transcribe one audio file window by window, appending segments to output/<output>.jsonl.
+    """
+    if not os.path.exists(source):
+        logging.error(f"Audio file not found: {source}")
+        print("Error: Audio file does not exist.")
+        sys.exit(1)
+
+    from pipeline.transcribers.adapters.whisper import WhisperAdapter
+    from pipeline.transcribers.streaming import transcribe_to_jsonl
+
+    os.makedirs("output", exist_ok=True)
+    stem, ext = os.path.splitext(output)
+    output_path = os.path.join("output", f"{stem}.jsonl" if ext == ".json" else output)
+
+    saved_path = transcribe_to_jsonl(WhisperAdapter(model_name=model), source, output_path, language=language)
+    logging.info(f"Transcript saved to: {saved_path}")
+    print("\n Done. Transcript generated.")
+
+
+def _transcribe_batch(sources, pattern, manifest, language, adapter_factory, daemon, model, socket_path, cache_options, output_format):
+    """
+    Transcribe every resolved input with one loaded model, saving output/<audio name>.json
+    (or the extension of output_format).
+    """
+    from pipeline.transcribers.batch import resolve_audio_sources, transcribe_batch
+    from pipeline.transcribers.formats import DEFAULT_FORMAT, get_format
+    from pipeline.transcribers.persistence import PersistenceError, WriteBehindPersistence
+
+    paths = resolve_audio_sources(sources, pattern=pattern, manifest=manifest)
+    if not paths:
+        logging.error("No audio files matched the batch inputs.")
+        print("Error: No audio files to transcribe.")
+        sys.exit(1)
+
+    logging.info(f"Transcribing batch of {len(paths)} file(s)")
+    adapter = transcribe_fn = None
+    if daemon:
+        from pipeline.transcribers.daemon import DaemonFallbackTranscriber
+        transcribe_fn = DaemonFallbackTranscriber(model, socket_path)
+    elif cache_options is None:
+        adapter = adapter_factory()
+    else:
+        from pipeline.transcribers.normalize import normalize_transcript_v1
+
+        # Load the model only once a file misses the cache
+        def transcribe_fn(path, lang):
+            nonlocal adapter
+            if adapter is None:
+                adapter = adapter_factory()
+            return normalize_transcript_v1(adapter.transcribe(path, language=lang), adapter, trusted=True)
+
+    if cache_options is not None:
+        transcribe_fn = _cached(transcribe_fn, model, cache_options)
+
+    def report_progress(result):
+        if result.status == "ok":
+            print(f"[ok]     {result.source} -> {result.output_path} ({result.seconds:.1f}s)")
+        else:
+            print(f"[failed] {result.source}: {result.error}")
+
+    # Transcripts are written behind the next file's transcription
+    transcript_format = get_format(output_format or DEFAULT_FORMAT)
+    strategy = WriteBehindPersistence(format=transcript_format.name)
+    write_failed = False
+    try:
+        report = transcribe_batch(
+            adapter, paths, "output", language=language, strategy=strategy,
+            on_result=report_progress, transcribe_fn=transcribe_fn,
+            extension=transcript_format.extension
+        )
+    finally:
+        _close_adapter(adapter)
+        try:
+            strategy.close()
+        except PersistenceError as e:
+            print(f"[failed] {e}")
+            write_failed = True
+
+    print(
+        f"\n Done. {report.succeeded} transcribed, {report.failed} failed "
+        f"in {report.elapsed:.1f}s ({report.files_per_hour:.1f} files/hour)."
+    )
+    if cache_options is not None:
+        print(f" Cache: {transcribe_fn.hits} hit(s), {transcribe_fn.misses} miss(es).")
+    if hasattr(adapter, "skipped_seconds"):
+        print(f" VAD skipped {adapter.skipped_seconds:.1f}s of {adapter.total_seconds:.1f}s of audio.")
+    if report.failed or write_failed:
+        sys.exit(1)
+
+
+def _cached(transcribe_fn, model, cache_options):
+    """
+    Wrap a transcribe function with the content-addressed transcript cache.
+    """
+    from pipeline.transcribers.cache import CachedTranscriber
+    return CachedTranscriber(transcribe_fn, ("whisper", model), options=cache_options)
+
+
+def _close_adapter(adapter):
+    """
+    Release adapter resources (e.g. the chunked worker pool) when supported.
+    """
+    close = getattr(adapter, "close", None)
+    if close:
+        close()
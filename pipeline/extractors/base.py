@@ -2,9 +2,19 @@
 File: base.py
 
 Defines the extractor interface for audio and metadata operations in the content-pipeline project.
+
+BaseExtractor is the synchronous interface used by the CLI. AsyncBaseExtractor is its
+asyncio counterpart, so one event loop can drive many concurrent extractions;
+SyncExtractorFacade exposes an async extractor through the synchronous interface.
 """
+import asyncio
 from abc import ABC, abstractmethod
 
+class ExtractionCancelled(Exception):
+    """
+    Raised inside an extraction that was cancelled or timed out before it finished.
+    """
+
 class BaseExtractor(ABC):
     """
     Abstract interface for platform-specific extractors.
@@ -27,3 +37,44 @@ class BaseExtractor(ABC):
         """
         pass
 
+class AsyncBaseExtractor(ABC):
+    """
+    Abstract asyncio interface for platform-specific extractors.
+
+    Implementations must not block the event loop: blocking work runs as an asyncio
+    subprocess or in a bounded executor. Cancelling the awaiting task (or hitting the
+    extractor's timeout) stops the underlying download or process.
+    """
+    @abstractmethod
+    async def extract_audio(self, source: str, output_path: str) -> str:
+        """
+        Extract audio from a media source and return the path written.
+        """
+        pass
+
+    @abstractmethod
+    async def extract_metadata(self, source: str) -> dict:
+        """
+        Return structured metadata for a media source.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Release executors or other resources held by the extractor.
+        """
+
+class SyncExtractorFacade(BaseExtractor):
+    """
+    Synchronous BaseExtractor backed by an AsyncBaseExtractor.
+
+    Each call runs on its own event loop, so it must not be used from inside a running loop.
+    """
+    def __init__(self, extractor: AsyncBaseExtractor):
+        self.extractor = extractor
+
+    def extract_audio(self, source: str, output_path: str) -> str:
+        return asyncio.run(self.extractor.extract_audio(source, output_path))
+
+    def extract_metadata(self, source: str) -> dict:
+        return asyncio.run(self.extractor.extract_metadata(source))
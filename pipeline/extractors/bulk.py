@@ -0,0 +1,211 @@
+"""
+File: bulk.py
+
+Concurrent bulk extraction for the content-pipeline project.
+
+Collects sources from lists, directories, or stdin and extracts them with a bounded
+thread pool. Each source is routed through runner.extract_source() (and therefore
+classify_source()), written under a unique per-source name, and throttled by a
+per-host concurrency limit so a single platform is never hit by the whole pool.
+Playlist and channel URLs are expanded into their videos before extraction.
+
+Sources are read lazily: only `workers` extractions are in flight, and a source starts
+only once its host has a free slot. Sources waiting on a busy host are set aside (up to
+a small bound) so other hosts keep the pool busy instead of queueing behind them.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Literal, Optional
+from urllib.parse import urlparse
+from pipeline.extractors.dispatch import classify_source, host_in_domain, STREAMING_DOMAINS, STORAGE_DOMAINS, STORAGE_SCHEMES
+from pipeline.extractors.runner import extract_source, is_collection_url, output_stem_for, unique_sources
+
+# Local video containers picked up by directory walks
+VIDEO_EXTENSIONS = {".mp4", ".mkv", ".mov", ".webm", ".avi", ".m4v"}
+
+# Hostnames that share a rate limit with another domain
+HOST_ALIASES = {"youtu.be": "youtube.com"}
+
+@dataclass
+class BulkItemResult:
+    """
+    Outcome of extracting one source in a bulk run.
+    """
+    source: str
+    status: Literal["ok", "failed"]
+    audio_path: Optional[str] = None
+    metadata_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+@dataclass
+class BulkReport:
+    """
+    Aggregated results for a bulk extraction run.
+    """
+    results: List[BulkItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.status == "ok")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.status == "failed")
+
+def iter_directory_sources(directory: str, extensions: Iterable[str] = VIDEO_EXTENSIONS) -> Iterator[str]:
+    """
+    Walk a directory tree and yield video files in sorted order.
+    """
+    extensions = {ext.lower() for ext in extensions}
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in extensions:
+                yield os.path.join(root, name)
+
+def iter_stream_sources(stream) -> Iterator[str]:
+    """
+    Yield sources from an open text stream (e.g. stdin), skipping blanks and '#' comments.
+    """
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+def expand_collections(sources: Iterable[str]) -> Iterator[str]:
+    """
+    Yield sources, replacing YouTube playlist and channel URLs with their video URLs.
+    """
+    for source in sources:
+        if is_collection_url(source):
+            from pipeline.extractors.youtube.extractor import YouTubeExtractor
+            yield from YouTubeExtractor().expand(source)
+        else:
+            yield source
+
+def host_key(source: str) -> Optional[str]:
+    """
+    Return the host group a source counts against, or None for local files.
+    """
+    if classify_source(source) == "file_system":
+        return None
+    parsed = urlparse(source)
+    netloc = parsed.netloc.lower()
+    if parsed.scheme in STORAGE_SCHEMES:
+        return f"{parsed.scheme}://{netloc}"
+    hostname = parsed.hostname or netloc
+    for domain in STREAMING_DOMAINS | STORAGE_DOMAINS:
+        if host_in_domain(hostname, domain):
+            return HOST_ALIASES.get(domain, domain)
+    return hostname
+
+class HostLimiter:
+    """
+    Per-host concurrency limiter backed by one semaphore per host group.
+    """
+    def __init__(self, per_host: int):
+        if per_host < 1:
+            raise ValueError("per_host must be at least 1")
+        self.per_host = per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+    def try_acquire(self, host: str) -> bool:
+        """
+        Take a slot for host without blocking; returns False if the host is saturated.
+        """
+        return self._semaphore(host).acquire(blocking=False)
+
+    def release(self, host: str) -> None:
+        """
+        Return a slot taken with try_acquire().
+        """
+        self._semaphore(host).release()
+
+def extract_many(
+    sources: Iterable[str],
+    output_dir: str,
+    workers: int = 4,
+    per_host: int = 2,
+    on_result: Optional[Callable[[BulkItemResult], None]] = None,
+    extract_fn: Callable = extract_source
+) -> BulkReport:
+    """
+    Extract every source concurrently into output_dir using unique per-source names.
+
+    Failures are recorded per source and do not stop the run. `on_result` is called
+    from the submitting thread as each source completes.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    limiter = HostLimiter(per_host)
+    report = BulkReport()
+    start = time.perf_counter()
+    remaining = iter(unique_sources(sources))
+    # Sources whose host was saturated when they came up, in arrival order per host
+    waiting: Dict[str, Deque[str]] = {}
+    max_waiting = 4 * workers
+
+    def extract_one(source: str, host: Optional[str]) -> BulkItemResult:
+        item_start = time.perf_counter()
+        output_path = os.path.join(output_dir, output_stem_for(source) + ".mp3")
+        try:
+            extracted = extract_fn(source, output_path)
+            result = BulkItemResult(source, "ok", extracted.audio_path, extracted.metadata_path)
+        except Exception as e:
+            logging.error(f"[extract_many] Extraction failed for {source}: {e}")
+            result = BulkItemResult(source, "failed", error=str(e))
+        finally:
+            if host is not None:
+                limiter.release(host)
+        result.seconds = time.perf_counter() - item_start
+        return result
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract")
+    pending: Dict[Future, str] = {}
+    try:
+        while True:
+            # Start waiting sources whose host freed a slot, then read new ones
+            for host in list(waiting):
+                queued = waiting[host]
+                while queued and len(pending) < workers and limiter.try_acquire(host):
+                    source = queued.popleft()
+                    pending[pool.submit(extract_one, source, host)] = source
+                if not queued:
+                    del waiting[host]
+            while len(pending) < workers and sum(map(len, waiting.values())) < max_waiting:
+                source = next(remaining, None)
+                if source is None:
+                    break
+                host = host_key(source)
+                if host is None or limiter.try_acquire(host):
+                    pending[pool.submit(extract_one, source, host)] = source
+                else:
+                    waiting.setdefault(host, deque()).append(source)
+            # With nothing in flight every host slot is free, so nothing is left waiting
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                result = future.result()
+                report.results.append(result)
+                if on_result:
+                    on_result(result)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -40,6 +40,12 @@ STORAGE_DOMAINS = {
     "icloud.com"
 }
 
+def host_in_domain(hostname: str, domain: str) -> bool:
+    """
+    Return whether hostname is domain itself or one of its subdomains.
+    """
+    return hostname == domain or hostname.endswith("." + domain)
+
 # Step 3: Dispatch logic
 def classify_source(source: str) -> Literal["streaming", "storage", "file_system"]:
     """
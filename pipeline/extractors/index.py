@@ -0,0 +1,240 @@
+"""
+File: index.py
+
+Persistent extraction index for the content-pipeline project.
+
+A SQLite database (by default output/.extraction_index.sqlite) records every extracted
+source under a stable key - "youtube:<video id>" for YouTube, "sha256:<content hash>"
+for local files - together with the profile, audio path, metadata JSON path, audio format
+and size. Extractors consult it before touching the network or running ffmpeg, so
+re-running `extract` over a channel only downloads new uploads.
+
+Entries are verified against the filesystem when they are looked up (and in bulk by
+verify()): an entry whose audio file was deleted or changed size is dropped and the
+source is extracted again. Local file hashes are memoized by (path, size, mtime) so
+unchanged videos are not re-read on every run.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+INDEX_PATH_ENV_VAR = "CONTENT_PIPELINE_EXTRACTION_INDEX"
+DEFAULT_INDEX_FILE = ".extraction_index.sqlite"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    key TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    source TEXT NOT NULL,
+    channel_id TEXT,
+    audio_path TEXT NOT NULL,
+    metadata_path TEXT,
+    metadata_json TEXT,
+    format TEXT,
+    size_bytes INTEGER NOT NULL,
+    extracted_at REAL NOT NULL,
+    PRIMARY KEY (key, profile)
+);
+CREATE INDEX IF NOT EXISTS extractions_channel ON extractions (channel_id);
+CREATE TABLE IF NOT EXISTS file_digests (
+    path TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+@dataclass
+class IndexEntry:
+    """
+    One extracted source as recorded in the index.
+    """
+    key: str
+    profile: str
+    source: str
+    audio_path: str
+    size_bytes: int
+    format: Optional[str] = None
+    metadata_path: Optional[str] = None
+    metadata: Optional[dict] = None
+    channel_id: Optional[str] = None
+    extracted_at: float = 0.0
+
+    def matches_output(self, output_path: str) -> bool:
+        """
+        Return whether the indexed audio is the artifact for output_path (any extension).
+        """
+        requested = Path(output_path)
+        if requested.suffix == ".mp3":
+            requested = requested.with_suffix("")
+        return Path(self.audio_path).with_suffix("") == requested
+
+@dataclass
+class VerifyReport:
+    """
+    Result of checking every index entry against the filesystem.
+    """
+    checked: int = 0
+    missing: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    @property
+    def removed(self) -> int:
+        return len(self.missing) + len(self.changed)
+
+def default_index_path(output_dir: str = "output") -> str:
+    """
+    Return the index path from the environment, or the default inside output_dir.
+    """
+    return os.environ.get(INDEX_PATH_ENV_VAR) or os.path.join(output_dir, DEFAULT_INDEX_FILE)
+
+class ExtractionIndex:
+    """
+    Thread-safe SQLite index of extracted sources.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_index_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _entry(row: tuple) -> IndexEntry:
+        key, profile, source, channel_id, audio_path, metadata_path, metadata_json, fmt, size_bytes, extracted_at = row
+        return IndexEntry(
+            key=key, profile=profile, source=source, audio_path=audio_path, size_bytes=size_bytes,
+            format=fmt, metadata_path=metadata_path, metadata=json.loads(metadata_json) if metadata_json else None,
+            channel_id=channel_id, extracted_at=extracted_at
+        )
+
+    @staticmethod
+    def _problem(entry: IndexEntry) -> Optional[str]:
+        """
+        Return "missing" or "changed" if the entry's audio file no longer matches, else None.
+        """
+        try:
+            size = os.path.getsize(entry.audio_path)
+        except OSError:
+            return "missing"
+        return "changed" if size != entry.size_bytes else None
+
+    def lookup(self, key: str, profile: str) -> Optional[IndexEntry]:
+        """
+        Return the entry for (key, profile) if its audio file is still intact.
+
+        Entries whose file was deleted or changed behind the index's back are removed.
+        """
+        rows = self._query("SELECT * FROM extractions WHERE key = ? AND profile = ?", (key, profile))
+        if not rows:
+            return None
+        entry = self._entry(rows[0])
+        problem = self._problem(entry)
+        if problem:
+            logging.info(f"[index] Dropping {key} ({profile}): audio {problem} at {entry.audio_path}")
+            self.remove(key, profile)
+            return None
+        return entry
+
+    def record(
+        self,
+        key: str,
+        profile: str,
+        source: str,
+        audio_path: str,
+        metadata_path: Optional[str] = None,
+        metadata: Optional[dict] = None
+    ) -> IndexEntry:
+        """
+        Insert or replace the entry for (key, profile) from a finished extraction.
+        """
+        entry = IndexEntry(
+            key=key, profile=profile, source=source, audio_path=audio_path,
+            size_bytes=os.path.getsize(audio_path),
+            format=Path(audio_path).suffix.lstrip(".") or None,
+            metadata_path=metadata_path, metadata=metadata,
+            channel_id=((metadata or {}).get("service_metadata") or {}).get("channel_id"),
+            extracted_at=time.time()
+        )
+        self._query(
+            "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (entry.key, entry.profile, entry.source, entry.channel_id, entry.audio_path, entry.metadata_path,
+             json.dumps(metadata) if metadata is not None else None, entry.format, entry.size_bytes, entry.extracted_at)
+        )
+        return entry
+
+    def set_metadata_path(self, key: str, profile: str, metadata_path: str) -> None:
+        self._query("UPDATE extractions SET metadata_path = ? WHERE key = ? AND profile = ?", (metadata_path, key, profile))
+
+    def remove(self, key: str, profile: str) -> None:
+        self._query("DELETE FROM extractions WHERE key = ? AND profile = ?", (key, profile))
+
+    def entries(self, channel_id: Optional[str] = None) -> List[IndexEntry]:
+        """
+        Return all entries, or those of one channel, oldest first.
+        """
+        if channel_id is None:
+            rows = self._query("SELECT * FROM extractions ORDER BY extracted_at")
+        else:
+            rows = self._query("SELECT * FROM extractions WHERE channel_id = ? ORDER BY extracted_at", (channel_id,))
+        return [self._entry(row) for row in rows]
+
+    def verify(self, remove: bool = True) -> VerifyReport:
+        """
+        Check every entry's audio file, dropping missing or changed ones unless remove is False.
+        """
+        report = VerifyReport()
+        for entry in self.entries():
+            report.checked += 1
+            problem = self._problem(entry)
+            if problem:
+                getattr(report, problem).append(entry.audio_path)
+                if remove:
+                    self.remove(entry.key, entry.profile)
+        return report
+
+    def file_key(self, path: str) -> str:
+        """
+        Return "sha256:<digest>" for a local file, reusing the stored digest when unchanged.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        rows = self._query(
+            "SELECT digest FROM file_digests WHERE path = ? AND size_bytes = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)
+        )
+        if rows:
+            return f"sha256:{rows[0][0]}"
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        self._query(
+            "INSERT OR REPLACE INTO file_digests VALUES (?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        )
+        return f"sha256:{digest.hexdigest()}"
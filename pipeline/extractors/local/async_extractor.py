@@ -0,0 +1,74 @@
+"""
+File: async_extractor.py
+
+Asyncio extractor for file-system sources in the content-pipeline project.
+
+The copy and asr profiles run ffmpeg as asyncio subprocesses, at most `max_processes`
+at a time, so one event loop can queue any number of files without a thread per file.
+Cancelling the awaiting task, or exceeding `timeout`, kills ffmpeg and removes the
+partial output. The archive profile still uses moviepy, which runs in a bounded thread
+pool and cannot be interrupted once started.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from pipeline.extractors.base import AsyncBaseExtractor
+from pipeline.extractors.local.ffmpeg_audio import extract_audio_fast_async
+from pipeline.extractors.profiles import DEFAULT_PROFILE, ExtractionProfile
+from pipeline.extractors.schema.metadata import build_local_placeholder_metadata
+
+class AsyncLocalExtractor(AsyncBaseExtractor):
+    """
+    Async extractor for local media files.
+    """
+    def __init__(
+        self,
+        profile: ExtractionProfile = DEFAULT_PROFILE,
+        max_processes: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        self.profile = profile
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._limit_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the process limit for the running loop (the facade runs each call on a new loop).
+        """
+        loop = asyncio.get_running_loop()
+        if self._limit is None or self._limit_loop is not loop:
+            self._limit, self._limit_loop = asyncio.Semaphore(self.max_processes), loop
+        return self._limit
+
+    async def _extract(self, source: str, output_path: str) -> str:
+        if self.profile != "archive":
+            return await extract_audio_fast_async(source, output_path, self.profile)
+
+        from pipeline.extractors.local.file_audio import extract_audio_from_file
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_processes, thread_name_prefix="moviepy")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, extract_audio_from_file, source, output_path)
+
+    async def extract_audio(self, source: str, output_path: str) -> str:
+        """
+        Extract audio from a local media file with the extractor's profile; returns the path written.
+        """
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Input file not found: {source}")
+        async with self._semaphore():
+            return await asyncio.wait_for(self._extract(source, output_path), self.timeout)
+
+    async def extract_metadata(self, source: str) -> dict:
+        """
+        Return placeholder metadata built from the file's name and size.
+        """
+        return build_local_placeholder_metadata(source)
+
+    async def aclose(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,281 @@
+"""
+File: ffmpeg_audio.py
+
+Direct ffmpeg audio extraction for file-system sources in the content-pipeline project.
+
+Bypasses moviepy's frame-by-frame Python pipeline and MP3 re-encode: the `copy` profile
+remuxes the existing audio track into a matching container, and the `asr` profile writes
+16 kHz mono FLAC that Whisper decodes without resampling. Both run as a single ffmpeg
+process that never decodes the video stream.
+
+The *_async variants run the same commands as asyncio subprocesses; cancelling the
+awaiting task kills ffmpeg and removes the partial output file. run_ffmpeg_streaming()
+feeds ffmpeg's stdin from an iterator of chunks, for sources that arrive over the
+network, and also supports the archive profile with ffmpeg's MP3 encoder.
+"""
+import asyncio
+import logging
+import os
+import re
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from pipeline.extractors.profiles import ExtractionProfile
+from pipeline.utils.ffmpeg import ffmpeg_executable
+
+ASR_SAMPLE_RATE = 16000
+ARCHIVE_MP3_BITRATE = "192k"
+# ffmpeg input name for media written to its stdin
+STREAM_INPUT = "pipe:0"
+
+# Audio codec -> container extension that can hold it without re-encoding
+COPY_CONTAINERS = {
+    "aac": ".m4a",
+    "alac": ".m4a",
+    "mp3": ".mp3",
+    "opus": ".opus",
+    "vorbis": ".ogg",
+    "flac": ".flac",
+}
+
+_AUDIO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*?: Audio: (?P<codec>[\w-]+)(?P<details>.*)")
+
+@dataclass
+class AudioStreamInfo:
+    """
+    Properties of the first audio stream in a media file.
+    """
+    codec: str
+    sample_rate: Optional[int] = None
+    channels: Optional[str] = None
+    bitrate_kbps: Optional[int] = None
+
+def _probe_command(media_path: str) -> List[str]:
+    return [ffmpeg_executable(), "-hide_banner", "-nostdin", "-i", media_path]
+
+def _parse_probe_output(stderr: str, media_path: str) -> Optional[AudioStreamInfo]:
+    """
+    Parse the stream listing ffmpeg prints for `-i media_path` without an output file.
+    """
+    # Without an output file ffmpeg always exits non-zero; the stream listing is on stderr
+    if "Input #0" not in stderr:
+        raise RuntimeError(f"ffmpeg could not read {media_path}: {stderr.strip().splitlines()[-1:]}")
+
+    match = _AUDIO_STREAM_RE.search(stderr)
+    if not match:
+        return None
+    details = match.group("details")
+    sample_rate = re.search(r"(\d+) Hz", details)
+    bitrate = re.search(r"(\d+) kb/s", details)
+    fields = [field.strip() for field in details.split(",")]
+    return AudioStreamInfo(
+        codec=match.group("codec"),
+        sample_rate=int(sample_rate.group(1)) if sample_rate else None,
+        channels=fields[2] if len(fields) > 2 else None,
+        bitrate_kbps=int(bitrate.group(1)) if bitrate else None
+    )
+
+def probe_audio_stream(media_path: str) -> Optional[AudioStreamInfo]:
+    """
+    Return the first audio stream's codec and format, or None if the file has no audio.
+    Raises RuntimeError if ffmpeg cannot read the file.
+    """
+    result = subprocess.run(_probe_command(media_path), capture_output=True, text=True, errors="replace")
+    return _parse_probe_output(result.stderr, media_path)
+
+def _ffmpeg_command(args: List[str]) -> List[str]:
+    return [ffmpeg_executable(), "-hide_banner", "-nostdin", "-loglevel", "error", "-y"] + args
+
+def _asr_args(media_path: str, audio_path: str) -> List[str]:
+    return [
+        "-i", media_path,
+        "-map", "0:a:0", "-vn", "-sn", "-dn",
+        "-ac", "1", "-ar", str(ASR_SAMPLE_RATE),
+        "-c:a", "flac",
+        audio_path
+    ]
+
+def _copy_args(media_path: str, audio_path: str) -> List[str]:
+    return ["-i", media_path, "-map", "0:a:0", "-vn", "-sn", "-dn", "-c:a", "copy", audio_path]
+
+def _archive_args(media_path: str, audio_path: str) -> List[str]:
+    return [
+        "-i", media_path,
+        "-map", "0:a:0", "-vn", "-sn", "-dn",
+        "-c:a", "libmp3lame", "-b:a", ARCHIVE_MP3_BITRATE,
+        audio_path
+    ]
+
+def _copy_extension(info: Optional[AudioStreamInfo], media_path: str) -> Optional[str]:
+    """
+    Return the container extension for stream-copying the probed track, or None to fall back to asr.
+    """
+    if info is None:
+        raise RuntimeError(f"No audio stream found in {media_path}")
+    extension = COPY_CONTAINERS.get(info.codec)
+    if extension is None:
+        logging.info(f"[ffmpeg_audio] Codec {info.codec} cannot be stream-copied; writing 16 kHz FLAC")
+    return extension
+
+def plan_extraction(
+    profile: ExtractionProfile,
+    media_path: str,
+    output_path: str,
+    info: Optional[AudioStreamInfo] = None
+) -> Tuple[str, List[str]]:
+    """
+    Return (audio path, ffmpeg arguments) for extracting media_path with a profile.
+
+    The copy profile needs the probed audio stream and falls back to asr for codecs
+    without a matching container.
+    """
+    if profile == "archive":
+        audio_path = str(Path(output_path).with_suffix(".mp3"))
+        return audio_path, _archive_args(media_path, audio_path)
+    if profile == "copy":
+        extension = _copy_extension(info, media_path)
+        if extension is not None:
+            audio_path = str(Path(output_path).with_suffix(extension))
+            return audio_path, _copy_args(media_path, audio_path)
+    elif profile != "asr":
+        raise ValueError(f"Unsupported ffmpeg extraction profile: {profile}")
+    audio_path = str(Path(output_path).with_suffix(".flac"))
+    return audio_path, _asr_args(media_path, audio_path)
+
+def run_ffmpeg(args: List[str]) -> None:
+    """
+    Run ffmpeg with the given arguments, raising RuntimeError with its stderr on failure.
+    """
+    result = subprocess.run(_ffmpeg_command(args), capture_output=True, text=True, errors="replace")
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.strip()}")
+
+def extract_audio_fast(media_path: str, output_path: str, profile: ExtractionProfile = "copy") -> str:
+    """
+    Extract audio with ffmpeg for the copy or asr profile. Returns the path written,
+    whose extension depends on the profile and source codec.
+    """
+    if profile not in ("asr", "copy"):
+        raise ValueError(f"Unsupported ffmpeg extraction profile: {profile}")
+    info = probe_audio_stream(media_path) if profile == "copy" else None
+    audio_path, args = plan_extraction(profile, media_path, output_path, info)
+    run_ffmpeg(args)
+    logging.info(f"[ffmpeg_audio] {profile} extraction complete: {audio_path}")
+    return audio_path
+
+def extract_audio_asr(media_path: str, output_path: str) -> str:
+    """
+    Write the first audio track as 16 kHz mono FLAC. Returns the path written
+    (output_path with a .flac suffix).
+    """
+    return extract_audio_fast(media_path, output_path, "asr")
+
+def extract_audio_copy(media_path: str, output_path: str) -> str:
+    """
+    Remux the first audio track without re-encoding into a container matching its codec.
+    Codecs without a known container fall back to the asr profile. Returns the path written.
+    """
+    return extract_audio_fast(media_path, output_path, "copy")
+
+def probe_audio_stream_bytes(data: bytes) -> Optional[AudioStreamInfo]:
+    """
+    Probe the first audio stream from the leading bytes of a media file.
+    Raises RuntimeError if ffmpeg cannot identify the data.
+    """
+    result = subprocess.run(_probe_command(STREAM_INPUT), input=data, capture_output=True)
+    return _parse_probe_output(result.stderr.decode("utf-8", errors="replace"), STREAM_INPUT)
+
+def run_ffmpeg_streaming(args: List[str], chunks: Iterable[bytes]) -> None:
+    """
+    Run ffmpeg on media written to its stdin (args use STREAM_INPUT) chunk by chunk.
+
+    ffmpeg decodes while later chunks are still arriving, and no copy of the input is
+    kept on disk. If iterating the chunks fails, ffmpeg is killed, the output (the last
+    argument) is removed and the error is raised. Raises RuntimeError if ffmpeg fails;
+    demuxing errors count as failures (-xerror), since ffmpeg otherwise exits 0 on a
+    stream it could only partly read.
+    """
+    process = subprocess.Popen(
+        _ffmpeg_command(["-xerror", *args]), stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    stderr: List[bytes] = []
+    drain = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+    drain.start()
+    try:
+        for chunk in chunks:
+            try:
+                process.stdin.write(chunk)
+            except BrokenPipeError:
+                # ffmpeg stopped reading; its exit status says whether that was an error
+                break
+    except BaseException:
+        process.kill()
+        process.wait()
+        drain.join()
+        if os.path.exists(args[-1]):
+            os.remove(args[-1])
+        raise
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    process.wait()
+    drain.join()
+    if process.returncode != 0:
+        if os.path.exists(args[-1]):
+            os.remove(args[-1])
+        raise RuntimeError(f"ffmpeg failed: {b''.join(stderr).decode('utf-8', errors='replace').strip()}")
+
+async def _communicate(cmd: List[str], output_path: Optional[str] = None) -> tuple:
+    """
+    Run a command as an asyncio subprocess and return (returncode, stderr text).
+
+    If the awaiting task is cancelled the process is killed and output_path removed.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        if output_path and os.path.exists(output_path):
+            os.remove(output_path)
+        logging.info(f"[ffmpeg_audio] Cancelled ffmpeg (pid {process.pid})")
+        raise
+    return process.returncode, stderr.decode("utf-8", errors="replace")
+
+async def _run_ffmpeg_async(args: List[str]) -> None:
+    """
+    Async counterpart of run_ffmpeg(); the last argument is the output file.
+    """
+    returncode, stderr = await _communicate(_ffmpeg_command(args), output_path=args[-1])
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {stderr.strip()}")
+
+async def probe_audio_stream_async(media_path: str) -> Optional[AudioStreamInfo]:
+    """
+    Async counterpart of probe_audio_stream().
+    """
+    _, stderr = await _communicate(_probe_command(media_path))
+    return _parse_probe_output(stderr, media_path)
+
+async def extract_audio_fast_async(media_path: str, output_path: str, profile: ExtractionProfile = "copy") -> str:
+    """
+    Async counterpart of extract_audio_fast(), running ffmpeg as an asyncio subprocess.
+    """
+    if profile not in ("asr", "copy"):
+        raise ValueError(f"Unsupported ffmpeg extraction profile: {profile}")
+    info = await probe_audio_stream_async(media_path) if profile == "copy" else None
+    audio_path, args = plan_extraction(profile, media_path, output_path, info)
+    await _run_ffmpeg_async(args)
+    logging.info(f"[ffmpeg_audio] {profile} extraction complete: {audio_path}")
+    return audio_path
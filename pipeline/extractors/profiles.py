@@ -0,0 +1,15 @@
+"""
+File: profiles.py
+
+Audio extraction profiles for the content-pipeline project.
+
+- archive: MP3 suitable for human listening (the historical default)
+- copy:    keep the source's audio codec without re-encoding, in a matching container
+- asr:     the cheapest audio that is adequate for transcription (16 kHz mono)
+"""
+from typing import Literal, Tuple
+
+ExtractionProfile = Literal["archive", "copy", "asr"]
+
+EXTRACTION_PROFILES: Tuple[str, ...] = ("archive", "copy", "asr")
+DEFAULT_PROFILE: ExtractionProfile = "archive"
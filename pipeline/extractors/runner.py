@@ -0,0 +1,174 @@
+"""
+File: runner.py
+
+Single-source extraction routing for orchestration layers in the content-pipeline project.
+
+Classifies a source with dispatch.classify_source(), runs the matching extractor, and
+writes the metadata JSON next to the extracted audio. Extractor modules are imported
+inside the branch that needs them so callers only pay for the stages they use. When an
+ExtractionIndex is passed, sources already extracted to the requested location are
+returned from the index without downloading or decoding anything.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlparse, parse_qs
+from pipeline.extractors.dispatch import classify_source, host_in_domain
+from pipeline.extractors.index import ExtractionIndex
+from pipeline.extractors.profiles import DEFAULT_PROFILE, ExtractionProfile
+from pipeline.extractors.schema.metadata import build_local_placeholder_metadata
+
+@dataclass
+class ExtractionResult:
+    """
+    Artifacts produced by extracting a single source.
+    """
+    source: str
+    source_type: str
+    audio_path: str
+    metadata_path: Optional[str] = None
+    metadata: Optional[dict] = None
+
+def youtube_video_id(source: str) -> Optional[str]:
+    """
+    Return the video ID from a YouTube watch, short, embed, or youtu.be URL, if present.
+    """
+    parsed = urlparse(source)
+    hostname = parsed.hostname or ""
+    if host_in_domain(hostname, "youtu.be"):
+        video_id = parsed.path.lstrip("/").split("/")[0]
+        return video_id or None
+    if host_in_domain(hostname, "youtube.com"):
+        query_id = parse_qs(parsed.query).get("v")
+        if query_id:
+            return query_id[0]
+        match = re.match(r"^/(?:shorts|embed|live|v)/([^/?#]+)", parsed.path)
+        if match:
+            return match.group(1)
+    return None
+
+# Playlist, channel and channel-tab URLs that list videos rather than being one
+COLLECTION_URL_PATTERN = re.compile(r"youtube\.com/(?:playlist\?|@[^/?#]+|channel/|c/|user/)", re.IGNORECASE)
+
+def is_collection_url(source: str) -> bool:
+    """
+    Return whether a URL points at a YouTube playlist or channel.
+    """
+    return bool(COLLECTION_URL_PATTERN.search(source))
+
+def youtube_index_key(source: str) -> Optional[str]:
+    """
+    Return the extraction index key for a YouTube video URL, if it has a video ID.
+    """
+    video_id = youtube_video_id(source)
+    return f"youtube:{video_id}" if video_id else None
+
+def output_stem_for(source: str) -> str:
+    """
+    Derive a unique, filesystem-safe base name for a source's artifacts.
+
+    YouTube videos use their video ID; other sources use the file stem plus a short hash
+    of the full source so equal names from different locations do not collide.
+    """
+    video_id = youtube_video_id(source)
+    if video_id:
+        return re.sub(r"[^A-Za-z0-9_-]", "_", video_id)
+    stem = Path(urlparse(source).path or source).stem or "source"
+    stem = re.sub(r"[^A-Za-z0-9._-]", "_", stem)[:80]
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+    return f"{stem}-{digest}"
+
+def _write_metadata(metadata: dict, metadata_path: str) -> None:
+    """
+    Save a metadata dictionary as formatted JSON.
+    """
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+    logging.info(f"Metadata saved to: {metadata_path}")
+
+def extract_source(
+    source: str,
+    output_path: str,
+    profile: ExtractionProfile = DEFAULT_PROFILE,
+    index: Optional[ExtractionIndex] = None
+) -> ExtractionResult:
+    """
+    Extract audio and metadata for one source into output_path (an .mp3 path).
+
+    Profiles other than "archive" may change the audio file's extension; the path actually
+    written is returned in the result. Failures to save metadata are logged and do not
+    stop extraction; extraction failures raise.
+    """
+    source_type = classify_source(source)
+    metadata_path = str(Path(output_path).with_suffix(".json"))
+    metadata = None
+
+    if source_type == "streaming":
+        from pipeline.extractors.youtube.extractor import YouTubeExtractor
+
+        metadata, audio_path = YouTubeExtractor(profile, index=index).extract(source, output_path)
+        try:
+            _write_metadata(metadata, metadata_path)
+        except Exception as e:
+            logging.error(f"Failed to save metadata for {source}: {e}")
+            metadata_path = None
+        key = youtube_index_key(source)
+        if index and key and metadata_path:
+            index.set_metadata_path(key, profile, metadata_path)
+
+    elif source_type == "storage":
+        from pipeline.extractors.storage.extractor import StorageExtractor
+
+        metadata, audio_path = StorageExtractor(profile).extract(source, output_path)
+        try:
+            _write_metadata(metadata, metadata_path)
+        except Exception as e:
+            logging.error(f"Failed to save metadata for {source}: {e}")
+            metadata_path = None
+
+    else:  # file_system
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Input file not found: {source}")
+        key = index.file_key(source) if index else None
+        entry = index.lookup(key, profile) if key else None
+        if entry and entry.matches_output(output_path):
+            logging.info(f"Already extracted, skipping: {source} -> {entry.audio_path}")
+            return ExtractionResult(source, source_type, entry.audio_path, entry.metadata_path, entry.metadata)
+        metadata = build_local_placeholder_metadata(source)
+        try:
+            _write_metadata(metadata, metadata_path)
+        except Exception as e:
+            logging.error(f"Failed to save metadata for {source}: {e}")
+            metadata_path = None
+        audio_path = extract_local_audio(source, output_path, profile)
+        if key:
+            index.record(key, profile, source, audio_path, metadata_path, metadata)
+
+    logging.info(f"Audio saved to: {audio_path}")
+    return ExtractionResult(source, source_type, audio_path, metadata_path, metadata)
+
+def extract_local_audio(source: str, output_path: str, profile: ExtractionProfile = DEFAULT_PROFILE) -> str:
+    """
+    Extract audio from a local media file: moviepy MP3 for "archive", ffmpeg directly otherwise.
+    """
+    if profile == "archive":
+        from pipeline.extractors.local.file_audio import extract_audio_from_file
+        return extract_audio_from_file(source, output_path)
+
+    from pipeline.extractors.local.ffmpeg_audio import extract_audio_fast
+    return extract_audio_fast(source, output_path, profile)
+
+def unique_sources(sources: Iterable[str]) -> Iterator[str]:
+    """
+    Yield sources in order, dropping exact duplicates.
+    """
+    seen = set()
+    for source in sources:
+        if source not in seen:
+            seen.add(source)
+            yield source
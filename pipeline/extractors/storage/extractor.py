@@ -0,0 +1,111 @@
+"""
+File: extractor.py
+
+Audio and metadata extraction for object-storage sources in the content-pipeline project.
+
+StorageExtractor reads s3://, gs:// and storage-domain https objects as ranged GETs over
+the pooled ObjectStorageClient and writes them straight into ffmpeg's stdin, so audio
+extraction starts with the first range and no full-size copy of the object is written
+to local disk. The copy profile probes the codec from the object's first bytes; the
+archive profile encodes MP3 with ffmpeg.
+
+Containers whose index sits at the end of the file (e.g. MP4 without faststart) cannot be
+demuxed from a pipe. For those, ffmpeg reads the object itself through a presigned URL,
+seeking with its own Range requests.
+"""
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+from pipeline.extractors.base import BaseExtractor
+from pipeline.extractors.local.ffmpeg_audio import (
+    STREAM_INPUT,
+    AudioStreamInfo,
+    plan_extraction,
+    probe_audio_stream,
+    probe_audio_stream_bytes,
+    run_ffmpeg,
+    run_ffmpeg_streaming,
+)
+from pipeline.extractors.profiles import DEFAULT_PROFILE, ExtractionProfile
+from pipeline.extractors.schema.metadata import build_base_metadata
+from pipeline.utils.object_storage import ObjectInfo, ObjectStorageClient, ObjectStorageError, get_storage_client
+
+# Leading bytes fetched to identify the audio codec for the copy profile
+PROBE_BYTES = 1024 * 1024
+# ffmpeg errors meaning the container needs a seekable input
+_UNSTREAMABLE_ERRORS = ("moov atom not found", "partial file", "Invalid data found when processing input")
+
+def _needs_seekable_input(error: Exception) -> bool:
+    return not isinstance(error, ObjectStorageError) and any(text in str(error) for text in _UNSTREAMABLE_ERRORS)
+
+class StorageExtractor(BaseExtractor):
+    """
+    Extractor for objects in S3-compatible or GCS object storage.
+    """
+    def __init__(self, profile: ExtractionProfile = DEFAULT_PROFILE, client: Optional[ObjectStorageClient] = None):
+        self.profile = profile
+        self.client = client or get_storage_client()
+
+    def _metadata(self, source: str, info: ObjectInfo) -> dict:
+        return build_base_metadata(
+            title=Path(urlparse(source).path).name,
+            duration=None,
+            author=None,
+            source_type="storage",
+            source_path=source,
+            source_url=self.client.locate(source).url,
+            metadata_status="incomplete",
+            service_metadata={
+                "size": info.size,
+                "etag": info.etag,
+                "content_type": info.content_type,
+                "last_modified": info.last_modified
+            }
+        )
+
+    def _probe(self, source: str, etag: Optional[str]) -> Optional[AudioStreamInfo]:
+        """
+        Identify the audio stream from the object's first bytes, or via ffmpeg seeking the object.
+        """
+        head = b"".join(self.client.iter_object(source, length=PROBE_BYTES, etag=etag))
+        try:
+            return probe_audio_stream_bytes(head)
+        except RuntimeError:
+            logging.info(f"[storage] Could not identify {source} from its first {len(head)} bytes; probing the object")
+            return probe_audio_stream(self.client.presigned_url(source))
+
+    def _extract_audio(self, source: str, output_path: str, etag: Optional[str] = None) -> str:
+        info = self._probe(source, etag) if self.profile == "copy" else None
+        audio_path, args = plan_extraction(self.profile, STREAM_INPUT, output_path, info)
+        logging.info(f"[storage] Streaming {source} into ffmpeg ({self.profile} profile)")
+        try:
+            run_ffmpeg_streaming(args, self.client.iter_object(source, etag=etag))
+        except RuntimeError as e:
+            if not _needs_seekable_input(e):
+                raise
+            logging.warning(f"[storage] {source} cannot be decoded from a stream; letting ffmpeg seek the object")
+            audio_path, args = plan_extraction(self.profile, self.client.presigned_url(source), output_path, info)
+            run_ffmpeg(args)
+        logging.info(f"[storage] Extraction complete: {audio_path}")
+        return audio_path
+
+    def extract_audio(self, source: str, output_path: str) -> str:
+        """
+        Extract audio from a storage object with the extractor's profile; returns the path written.
+        """
+        return self._extract_audio(source, output_path)
+
+    def extract_metadata(self, source: str) -> dict:
+        """
+        Return metadata built from the object's key and HEAD response.
+        """
+        return self._metadata(source, self.client.head(source))
+
+    def extract(self, source: str, output_path: str) -> Tuple[dict, str]:
+        """
+        HEAD the object once, then extract its audio pinned to that version (ETag).
+        Returns (metadata, audio_path).
+        """
+        info = self.client.head(source)
+        return self._metadata(source, info), self._extract_audio(source, output_path, info.etag)
@@ -0,0 +1,83 @@
+"""
+File: async_extractor.py
+
+Asyncio YouTube extractor for the content-pipeline project.
+
+yt_dlp is a blocking, in-process library, so AsyncYouTubeExtractor runs the synchronous
+YouTubeExtractor in a bounded thread pool (sharing its pooled sessions and extraction
+index) and awaits the result. Any number of extractions can be awaited from one event
+loop, while only `max_workers` threads ever block in yt_dlp. Cancelling the awaiting
+task, or exceeding `timeout`, sets a cancel event that aborts the download at yt_dlp's
+next progress callback; jobs that have not started yet never run.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, Tuple, TypeVar
+from pipeline.extractors.base import AsyncBaseExtractor
+from pipeline.extractors.index import ExtractionIndex
+from pipeline.extractors.profiles import DEFAULT_PROFILE, ExtractionProfile
+from pipeline.extractors.youtube.extractor import YouTubeExtractor
+from pipeline.extractors.youtube.sessions import YoutubeDLSessionPool
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+class AsyncYouTubeExtractor(AsyncBaseExtractor):
+    """
+    Async extractor for YouTube sources backed by a bounded yt_dlp thread pool.
+    """
+    def __init__(
+        self,
+        profile: ExtractionProfile = DEFAULT_PROFILE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None,
+        sessions: Optional[YoutubeDLSessionPool] = None,
+        index: Optional[ExtractionIndex] = None
+    ):
+        self.extractor = YouTubeExtractor(profile, sessions=sessions, index=index)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="yt-async")
+            return self._executor
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """
+        Run a blocking extractor method in the pool, aborting it on cancellation or timeout.
+        """
+        cancel = threading.Event()
+        future = asyncio.get_running_loop().run_in_executor(self._pool(), partial(func, *args, cancel=cancel))
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            cancel.set()
+            raise
+
+    async def extract_audio(self, source: str, output_path: str) -> str:
+        return await self._run(self.extractor.extract_audio, source, output_path)
+
+    async def extract_metadata(self, source: str) -> dict:
+        return await self._run(self.extractor.extract_metadata, source)
+
+    async def extract(self, source: str, output_path: str) -> Tuple[dict, str]:
+        """
+        Resolve the video once and return (metadata, audio_path), as YouTubeExtractor.extract does.
+        """
+        return await self._run(self.extractor.extract, source, output_path)
+
+    async def aclose(self) -> None:
+        """
+        Shut down the worker threads, waiting for running downloads to stop.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, partial(executor.shutdown, wait=True, cancel_futures=True))
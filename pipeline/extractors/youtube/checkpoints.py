@@ -0,0 +1,167 @@
+"""
+File: checkpoints.py
+
+Resumable-download checkpoints for the YouTube extractor in the content-pipeline project.
+
+yt_dlp downloads into <file>.part and resumes it with an HTTP Range request when
+`continuedl` is on. On its own that is unsafe when several sources share an output name,
+or when a retry selects a different format: the new bytes would be appended to the
+wrong partial file. Each partial download therefore gets a sidecar checkpoint
+(<file>.part.json) recording the source, format, expected size and bytes received.
+Before a download starts, partial files whose checkpoint names another source (or
+that have no checkpoint) are discarded. When a resumed download reports a different
+format or size than its checkpoint, StaleCheckpoint aborts the attempt so the
+extractor can restart it cleanly. The bytes already on disk are what the extractor's
+retry policy treats as progress.
+"""
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+CHECKPOINT_SUFFIX = ".json"
+# Rewrite a checkpoint at most this often while downloading
+CHECKPOINT_INTERVAL_SECONDS = 1.0
+
+class StaleCheckpoint(Exception):
+    """
+    Raised when a resumed partial download does not belong to the current format.
+    """
+    def __init__(self, part_path: str, reason: str):
+        super().__init__(f"Partial download {part_path} is stale: {reason}")
+        self.part_path = part_path
+
+@dataclass
+class DownloadCheckpoint:
+    """
+    Sidecar record for one partial download.
+    """
+    source: str
+    part_path: str
+    format_id: Optional[str] = None
+    total_bytes: Optional[int] = None
+    downloaded_bytes: int = 0
+    updated_at: float = 0.0
+
+def checkpoint_path(part_path: str) -> str:
+    return part_path + CHECKPOINT_SUFFIX
+
+def read_checkpoint(part_path: str) -> Optional[DownloadCheckpoint]:
+    """
+    Return the checkpoint stored next to a partial file, or None if missing or unreadable.
+    """
+    try:
+        with open(checkpoint_path(part_path)) as f:
+            return DownloadCheckpoint(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+def write_checkpoint(checkpoint: DownloadCheckpoint) -> None:
+    """
+    Atomically write a checkpoint sidecar.
+    """
+    path = checkpoint_path(checkpoint.part_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(asdict(checkpoint), f)
+    os.replace(tmp_path, path)
+
+def discard(part_path: str) -> None:
+    """
+    Remove a partial file and its checkpoint.
+    """
+    for path in (part_path, checkpoint_path(part_path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def partial_files(output_stem: Path) -> Iterator[str]:
+    """
+    Yield yt_dlp partial files for an output stem: <stem>.part and <stem>.<ext>.part.
+    """
+    pattern = re.compile(rf"^{re.escape(output_stem.name)}(\.[A-Za-z0-9]+)?\.part$")
+    directory = output_stem.parent
+    if not directory.is_dir():
+        return
+    for entry in os.scandir(directory):
+        if pattern.match(entry.name):
+            yield entry.path
+
+def partial_bytes(output_stem: Path) -> int:
+    """
+    Return the bytes already downloaded for an output stem.
+    """
+    total = 0
+    for part_path in partial_files(output_stem):
+        try:
+            total += os.path.getsize(part_path)
+        except OSError:
+            pass
+    return total
+
+def prepare_resume(output_stem: Path, source: str) -> int:
+    """
+    Discard partial files for output_stem that do not belong to source, and orphaned
+    checkpoints. Returns the bytes kept for resuming.
+    """
+    kept = 0
+    for part_path in partial_files(output_stem):
+        checkpoint = read_checkpoint(part_path)
+        if checkpoint is None or checkpoint.source != source:
+            logging.info(f"[checkpoints] Discarding partial download {part_path} (not from {source})")
+            discard(part_path)
+            continue
+        kept += os.path.getsize(part_path)
+    pattern = re.compile(rf"^{re.escape(output_stem.name)}(\.[A-Za-z0-9]+)?\.part{re.escape(CHECKPOINT_SUFFIX)}$")
+    if output_stem.parent.is_dir():
+        for entry in os.scandir(output_stem.parent):
+            if pattern.match(entry.name) and not os.path.exists(entry.path[:-len(CHECKPOINT_SUFFIX)]):
+                os.remove(entry.path)
+    if kept:
+        logging.info(f"[checkpoints] Resuming {source} from {kept} byte(s) already downloaded")
+    return kept
+
+class CheckpointRecorder:
+    """
+    yt_dlp progress hook that maintains checkpoint sidecars for one extraction.
+    """
+    def __init__(self, source: str, interval: float = CHECKPOINT_INTERVAL_SECONDS):
+        self.source = source
+        self.interval = interval
+        self._current: Optional[DownloadCheckpoint] = None
+
+    def __call__(self, status: dict) -> None:
+        if status.get("status") == "finished":
+            # The finished status only names the final file; its .part was just renamed
+            part_path = self._current.part_path if self._current else f"{status.get('filename')}.part"
+            discard(checkpoint_path(part_path))
+            self._current = None
+            return
+        part_path = status.get("tmpfilename")
+        if status.get("status") != "downloading" or not part_path:
+            return
+
+        info = status.get("info_dict") or {}
+        format_id = info.get("format_id")
+        total_bytes = status.get("total_bytes")
+        if self._current is None or self._current.part_path != part_path:
+            previous = read_checkpoint(part_path)
+            if previous and previous.source == self.source:
+                if previous.format_id != format_id:
+                    raise StaleCheckpoint(part_path, f"format {previous.format_id} != {format_id}")
+                if previous.total_bytes and total_bytes and previous.total_bytes != total_bytes:
+                    raise StaleCheckpoint(part_path, f"size {previous.total_bytes} != {total_bytes}")
+            self._current = DownloadCheckpoint(self.source, part_path, format_id, total_bytes)
+        elif time.time() - self._current.updated_at < self.interval:
+            return
+
+        self._current.downloaded_bytes = status.get("downloaded_bytes") or 0
+        self._current.total_bytes = total_bytes or self._current.total_bytes
+        self._current.updated_at = time.time()
+        write_checkpoint(self._current)
@@ -0,0 +1,74 @@
+"""
+File: collection.py
+
+Playlist and channel indexing for the content-pipeline project.
+
+Expands a YouTube playlist or channel into its video URLs with flat extraction, then
+fans metadata requests out over a bounded thread pool. A token bucket caps the request
+rate - retries of a failed request included - so a large channel is indexed quickly
+without hammering the platform, even while it is throttling us. Metadata
+dicts (build_base_metadata format) are yielded as each video completes, not in
+playlist order.
+"""
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, Optional
+from pipeline.extractors.base import ExtractionCancelled
+from pipeline.extractors.youtube.extractor import YouTubeExtractor
+from pipeline.utils.rate_limit import TokenBucket
+from pipeline.utils.retry import retry
+
+DEFAULT_WORKERS = 4
+# Metadata requests per second across all workers
+DEFAULT_RATE = 5.0
+# Attempts per video, each taking its own token
+METADATA_ATTEMPTS = 3
+
+def iter_collection_metadata(
+    source: str,
+    workers: int = DEFAULT_WORKERS,
+    rate: float = DEFAULT_RATE,
+    burst: Optional[float] = None,
+    extractor: Optional[YouTubeExtractor] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None
+) -> Iterator[dict]:
+    """
+    Yield metadata for every video in a playlist or channel as it completes.
+
+    At most `workers` requests run at once and they start at no more than `rate` per
+    second (bursts of up to `burst`, default `workers`). Only a small window of videos
+    is queued ahead of the workers, so abandoning the iterator stops the run promptly.
+    Failed videos are logged, reported to on_error, and skipped.
+    """
+    extractor = extractor or YouTubeExtractor()
+    urls = iter(extractor.expand(source))
+    bucket = TokenBucket(rate, capacity=burst or max(1, workers))
+
+    @retry(max_attempts=METADATA_ATTEMPTS, no_retry=(ExtractionCancelled,))
+    def fetch(url: str) -> dict:
+        bucket.acquire()
+        return extractor.fetch_metadata(url)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metadata")
+    pending: Dict[Future, str] = {}
+    try:
+        while True:
+            for url in urls:
+                pending[pool.submit(fetch, url)] = url
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    metadata = future.result()
+                except Exception as e:
+                    logging.error(f"[collection] Metadata extraction failed for {url}: {e}")
+                    if on_error:
+                        on_error(url, e)
+                    continue
+                yield metadata
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
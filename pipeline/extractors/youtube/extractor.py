@@ -5,15 +5,139 @@ Audio and metadata extraction logic for YouTube sources in the content-pipeline
 
 Implements a YouTubeExtractor that uses yt_dlp to download audio and retrieve structured metadata.
 Supports retry logic and schema normalization for downstream enrichment and transcription workflows.
+
+Extraction profiles control the download:
+- archive: best audio transcoded to 192 kbps MP3 for human listening
+- copy:    best audio-only stream, kept in its native container (opus/m4a)
+- asr:     the smallest audio-only stream adequate for speech recognition, native container
+
+yt_dlp sessions come from a shared YoutubeDLSessionPool, so batches reuse HTTP keep-alive
+connections instead of building a new YoutubeDL per video. With an ExtractionIndex,
+videos already extracted to the requested location are returned without calling yt_dlp.
+
+Downloads resume instead of restarting: yt_dlp continues <file>.part with HTTP Range
+requests, a sidecar checkpoint ties each partial file to its source and format, and a
+failed attempt that grew the partial file is retried at once without counting
+against the retry limit.
 """
 import logging
+import threading
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
 from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError
 from pipeline.utils.retry import retry
-from pipeline.extractors.base import BaseExtractor
+from pipeline.extractors.base import BaseExtractor, ExtractionCancelled
+from pipeline.extractors.index import ExtractionIndex, IndexEntry
+from pipeline.extractors.profiles import DEFAULT_PROFILE, ExtractionProfile
+from pipeline.extractors.runner import is_collection_url, youtube_index_key
+from pipeline.extractors.youtube.checkpoints import (
+    CheckpointRecorder,
+    StaleCheckpoint,
+    discard,
+    partial_bytes,
+    prepare_resume,
+)
+from pipeline.extractors.youtube.sessions import YoutubeDLSessionPool, get_session_pool
 from pipeline.extractors.schema.metadata import build_base_metadata
 
+# Lowest audio bitrate (kbps) considered adequate for transcription
+ASR_MIN_ABR_KBPS = 32
+# yt_dlp's own resumes per attempt, and the Range request size for HTTP downloads
+DOWNLOAD_RETRIES = 3
+RANGE_CHUNK_BYTES = 10 * 1024 * 1024
+
+def _has_audio(fmt: dict) -> bool:
+    return fmt.get("acodec") not in (None, "none")
+
+def _is_audio_only(fmt: dict) -> bool:
+    return _has_audio(fmt) and fmt.get("vcodec") == "none"
+
+def _bitrate(fmt: dict) -> float:
+    return fmt.get("abr") or fmt.get("tbr") or 0
+
+def pick_asr_format(formats: Iterable[dict], min_abr: float = ASR_MIN_ABR_KBPS) -> Optional[dict]:
+    """
+    Return the smallest audio-only format whose bitrate is at least min_abr.
+
+    Falls back to the highest-bitrate audio-only format when none is adequate, then to the
+    smallest format that carries audio at all (e.g. a muxed video).
+    """
+    formats = list(formats)
+    audio_only = [f for f in formats if _is_audio_only(f)]
+    adequate = [f for f in audio_only if _bitrate(f) >= min_abr]
+    if adequate:
+        return min(adequate, key=lambda f: (_bitrate(f), f.get("filesize") or 0))
+    if audio_only:
+        return max(audio_only, key=_bitrate)
+    with_audio = [f for f in formats if _has_audio(f)]
+    if with_audio:
+        return min(with_audio, key=lambda f: (_bitrate(f), f.get("filesize") or 0))
+    return None
+
+def _asr_format_selector(ctx: dict) -> Iterator[dict]:
+    """
+    yt_dlp format selector for the asr profile.
+    """
+    chosen = pick_asr_format(ctx.get("formats") or [])
+    if chosen:
+        logging.info(
+            f"[extract_audio] asr profile selected format {chosen.get('format_id')} "
+            f"({chosen.get('acodec')}, {_bitrate(chosen)} kbps)"
+        )
+        yield chosen
+
+def _ffmpeg_location() -> Optional[str]:
+    """
+    Return the ffmpeg binary for yt_dlp post-processing, if one can be located.
+    """
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+    try:
+        return ffmpeg_executable()
+    except RuntimeError:
+        return None
+
+def watch_url(video_id: str) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+def _raise_if_cancelled(cancel: Optional[threading.Event]) -> None:
+    """
+    Raise ExtractionCancelled when yt_dlp failed because the caller cancelled the download.
+    """
+    if cancel is not None and cancel.is_set():
+        raise ExtractionCancelled("Download cancelled")
+
+def _output_stem(output_path) -> Path:
+    """
+    Strip the .mp3 extension from an output path to avoid duplication.
+    """
+    output_path = Path(output_path)
+    return output_path.with_suffix("") if output_path.suffix == ".mp3" else output_path
+
+def _resume_progress(extractor, source: str, output_path, *args, **kwargs) -> int:
+    """
+    Bytes of partial download on disk for output_path, used by retry to detect progress.
+    """
+    return partial_bytes(_output_stem(output_path))
+
+def metadata_from_info(info: dict, source: str) -> dict:
+    """
+    Build normalized metadata from a yt_dlp info dict.
+    """
+    return build_base_metadata(
+        title=info.get("title"),
+        duration=info.get("duration"),
+        author=info.get("uploader"),
+        source_type="streaming",
+        source_path=None,
+        source_url=source,
+        metadata_status="complete",
+        service_metadata={
+            "view_count": info.get("view_count"),
+            "channel_id": info.get("channel_id")
+        }
+    )
+
 class YouTubeExtractor(BaseExtractor):
     """
     Extractor for YouTube sources using yt_dlp.
@@ -21,81 +145,253 @@ class YouTubeExtractor(BaseExtractor):
     Provides methods to download audio and extract metadata from YouTube URLs.
     Used by CLI and orchestration layers to support streaming workflows.
     """
-    @retry(max_attempts=3)
-    def extract_audio(self, source: str, output_path: str) -> str:
+    def __init__(
+        self,
+        profile: ExtractionProfile = DEFAULT_PROFILE,
+        sessions: Optional[YoutubeDLSessionPool] = None,
+        index: Optional[ExtractionIndex] = None
+    ):
+        self.profile = profile
+        self.sessions = sessions or get_session_pool()
+        self.index = index
+
+    def _indexed(self, source: str, output_path) -> Optional[IndexEntry]:
+        """
+        Return the index entry for a video already extracted to output_path, if any.
         """
-        Downloads audio from a YouTube video and saves it as an MP3 file.
+        key = youtube_index_key(source)
+        entry = self.index.lookup(key, self.profile) if self.index and key else None
+        if entry and entry.matches_output(str(output_path)):
+            logging.info(f"[extract] Already extracted, skipping download: {source} -> {entry.audio_path}")
+            return entry
+        return None
 
-        Automatically strips the .mp3 extension from the output path to avoid duplication.
-        The resulting file is saved as <output_path>.mp3.
+    def _record(self, source: str, audio_path: str, metadata: Optional[dict] = None) -> None:
+        key = youtube_index_key(source)
+        if self.index and key:
+            self.index.record(key, self.profile, source, audio_path, metadata=metadata)
+
+    def session_options(self) -> dict:
         """
-        logging.info(f"[extract_audio] Starting download from: {source}")        
+        Build yt_dlp options for the extractor's profile.
 
-        output_path = Path(output_path)
-        if output_path.suffix == ".mp3":
-            output_path = output_path.with_suffix("")
-        
-        audio_path = output_path.with_suffix(".mp3")
+        These exclude per-call settings (output template, post hooks) so that every
+        extraction with the same profile can share pooled sessions.
+        """
+        if self.profile == "archive":
+            ydl_opts = {
+                'format': 'bestaudio/best',
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': '192',
+                }],
+            }
+        elif self.profile in ("copy", "asr"):
+            # 'best' remuxes audio-only downloads into their native container without re-encoding
+            ydl_opts = {
+                'format': _asr_format_selector if self.profile == "asr" else 'bestaudio/best',
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'best',
+                }],
+            }
+        else:
+            raise ValueError(f"Unknown extraction profile: {self.profile}")
 
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': str(output_path),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
+        ydl_opts.update({
             'quiet': False,
             'no_warnings': True,
-        }
+            'continuedl': True,
+            'retries': DOWNLOAD_RETRIES,
+            'http_chunk_size': RANGE_CHUNK_BYTES,
+        })
+        ffmpeg_location = _ffmpeg_location()
+        if ffmpeg_location:
+            ydl_opts['ffmpeg_location'] = ffmpeg_location
+        return ydl_opts
+
+    def output_template(self, output_path: Path) -> str:
+        """
+        Return the yt_dlp output template for a download to output_path.
+        """
+        if self.profile == "archive":
+            return str(output_path)
+        return f"{output_path}.%(ext)s"
+
+    @retry(max_attempts=3, no_retry=(ExtractionCancelled,), progress=_resume_progress)
+    def extract_audio(self, source: str, output_path: str, cancel: Optional[threading.Event] = None) -> str:
+        """
+        Downloads audio from a YouTube video using the extractor's profile.
+
+        Automatically strips the .mp3 extension from the output path to avoid duplication.
+        The archive profile saves <output_path>.mp3; copy and asr keep the stream's native
+        extension (e.g. .opus, .m4a). Returns the path of the saved file.
+        Setting `cancel` aborts the download with ExtractionCancelled.
+        An interrupted download leaves a partial file that the next attempt resumes.
+        """
+        _raise_if_cancelled(cancel)
+        logging.info(f"[extract_audio] Starting {self.profile} download from: {source}")
+
+        output_path = _output_stem(output_path)
+
+        entry = self._indexed(source, output_path)
+        if entry:
+            return entry.audio_path
+
+        ydl_opts = self.session_options()
+        prepare_resume(output_path, source)
 
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                ydl.download([source])
+            with self.sessions.lease(
+                YoutubeDL, ydl_opts, outtmpl=self.output_template(output_path), cancel=cancel,
+                progress_hooks=[CheckpointRecorder(source)]
+            ) as session:
+                session.ydl.download([source])
+                final_paths = session.final_paths
+                audio_path = final_paths[-1] if final_paths else str(output_path.with_suffix(".mp3"))
                 logging.info(f"[extract_audio] Download complete: {audio_path}")
-                return str(audio_path)
+                if final_paths:
+                    self._record(source, audio_path)
+                return audio_path
 
+        except StaleCheckpoint as e:
+            discard(e.part_path)
+            logging.warning(f"[extract_audio] {e}; restarting download")
+            raise RuntimeError(f"[extract_audio] Download failed: {e}")
         except DownloadError as e:
+            _raise_if_cancelled(cancel)
             logging.error(f"[extract_audio] Download failed: {e}")
             raise RuntimeError(f"[extract_audio] Download failed: {e}")
 
-    @retry(max_attempts=3)
-    def extract_metadata(self, source: str) -> dict:
+    @retry(max_attempts=3, no_retry=(ExtractionCancelled,), progress=_resume_progress)
+    def extract(self, source: str, output_path: str, cancel: Optional[threading.Event] = None) -> Tuple[dict, str]:
+        """
+        Resolves the video once and uses the same info for both metadata and audio.
+
+        Calls extract_info without processing, builds the metadata from the info dict, and
+        hands that info to process_ie_result for format selection and download, so each
+        video costs one page/manifest round-trip instead of two.
+        Returns (metadata, audio_path).
+        """
+        _raise_if_cancelled(cancel)
+        logging.info(f"[extract] Starting {self.profile} extraction from: {source}")
+
+        output_path = _output_stem(output_path)
+
+        entry = self._indexed(source, output_path)
+        if entry and entry.metadata is not None:
+            return entry.metadata, entry.audio_path
+
+        ydl_opts = self.session_options()
+        prepare_resume(output_path, source)
+
+        try:
+            with self.sessions.lease(
+                YoutubeDL, ydl_opts, outtmpl=self.output_template(output_path), cancel=cancel,
+                progress_hooks=[CheckpointRecorder(source)]
+            ) as session:
+                info = session.ydl.extract_info(source, download=False, process=False)
+                if not info:
+                    raise ValueError("No metadata returned from yt_dlp")
+                info = session.ydl.process_ie_result(info, download=True) or info
+                final_paths = list(session.final_paths)
+        except StaleCheckpoint as e:
+            discard(e.part_path)
+            logging.warning(f"[extract] {e}; restarting download")
+            raise RuntimeError(f"[extract] Download failed: {e}")
+        except DownloadError as e:
+            _raise_if_cancelled(cancel)
+            logging.error(f"[extract] Download failed: {e}")
+            raise RuntimeError(f"[extract] Download failed: {e}")
+
+        audio_path = final_paths[-1] if final_paths else str(output_path.with_suffix(".mp3"))
+        logging.info(f"[extract] Extraction complete: {audio_path}")
+        metadata = metadata_from_info(info, source)
+        if final_paths:
+            self._record(source, audio_path, metadata)
+        return metadata, audio_path
+
+    @retry(max_attempts=3, no_retry=(ExtractionCancelled,))
+    def extract_metadata(self, source: str, cancel: Optional[threading.Event] = None) -> dict:
         """
         Extracts metadata from a YouTube video using yt_dlp.
 
         Returns a dictionary with title, duration, author, and source information.
+        A `cancel` event that is already set raises ExtractionCancelled before any request.
+        """
+        return self.fetch_metadata(source, cancel)
+
+    def fetch_metadata(self, source: str, cancel: Optional[threading.Event] = None) -> dict:
         """
+        Single attempt of extract_metadata(), for callers that pace each request (and
+        retry) themselves.
+        """
+        _raise_if_cancelled(cancel)
         logging.info(f"[extract_metadata] Starting metadata extraction from: {source}")
 
         ydl_opts = {
             "quiet": True,
             "skip_download": True,
-            "forcejson": True,
         }
 
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(source, download=False)
+            with self.sessions.lease(YoutubeDL, ydl_opts) as session:
+                info = session.ydl.extract_info(source, download=False)
                 if not info:
                     raise ValueError("No metadata returned from yt_dlp")
 
-                metadata = build_base_metadata(
-                    title=info.get("title"),
-                    duration=info.get("duration"),
-                    author=info.get("uploader"),
-                    source_type="streaming",
-                    source_path=None,
-                    source_url=source,
-                    metadata_status="complete",
-                    service_metadata={
-                        "view_count": info.get("view_count"),
-                        "channel_id": info.get("channel_id")
-                    }
-                )
-            
+                metadata = metadata_from_info(info, source)
+
                 logging.info(f"[extract_metadata] Extraction complete for: {source}")
                 return metadata
         except Exception as e:
             logging.error(f"[extract_metadata] Metadata extraction failed: {e}")
             raise RuntimeError(f"[extract_metadata] Metadata extraction failed: {e}")
+
+    def expand(self, source: str, max_depth: int = 2) -> List[str]:
+        """
+        Lists the video URLs of a playlist or channel without resolving each video.
+
+        Uses flat extraction, so a channel of thousands of videos costs a few listing
+        pages instead of one page per video. Nested playlists (e.g. channel tabs) are
+        expanded up to max_depth levels. A single video URL expands to itself.
+        """
+        logging.info(f"[expand] Listing entries of: {source}")
+        ydl_opts = {
+            "quiet": True,
+            "skip_download": True,
+            "extract_flat": "in_playlist",
+        }
+
+        try:
+            with self.sessions.lease(YoutubeDL, ydl_opts) as session:
+                urls = self._flat_entries(session.ydl, session.ydl.extract_info(source, download=False), max_depth)
+        except DownloadError as e:
+            logging.error(f"[expand] Listing failed: {e}")
+            raise RuntimeError(f"[expand] Listing failed: {e}")
+
+        unique = list(dict.fromkeys(urls if urls is not None else [source]))
+        logging.info(f"[expand] Found {len(unique)} video(s) in: {source}")
+        return unique
+
+    def _flat_entries(self, ydl, info: Optional[dict], depth: int) -> Optional[List[str]]:
+        """
+        Return video URLs under a flat-extracted info dict, or None if it is a single video.
+        """
+        if not info or info.get("_type") not in ("playlist", "multi_video"):
+            return None
+        urls = []
+        for entry in info.get("entries") or []:
+            if not entry:
+                continue
+            if entry.get("_type") == "playlist" or is_collection_url(entry.get("url") or ""):
+                if depth <= 0:
+                    continue
+                nested = entry if entry.get("_type") == "playlist" else ydl.extract_info(entry["url"], download=False)
+                urls.extend(self._flat_entries(ydl, nested, depth - 1) or [])
+            elif entry.get("id") and not (entry.get("url") or "").startswith("http"):
+                urls.append(watch_url(entry["id"]))
+            elif entry.get("url"):
+                urls.append(entry["url"])
+        return urls
@@ -0,0 +1,182 @@
+"""
+File: sessions.py
+
+Pooled, reusable yt_dlp sessions for the YouTube extractor in the content-pipeline project.
+
+Building a YoutubeDL instance loads the extractor registry and opens a fresh HTTP session,
+and closing it drops every keep-alive connection, so creating one per video repeats the
+TLS handshakes and connection setup for every item of a batch. The pool keeps a few
+long-lived sessions per option set and leases each to one caller at a time, which
+makes them safe to share between worker threads. Per-call state (the output template,
+the list of finished files, an optional cancel event checked from yt_dlp's progress
+hook and any extra progress hooks) is reset on every lease.
+
+A session whose call raised is closed instead of being returned, so a half-read
+connection or a sticky error code never leaks into the next extraction.
+"""
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from pipeline.extractors.base import ExtractionCancelled
+
+# Idle sessions kept per option set, and across all option sets
+MAX_IDLE_PER_KEY = 4
+MAX_IDLE_TOTAL = 8
+
+def options_key(options: Dict[str, Any]) -> Hashable:
+    """
+    Return a hashable key for a yt_dlp option dict (callables compare by identity).
+    """
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        return value
+    return freeze(options)
+
+class YoutubeDLSession:
+    """
+    A YoutubeDL instance leased from the pool, with its per-call state.
+    """
+    def __init__(self, factory: Callable[[dict], Any], options: Dict[str, Any]):
+        """
+        Create and enter a YoutubeDL whose post-hook records finished files and whose
+        progress hook aborts the download once the lease's cancel event is set, then
+        calls the lease's own progress hooks.
+        """
+        self.final_paths: List[str] = []
+        self.cancel: Optional[threading.Event] = None
+        self.progress_hooks: List[Callable[[dict], None]] = []
+        self._context = factory({
+            **options,
+            "post_hooks": [self.final_paths.append],
+            "progress_hooks": [self._on_progress],
+        })
+        self.ydl = self._context.__enter__()
+
+    def _on_progress(self, status: dict) -> None:
+        if self.cancel is not None and self.cancel.is_set():
+            raise ExtractionCancelled("Download cancelled")
+        for hook in self.progress_hooks:
+            hook(status)
+
+    def reset(
+        self,
+        outtmpl: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+        progress_hooks: Sequence[Callable[[dict], None]] = ()
+    ) -> None:
+        """
+        Clear results from the previous lease and set the output template, cancel event
+        and progress hooks for this one.
+        """
+        self.final_paths.clear()
+        self.cancel = cancel
+        self.progress_hooks = list(progress_hooks)
+        if outtmpl is not None:
+            self.ydl.params["outtmpl"]["default"] = outtmpl
+
+    def close(self) -> None:
+        """
+        Exit the YoutubeDL context, closing its HTTP connections.
+        """
+        try:
+            self._context.__exit__(None, None, None)
+        except Exception as e:
+            logging.debug(f"[ydl_sessions] Error while closing session: {e}")
+
+class YoutubeDLSessionPool:
+    """
+    Keeps idle YoutubeDL sessions keyed by (factory, options) and leases them exclusively.
+    """
+    def __init__(self, max_idle_per_key: int = MAX_IDLE_PER_KEY, max_idle_total: int = MAX_IDLE_TOTAL):
+        self.max_idle_per_key = max_idle_per_key
+        self.max_idle_total = max_idle_total
+        self._idle: "OrderedDict[Tuple[Hashable, int], YoutubeDLSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._serial = 0
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def lease(
+        self,
+        factory: Callable[[dict], Any],
+        options: Dict[str, Any],
+        outtmpl: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+        progress_hooks: Sequence[Callable[[dict], None]] = ()
+    ) -> Iterator[YoutubeDLSession]:
+        """
+        Yield a session for the given options, creating one when none is idle.
+
+        The session belongs to the caller until the block exits; it returns to the pool
+        on success and is closed if the block raised.
+        """
+        key = (factory, options_key(options))
+        session = self._take(key)
+        if session is None:
+            session = YoutubeDLSession(factory, options)
+            with self._lock:
+                self.created += 1
+        session.reset(outtmpl, cancel, progress_hooks)
+        try:
+            yield session
+        except BaseException:
+            session.close()
+            raise
+        self._give_back(key, session)
+
+    def _take(self, key: Hashable) -> Optional[YoutubeDLSession]:
+        with self._lock:
+            for idle_key in reversed(self._idle):
+                if idle_key[0] == key:
+                    self.reused += 1
+                    return self._idle.pop(idle_key)
+        return None
+
+    def _give_back(self, key: Hashable, session: YoutubeDLSession) -> None:
+        evicted = []
+        with self._lock:
+            if sum(1 for idle_key in self._idle if idle_key[0] == key) >= self.max_idle_per_key:
+                evicted.append(session)
+            else:
+                self._serial += 1
+                self._idle[(key, self._serial)] = session
+            while len(self._idle) > self.max_idle_total:
+                evicted.append(self._idle.popitem(last=False)[1])
+        for stale in evicted:
+            stale.close()
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """
+        Close every idle session.
+        """
+        with self._lock:
+            sessions = list(self._idle.values())
+            self._idle.clear()
+        for session in sessions:
+            session.close()
+
+_pool: Optional[YoutubeDLSessionPool] = None
+_pool_lock = threading.Lock()
+
+def get_session_pool() -> YoutubeDLSessionPool:
+    """
+    Return the process-wide session pool, closing it at interpreter exit.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = YoutubeDLSessionPool()
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,180 @@
+"""
+File: streaming.py
+
+Streaming producer/consumer orchestration for the content-pipeline project.
+
+Runs extraction and transcription as concurrent stages connected by bounded queues:
+extraction workers keep the network busy while transcription workers keep the cores
+busy, and a full queue blocks upstream workers (backpressure) so downloads never run
+unboundedly ahead of inference.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Literal, Optional
+
+# Marks the end of a stage's input
+_DONE = object()
+
+ExtractFn = Callable[[str], str]
+TranscribeFn = Callable[[str, str], str]
+
+@dataclass
+class RunItemResult:
+    """
+    Outcome of driving one source through the pipeline.
+    """
+    source: str
+    status: Literal["ok", "failed"]
+    stage: Literal["extract", "transcribe", "done"]
+    audio_path: Optional[str] = None
+    transcript_path: Optional[str] = None
+    error: Optional[str] = None
+    extract_seconds: float = 0.0
+    transcribe_seconds: float = 0.0
+
+@dataclass
+class RunReport:
+    """
+    Aggregated results for a pipeline run, including per-stage busy time.
+    """
+    results: List[RunItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.status == "ok")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.status == "failed")
+
+    @property
+    def extract_seconds(self) -> float:
+        return sum(r.extract_seconds for r in self.results)
+
+    @property
+    def transcribe_seconds(self) -> float:
+        return sum(r.transcribe_seconds for r in self.results)
+
+class StreamingPipeline:
+    """
+    Two-stage extract -> transcribe pipeline with bounded queues and per-stage concurrency.
+
+    `extract_fn(source)` returns the extracted audio path. `transcriber_factory()` is called
+    once per transcription worker and returns a `transcribe(source, audio_path)` callable
+    that persists the transcript and returns its path. Workers only transcribe in parallel
+    if the factory gives each its own model; adapters sharing a model take turns on it.
+    """
+    def __init__(
+        self,
+        extract_fn: ExtractFn,
+        transcriber_factory: Callable[[], TranscribeFn],
+        extract_workers: int = 4,
+        transcribe_workers: int = 1,
+        queue_size: int = 8,
+        on_result: Optional[Callable[[RunItemResult], None]] = None
+    ):
+        if extract_workers < 1 or transcribe_workers < 1 or queue_size < 1:
+            raise ValueError("Worker counts and queue size must be at least 1")
+        self.extract_fn = extract_fn
+        self.transcriber_factory = transcriber_factory
+        self.extract_workers = extract_workers
+        self.transcribe_workers = transcribe_workers
+        self.queue_size = queue_size
+        self.on_result = on_result
+        self._results_lock = threading.Lock()
+
+    def run(self, sources: Iterable[str]) -> RunReport:
+        """
+        Drive all sources through both stages and return the combined report.
+        """
+        report = RunReport()
+        source_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        audio_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        start = time.perf_counter()
+
+        extractors = [
+            threading.Thread(target=self._extract_worker, args=(source_queue, audio_queue, report),
+                             name=f"extract-{i}", daemon=True)
+            for i in range(self.extract_workers)
+        ]
+        transcribers = [
+            threading.Thread(target=self._transcribe_worker, args=(audio_queue, report),
+                             name=f"transcribe-{i}", daemon=True)
+            for i in range(self.transcribe_workers)
+        ]
+        for thread in extractors + transcribers:
+            thread.start()
+
+        # Feed sources; put() blocks while extraction is saturated
+        for source in sources:
+            source_queue.put(source)
+        for _ in extractors:
+            source_queue.put(_DONE)
+        for thread in extractors:
+            thread.join()
+
+        for _ in transcribers:
+            audio_queue.put(_DONE)
+        for thread in transcribers:
+            thread.join()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _record(self, report: RunReport, result: RunItemResult) -> None:
+        """
+        Append a finished item to the report and notify the progress callback.
+        """
+        with self._results_lock:
+            report.results.append(result)
+            if self.on_result:
+                self.on_result(result)
+
+    def _extract_worker(self, source_queue: queue.Queue, audio_queue: queue.Queue, report: RunReport) -> None:
+        """
+        Pull sources, extract audio, and hand results to the transcription stage.
+        """
+        while True:
+            source = source_queue.get()
+            if source is _DONE:
+                return
+            result = RunItemResult(source, "ok", "extract")
+            start = time.perf_counter()
+            try:
+                result.audio_path = self.extract_fn(source)
+            except Exception as e:
+                logging.error(f"[run] Extraction failed for {source}: {e}")
+                result.status, result.error = "failed", str(e)
+            result.extract_seconds = time.perf_counter() - start
+
+            if result.status == "failed":
+                self._record(report, result)
+            else:
+                # Blocks while transcription is behind (backpressure)
+                audio_queue.put(result)
+
+    def _transcribe_worker(self, audio_queue: queue.Queue, report: RunReport) -> None:
+        """
+        Pull extracted audio, transcribe and persist it with this worker's transcriber.
+        """
+        transcribe = None
+        while True:
+            result = audio_queue.get()
+            if result is _DONE:
+                return
+            result.stage = "transcribe"
+            start = time.perf_counter()
+            try:
+                if transcribe is None:
+                    transcribe = self.transcriber_factory()
+                result.transcript_path = transcribe(result.source, result.audio_path)
+                result.stage = "done"
+            except Exception as e:
+                logging.error(f"[run] Transcription failed for {result.source}: {e}")
+                result.status, result.error = "failed", str(e)
+            result.transcribe_seconds = time.perf_counter() - start
+            self._record(report, result)
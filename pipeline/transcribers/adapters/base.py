@@ -4,7 +4,7 @@ File: base.py
 Defines the TranscriberAdapter protocol for transcription adapters.
 Used to enforce a consistent interface across adapter implementations.
 """
-from typing import Protocol, Optional
+from typing import Iterator, Protocol, Optional
 
 class TranscriberAdapter(Protocol):
     """
@@ -23,3 +23,13 @@ class TranscriberAdapter(Protocol):
         """
         Return the engine name and version used for transcription.
         """
+
+class StreamingTranscriberAdapter(TranscriberAdapter, Protocol):
+    """
+    Protocol for adapters that can emit segments while transcription is still running.
+    """
+    def transcribe_stream(self, audio_path: str, language: Optional[str] = None) -> Iterator[dict]:
+        """
+        Yield raw segment dictionaries in timeline order as they are produced.
+        Each segment carries the detected language under "language".
+        """
@@ -0,0 +1,237 @@
+"""
+File: registry.py
+
+Process-wide registry of loaded transcription models.
+
+Models are keyed by (model_name, device, dtype) and shared between adapters, so a
+worker that alternates between variants reuses weights already in memory. When the
+resident size exceeds a configurable budget, least-recently-used models are evicted,
+before a load when possible (from the size seen at an earlier load, or estimated from
+the model name), so two large models are not held at once. Loads run outside the
+registry lock: a cold load never delays a hit, and concurrent requests for a model
+that is loading wait for that one load.
+
+A shared model must not run two inferences at once (Whisper's decoder installs and
+removes KV-cache hooks on the model during each call), so the registry also hands out
+one inference lock per key.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Environment variable holding the registry memory budget in megabytes
+BUDGET_ENV_VAR = "CONTENT_PIPELINE_MODEL_BUDGET_MB"
+
+ModelKey = Tuple[str, Optional[str], str]
+ModelLoader = Callable[[str, Optional[str], str], Any]
+SizeHint = Callable[[str, str], int]
+
+# Approximate parameter counts of the Whisper checkpoints, for sizing models before they load
+WHISPER_PARAMETERS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+
+@dataclass
+class RegistryStats:
+    """
+    Snapshot of registry counters and resident models.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident_bytes: int = 0
+    budget_bytes: Optional[int] = None
+    models: List[ModelKey] = field(default_factory=list)
+
+def load_whisper_model(model_name: str, device: Optional[str], dtype: str) -> Any:
+    """
+    Load a Whisper model, importing Whisper only when a model is actually needed.
+    """
+    import whisper
+
+    model = whisper.load_model(model_name, device=device)  # type: ignore[attr-defined]
+    if dtype == "float16":
+        model = model.half()
+    return model
+
+def whisper_size_hint(model_name: str, dtype: str) -> int:
+    """
+    Estimate a Whisper model's size from its name (e.g. "small.en", "large-v3").
+    Returns 0 for unknown names.
+    """
+    family = model_name.split(".")[0].split("-")[0]
+    return WHISPER_PARAMETERS.get(family, 0) * (2 if dtype == "float16" else 4)
+
+def release_model_memory(model: Any) -> None:
+    """
+    Return cached GPU memory to the device once an evicted CUDA model is dropped.
+    """
+    if not str(getattr(model, "device", "")).startswith("cuda"):
+        return
+    try:
+        import torch
+        torch.cuda.empty_cache()
+    except Exception as e:
+        logging.warning(f"[model_registry] Could not release GPU memory: {e}")
+
+def estimate_model_bytes(model: Any) -> int:
+    """
+    Estimate the memory held by a torch module's parameters and buffers.
+    Returns 0 for objects that do not expose them.
+    """
+    total = 0
+    for attr in ("parameters", "buffers"):
+        tensors = getattr(model, attr, None)
+        if callable(tensors):
+            total += sum(t.numel() * t.element_size() for t in tensors())
+    return total
+
+class ModelRegistry:
+    """
+    Thread-safe LRU cache of loaded models with a memory budget and hit/miss/eviction counters.
+    """
+    def __init__(
+        self,
+        budget_bytes: Optional[int] = None,
+        loader: ModelLoader = load_whisper_model,
+        size_fn: Callable[[Any], int] = estimate_model_bytes,
+        size_hint: SizeHint = whisper_size_hint
+    ):
+        """
+        Create a registry; budget_bytes=None means models are never evicted.
+        size_hint estimates a model's size from (model_name, dtype) before its first load.
+        """
+        self.budget_bytes = budget_bytes
+        self.loader = loader
+        self.size_fn = size_fn
+        self.size_hint = size_hint
+        self._models: "OrderedDict[ModelKey, Tuple[Any, int]]" = OrderedDict()
+        # Models being loaded, with the bytes reserved for them
+        self._loading: Dict[ModelKey, Tuple[Future, int]] = {}
+        self._known_sizes: Dict[ModelKey, int] = {}
+        self._inference_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, model_name: str, device: Optional[str] = None, dtype: str = "float32") -> Any:
+        """
+        Return the loaded model for the key, loading (and evicting others) if needed.
+        """
+        key = (model_name, device, dtype)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key][0]
+            if key in self._loading:
+                # Another thread is loading this model; wait for it instead of loading twice
+                self.hits += 1
+                pending = self._loading[key][0]
+            else:
+                self.misses += 1
+                pending = None
+                expected = self._known_sizes.get(key) or self.size_hint(model_name, dtype)
+                self._evict_until_fits(expected)
+                loading: Future = Future()
+                self._loading[key] = (loading, expected)
+        if pending is not None:
+            return pending.result()
+
+        logging.info(f"[model_registry] Loading model {key}")
+        try:
+            model = self.loader(model_name, device, dtype)
+            size = self.size_fn(model)
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(key)
+            loading.set_exception(e)
+            raise
+        with self._lock:
+            self._loading.pop(key)
+            self._known_sizes[key] = size
+            self._models[key] = (model, size)
+            self._evict_until_fits(0, keep=key)
+        loading.set_result(model)
+        return model
+
+    def inference_lock(self, model_name: str, device: Optional[str] = None, dtype: str = "float32") -> threading.Lock:
+        """
+        Return the lock that serializes inference on the model for the key.
+        """
+        key = (model_name, device, dtype)
+        with self._lock:
+            return self._inference_locks.setdefault(key, threading.Lock())
+
+    def _resident_bytes(self) -> int:
+        return sum(size for _, size in self._models.values())
+
+    def _reserved_bytes(self) -> int:
+        return sum(size for _, size in self._loading.values())
+
+    def _evict_until_fits(self, incoming: int, keep: Optional[ModelKey] = None) -> None:
+        """
+        Evict least-recently-used models until resident, in-flight loads and incoming
+        fit the budget. The model identified by `keep` is never evicted.
+        """
+        if self.budget_bytes is None:
+            return
+        while self._resident_bytes() + self._reserved_bytes() + incoming > self.budget_bytes:
+            victim = next((k for k in self._models if k != keep), None)
+            if victim is None:
+                if keep is not None:
+                    logging.warning(f"[model_registry] Model {keep} alone exceeds the memory budget")
+                return
+            model, _ = self._models.pop(victim)
+            self.evictions += 1
+            logging.info(f"[model_registry] Evicted model {victim}")
+            release_model_memory(model)
+
+    def stats(self) -> RegistryStats:
+        """
+        Return a snapshot of counters and resident models (least recently used first).
+        """
+        with self._lock:
+            return RegistryStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                resident_bytes=self._resident_bytes(),
+                budget_bytes=self.budget_bytes,
+                models=list(self._models)
+            )
+
+    def clear(self) -> None:
+        """
+        Drop all resident models.
+        """
+        with self._lock:
+            models = [model for model, _ in self._models.values()]
+            self._models.clear()
+        for model in models:
+            release_model_memory(model)
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Return the process-wide registry, creating it with the budget from the environment.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            budget_mb = os.environ.get(BUDGET_ENV_VAR)
+            budget_bytes = int(float(budget_mb) * 1024 * 1024) if budget_mb else None
+            _registry = ModelRegistry(budget_bytes=budget_bytes)
+        return _registry
@@ -4,31 +4,72 @@ File: whisper.py
 Implements the WhisperAdapter using OpenAI's Whisper model.
 Conforms to the TranscriberAdapter protocol.
 """
-from typing import Optional
-import whisper
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
 from pipeline.utils.retry import retry
 from pipeline.transcribers.adapters.base import TranscriberAdapter
+from pipeline.transcribers.adapters.registry import ModelRegistry, get_model_registry
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class WhisperAdapter(TranscriberAdapter):
     """
     Transcribes audio using a locally loaded Whisper model.
+
+    Model weights come from the process-wide ModelRegistry, so adapters for the same
+    (model_name, device, dtype) share one loaded model, and take turns running inference
+    on it. Pass a private registry to give an adapter its own model instead.
     """
-    def __init__(self, model_name: str = "base"):
+    def __init__(
+        self,
+        model_name: str = "base",
+        device: Optional[str] = None,
+        dtype: str = "float32",
+        registry: Optional[ModelRegistry] = None
+    ):
         """
-        Load the specified Whisper model variant.
+        Load (or reuse) the specified Whisper model variant.
         """
         self.model_name = model_name
-        # type: ignore[attr-defined]
-        self.model = whisper.load_model(model_name) # type: ignore[attr-defined]
+        self.device = device
+        self.dtype = dtype
+        self.registry = registry or get_model_registry()
+        # Load eagerly so configuration errors surface at construction time
+        self.model
+
+    @property
+    def model(self) -> Any:
+        """
+        The loaded Whisper model, reloaded through the registry if it was evicted.
+        """
+        return self.registry.get(self.model_name, self.device, self.dtype)
 
     @retry(max_attempts=3)
-    def transcribe(self, audio_path: str, language: Optional[str] = None) -> dict:
+    def transcribe(self, audio_path: Union[str, "np.ndarray"], language: Optional[str] = None) -> dict:
         """
-        Run transcription on the given audio file.
+        Run transcription on the given audio file (or decoded 16 kHz waveform).
+        Files are decoded with ffmpeg, or memory-mapped from the PCM cache when it is enabled.
         Returns a raw transcript dictionary.
         """
-        return self.model.transcribe(audio_path, language = language)
+        from pipeline.transcribers.audio import resolve_audio
+        audio = resolve_audio(audio_path)
+        with self.registry.inference_lock(self.model_name, self.device, self.dtype):
+            return self.model.transcribe(audio, language=language)
+
+    def transcribe_stream(self, audio_path: str, language: Optional[str] = None) -> Iterator[dict]:
+        """
+        Decode the audio once and yield raw segments window by window as they are transcribed.
+        Each window is retried on its own by transcribe().
+        """
+        from pipeline.transcribers.audio import load_audio_cached
+        from pipeline.transcribers.streaming import iter_window_segments
+
+        yield from iter_window_segments(
+            lambda audio, lang: self.transcribe(audio, language=lang),
+            load_audio_cached(audio_path),
+            language=language
+        )
 
     def get_engine_info(self) -> tuple[str, str]:
         """
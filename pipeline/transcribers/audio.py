@@ -0,0 +1,175 @@
+"""
+File: audio.py
+
+Audio decoding utilities for the transcription stage of the content-pipeline project.
+
+Decodes any ffmpeg-readable file to the 16 kHz mono float32 PCM that Whisper consumes,
+without importing Whisper or torch, so decode-only stages stay lightweight.
+
+Decoded PCM can optionally be cached as `.npy` files (CONTENT_PIPELINE_PCM_CACHE=1).
+Later loads memory-map the entry instead of running ffmpeg again, so retries, re-runs
+with another model, and worker processes reading the same file share one decode and one
+page-cache copy. Entries live in a cache directory (CONTENT_PIPELINE_PCM_CACHE_DIR,
+default ~/.cache/content-pipeline/pcm), never beside the inputs, keyed by the artifact's
+path, size and mtime. Uncompressed float32 PCM takes about 230 MB per hour of audio, so
+the directory is bounded by CONTENT_PIPELINE_PCM_CACHE_MAX_MB (default 2048) and the
+least recently used entries are evicted after each write.
+"""
+import hashlib
+import logging
+import os
+import subprocess
+import tempfile
+from contextlib import suppress
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from pipeline.utils.ffmpeg import ffmpeg_executable
+
+# Sample rate expected by Whisper models
+SAMPLE_RATE = 16000
+
+# Set to "1" to cache decoded PCM; by default every load runs ffmpeg and nothing is written
+PCM_CACHE_ENV_VAR = "CONTENT_PIPELINE_PCM_CACHE"
+PCM_CACHE_DIR_ENV_VAR = "CONTENT_PIPELINE_PCM_CACHE_DIR"
+PCM_CACHE_MAX_MB_ENV_VAR = "CONTENT_PIPELINE_PCM_CACHE_MAX_MB"
+DEFAULT_PCM_CACHE_MAX_MB = 2048
+
+def load_audio(audio_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode an audio or video file to a mono float32 waveform in [-1.0, 1.0].
+    Raises RuntimeError if ffmpeg cannot decode the file.
+    """
+    cmd = [
+        ffmpeg_executable(),
+        "-nostdin",
+        "-threads", "0",
+        "-i", audio_path,
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "-"
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode(errors='replace')}") from e
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+def pcm_cache_dir() -> str:
+    """
+    Resolve the PCM cache directory from the environment, falling back to the user cache dir.
+    """
+    if os.environ.get(PCM_CACHE_DIR_ENV_VAR):
+        return os.environ[PCM_CACHE_DIR_ENV_VAR]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "content-pipeline", "pcm")
+
+def pcm_cache_max_bytes() -> int:
+    """
+    Resolve the PCM cache size budget from the environment.
+    """
+    return int(float(os.environ.get(PCM_CACHE_MAX_MB_ENV_VAR, DEFAULT_PCM_CACHE_MAX_MB)) * 1024 * 1024)
+
+def pcm_cache_path(audio_path: str, sample_rate: int = SAMPLE_RATE) -> str:
+    """
+    Return the path of the decoded-PCM cache entry for an audio artifact.
+
+    The key covers the artifact's absolute path, size and mtime, so a modified file maps
+    to a new entry and the stale one ages out of the cache.
+    """
+    st = os.stat(audio_path)
+    source = f"{os.path.abspath(audio_path)}\0{st.st_size}\0{st.st_mtime_ns}\0{sample_rate}"
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return os.path.join(pcm_cache_dir(), key[:2], f"{key}.npy")
+
+def _pcm_cache_enabled() -> bool:
+    return os.environ.get(PCM_CACHE_ENV_VAR, "0") == "1"
+
+def _pcm_entries(cache_dir: str) -> List[Tuple[float, int, str]]:
+    """
+    Return (mtime, size, path) for every PCM cache entry, least recently used first.
+    """
+    entries = []
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if not name.endswith(".npy"):
+                continue
+            path = os.path.join(root, name)
+            with suppress(FileNotFoundError):
+                st = os.stat(path)
+                entries.append((st.st_mtime, st.st_size, path))
+    entries.sort()
+    return entries
+
+def prune_pcm_cache(max_bytes: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Evict least recently used PCM entries until the cache fits max_bytes.
+    Returns (entries removed, bytes freed).
+    """
+    max_bytes = pcm_cache_max_bytes() if max_bytes is None else max_bytes
+    entries = _pcm_entries(pcm_cache_dir())
+    total = sum(size for _, size, _ in entries)
+    removed = freed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        # Another process may have pruned it already; a reader holding a memory map keeps its data
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+            removed += 1
+            freed += size
+        total -= size
+    return removed, freed
+
+def load_audio_cached(audio_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Return the decoded waveform, memory-mapped from the PCM cache when it is enabled.
+
+    On a miss the file is decoded once, the entry is written atomically and the cache is
+    pruned to its budget; if the cache directory is not writable, the decoded array is
+    returned uncached. Hits refresh the entry's mtime for LRU eviction. The memory map is
+    copy-on-write, so callers may modify the array without touching the cache.
+    """
+    if not _pcm_cache_enabled():
+        return load_audio(audio_path, sample_rate)
+
+    cache_path = pcm_cache_path(audio_path, sample_rate)
+    try:
+        cached = np.load(cache_path, mmap_mode="c")
+        with suppress(OSError):
+            os.utime(cache_path)
+        return cached
+    except (OSError, ValueError):
+        pass
+
+    audio = load_audio(audio_path, sample_rate)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".npy.tmp")
+    except OSError as e:
+        logging.warning(f"[audio] Not caching decoded PCM for {audio_path}: {e}")
+        return audio
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    # A directory scan per write is cheap next to the ffmpeg decode that preceded it
+    prune_pcm_cache()
+    try:
+        return np.load(cache_path, mmap_mode="c")
+    except OSError:
+        # Evicted straight away because the entry alone exceeds the budget
+        return audio
+
+def resolve_audio(audio: Union[str, np.ndarray], sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Return a waveform for either a path (via the PCM cache) or an already decoded array.
+    """
+    if isinstance(audio, np.ndarray):
+        return audio
+    return load_audio_cached(audio, sample_rate)
@@ -0,0 +1,166 @@
+"""
+File: batch.py
+
+Batch transcription utilities for the content-pipeline project.
+
+Resolves many audio inputs (explicit paths, glob patterns, manifest files) and streams
+them through a single, already-loaded transcriber adapter so the model is loaded once
+per batch instead of once per file.
+"""
+import glob
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Literal, Optional, Set
+from pipeline.transcribers.adapters.base import TranscriberAdapter
+from pipeline.transcribers.normalize import normalize_transcript_v1
+from pipeline.transcribers.persistence import LocalFilePersistence, TranscriptPersistenceStrategy
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+
+@dataclass
+class BatchItemResult:
+    """
+    Outcome of transcribing a single file within a batch.
+    """
+    source: str
+    status: Literal["ok", "failed"]
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+@dataclass
+class BatchReport:
+    """
+    Aggregated results and throughput for a batch run.
+    """
+    results: List[BatchItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.status == "ok")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.status == "failed")
+
+    @property
+    def files_per_hour(self) -> float:
+        """
+        Successfully transcribed files per hour of wall-clock time.
+        """
+        return self.succeeded * 3600.0 / self.elapsed if self.elapsed > 0 else 0.0
+
+def read_manifest(manifest_path: str) -> List[str]:
+    """
+    Read audio paths from a manifest file.
+
+    Supports one path per line, or JSONL where each object carries a "path" or "source" key.
+    Blank lines and lines starting with '#' are ignored. Relative paths resolve against
+    the manifest's directory.
+    """
+    base_dir = Path(manifest_path).resolve().parent
+    paths = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+                path = entry.get("path") or entry.get("source")
+                if not path:
+                    raise ValueError(f"Manifest line {line_no} has no 'path' or 'source' key")
+            else:
+                path = line
+            paths.append(str(base_dir / path) if not os.path.isabs(path) else path)
+    return paths
+
+def resolve_audio_sources(
+    sources: Iterable[str] = (),
+    pattern: Optional[str] = None,
+    manifest: Optional[str] = None
+) -> List[str]:
+    """
+    Combine explicit sources, glob matches, and manifest entries into an ordered,
+    de-duplicated list of audio paths.
+    """
+    candidates = list(sources)
+    if pattern:
+        candidates.extend(sorted(glob.glob(pattern, recursive=True)))
+    if manifest:
+        candidates.extend(read_manifest(manifest))
+
+    seen: Set[str] = set()
+    resolved = []
+    for path in candidates:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            resolved.append(path)
+    return resolved
+
+def batch_output_name(source: str, used: Set[str], extension: str = ".json") -> str:
+    """
+    Return a unique transcript filename derived from the audio file's stem.
+    """
+    stem = Path(source).stem
+    name = f"{stem}{extension}"
+    suffix = 2
+    while name in used:
+        name = f"{stem}-{suffix}{extension}"
+        suffix += 1
+    used.add(name)
+    return name
+
+def transcribe_batch(
+    adapter: Optional[TranscriberAdapter],
+    sources: Iterable[str],
+    output_dir: str,
+    language: Optional[str] = None,
+    strategy: Optional[TranscriptPersistenceStrategy] = None,
+    on_result: Optional[Callable[[BatchItemResult], None]] = None,
+    transcribe_fn: Optional[Callable[[str, Optional[str]], TranscriptV1]] = None,
+    extension: str = ".json"
+) -> BatchReport:
+    """
+    Transcribe each source with the given adapter, normalize, and persist to output_dir.
+
+    Failures are recorded per file and do not stop the batch. `on_result` is invoked as
+    each file finishes so callers can report progress incrementally. `transcribe_fn`
+    replaces the adapter + normalize step (e.g. to submit jobs to the daemon).
+    `extension` names the output files and should match the strategy's format.
+    """
+    if transcribe_fn is None:
+        if adapter is None:
+            raise ValueError("transcribe_batch requires an adapter or a transcribe_fn")
+        transcribe_fn = lambda path, lang: normalize_transcript_v1(adapter.transcribe(path, language=lang), adapter, trusted=True)
+
+    strategy = strategy or LocalFilePersistence()
+    os.makedirs(output_dir, exist_ok=True)
+    report = BatchReport()
+    used_names: Set[str] = set()
+    batch_start = time.perf_counter()
+
+    for source in sources:
+        start = time.perf_counter()
+        output_path = os.path.join(output_dir, batch_output_name(source, used_names, extension))
+        try:
+            if not os.path.exists(source):
+                raise FileNotFoundError(f"Audio file not found: {source}")
+            transcript = transcribe_fn(source, language)
+            saved_path = strategy.persist(transcript, output_path)
+            result = BatchItemResult(source, "ok", output_path=saved_path)
+        except Exception as e:
+            logging.error(f"[transcribe_batch] Failed to transcribe {source}: {e}")
+            result = BatchItemResult(source, "failed", error=str(e))
+        result.seconds = time.perf_counter() - start
+        report.results.append(result)
+        if on_result:
+            on_result(result)
+
+    report.elapsed = time.perf_counter() - batch_start
+    return report
@@ -0,0 +1,283 @@
+"""
+File: cache.py
+
+Content-addressed transcript cache for the content-pipeline project.
+
+Normalized TranscriptV1 objects are stored on local disk under a key derived from the
+SHA-256 of the audio bytes, the engine name and version from get_engine_info(), the
+language hint, and any option that changes the output (e.g. VAD). Re-running the same
+audio - after a failure, from another team, or as a re-upload - returns the stored
+transcript without loading a model. The cache is bounded by size and evicts the least
+recently used entries; hit/miss counters are persisted next to the entries.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no flock; counters are then only serialized within this process
+    fcntl = None
+
+CACHE_DIR_ENV_VAR = "CONTENT_PIPELINE_CACHE_DIR"
+CACHE_MAX_MB_ENV_VAR = "CONTENT_PIPELINE_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 512
+
+STATS_FILE = "stats.json"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+_stats_lock = threading.Lock()
+
+@dataclass
+class CacheStats:
+    """
+    Snapshot of cache size and lifetime hit/miss counters.
+    """
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+@dataclass
+class PruneResult:
+    """
+    Entries and bytes removed by a prune.
+    """
+    removed: int
+    freed_bytes: int
+
+def default_cache_dir() -> str:
+    """
+    Resolve the cache directory from the environment, falling back to the user cache dir.
+    """
+    if os.environ.get(CACHE_DIR_ENV_VAR):
+        return os.environ[CACHE_DIR_ENV_VAR]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "content-pipeline", "transcripts")
+
+def default_max_bytes() -> int:
+    """
+    Resolve the cache size budget from the environment.
+    """
+    return int(float(os.environ.get(CACHE_MAX_MB_ENV_VAR, DEFAULT_MAX_MB)) * 1024 * 1024)
+
+def file_digest(path: str) -> str:
+    """
+    Return the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_key(audio_digest: str, engine: str, engine_version: str, language: Optional[str], options: str = "") -> str:
+    """
+    Derive the cache key for a transcription request.
+    """
+    parts = [audio_digest, engine, engine_version, language or "auto", options]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+@contextmanager
+def _exclusive(f) -> Iterator[None]:
+    """
+    Hold an exclusive lock on an open file: flock where available, else a process-local lock.
+    """
+    if fcntl is not None:
+        # Released when the file is closed
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+    else:
+        with _stats_lock:
+            yield
+
+class TranscriptCache:
+    """
+    Size-bounded, LRU transcript store on local disk.
+
+    Entries live at <cache_dir>/<key[:2]>/<key>.json. A hit refreshes the entry's mtime,
+    which is what eviction orders by, so the store is safe to share between processes.
+
+    put() keeps a running estimate of the cache size (one directory scan, then the sizes
+    it writes) and only scans and prunes once that estimate exceeds the budget. Entries
+    written by other processes are picked up at that scan.
+    """
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or default_cache_dir())
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size_bytes: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        """
+        Return (path, stat) for every stored entry, least recently used first.
+        """
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        return entries
+
+    def get(self, key: str) -> Optional[TranscriptV1]:
+        """
+        Return the cached transcript for a key, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                transcript = TranscriptV1.model_validate_json(f.read())
+            os.utime(path)
+        except FileNotFoundError:
+            transcript = None
+        except ValueError as e:
+            logging.warning(f"[cache] Discarding unreadable entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            transcript = None
+        self._record(hit=transcript is not None)
+        return transcript
+
+    def put(self, key: str, transcript: TranscriptV1) -> None:
+        """
+        Store a transcript atomically, evicting old entries once the cache outgrows its budget.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = transcript.model_dump_json().encode("utf-8")
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        with self._size_lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(stat.st_size for _, stat in self._entries())
+            else:
+                self._size_bytes += len(data) - replaced
+            over_budget = self._size_bytes > self.max_bytes
+        if over_budget:
+            self.prune()
+
+    def prune(self, max_bytes: Optional[int] = None) -> PruneResult:
+        """
+        Remove least recently used entries until the cache fits in max_bytes
+        (the configured budget by default; 0 empties the cache).
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        removed = freed = 0
+        for path, stat in entries:
+            if total <= budget:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            freed += stat.st_size
+            removed += 1
+        with self._size_lock:
+            self._size_bytes = total
+        if removed:
+            logging.info(f"[cache] Evicted {removed} entr{'y' if removed == 1 else 'ies'} ({freed} bytes)")
+        return PruneResult(removed=removed, freed_bytes=freed)
+
+    @contextmanager
+    def _locked_stats(self) -> Iterator[dict]:
+        """
+        Yield the persisted counters under an exclusive lock and write them back.
+        """
+        with open(self.cache_dir / STATS_FILE, "a+", encoding="utf-8") as f, _exclusive(f):
+            f.seek(0)
+            try:
+                counters = json.loads(f.read() or "{}")
+            except ValueError:
+                counters = {}
+            yield counters
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(counters))
+
+    def _record(self, hit: bool) -> None:
+        with self._locked_stats() as counters:
+            field = "hits" if hit else "misses"
+            counters[field] = counters.get(field, 0) + 1
+
+    def stats(self) -> CacheStats:
+        """
+        Return current size and lifetime hit/miss counters.
+        """
+        entries = self._entries()
+        with self._locked_stats() as counters:
+            hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return CacheStats(
+            entries=len(entries),
+            size_bytes=sum(stat.st_size for _, stat in entries),
+            max_bytes=self.max_bytes,
+            hits=hits,
+            misses=misses
+        )
+
+class CachedTranscriber:
+    """
+    Callable that serves transcripts from the cache and falls back to transcribe_fn.
+
+    `engine_info` must match what the underlying adapter reports from get_engine_info();
+    it is passed in so a hit never has to construct (and load) the adapter.
+    """
+    def __init__(
+        self,
+        transcribe_fn: Callable[[str, Optional[str]], TranscriptV1],
+        engine_info: Tuple[str, str],
+        cache: Optional[TranscriptCache] = None,
+        options: str = ""
+    ):
+        self.transcribe_fn = transcribe_fn
+        self.engine_info = engine_info
+        self.cache = cache or TranscriptCache()
+        self.options = options
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, audio_path: str, language: Optional[str] = None) -> TranscriptV1:
+        """
+        Return the transcript for an audio file, transcribing and storing it on a miss.
+        """
+        key = cache_key(file_digest(audio_path), *self.engine_info, language, self.options)
+        transcript = self.cache.get(key)
+        if transcript is not None:
+            self.hits += 1
+            logging.info(f"[cache] Hit for {audio_path}")
+            return transcript
+
+        self.misses += 1
+        transcript = self.transcribe_fn(audio_path, language)
+        self.cache.put(key, transcript)
+        return transcript
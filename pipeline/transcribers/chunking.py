@@ -0,0 +1,285 @@
+"""
+File: chunking.py
+
+Chunked parallel transcription for long audio in the content-pipeline project.
+
+Long recordings are decoded once, split at low-energy points into windows of
+configurable length (with a small overlap), and transcribed in a process pool. Each
+window's segments are shifted back onto the original timeline and overlaps are resolved
+by keeping, for every boundary, only the segments whose midpoint falls on each window's
+side of the cut. A failing window is retried on its own instead of restarting the file.
+If a worker process dies (OOM, a crash in torch), the pool is replaced and only the
+windows that had not finished are resubmitted.
+
+The decoded audio is placed in shared memory once per file; workers receive a small
+descriptor plus sample offsets and read their window without copying.
+"""
+import logging
+import os
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from pipeline.transcribers.adapters.base import TranscriberAdapter
+from pipeline.transcribers.audio import SAMPLE_RATE, load_audio_cached
+from pipeline.transcribers.shared_audio import SharedAudioBlock, SharedAudioDescriptor, call_with_shared_audio
+
+# Frame length used when searching for quiet split points
+ENERGY_FRAME_SECONDS = 0.05
+
+# Fresh pools to start after worker processes die, before a file is given up on
+MAX_POOL_RESTARTS = 2
+
+@dataclass
+class AudioWindow:
+    """
+    A slice of the decoded audio and the part of it whose segments are kept.
+
+    `start`/`end` are sample offsets of the slice (including overlap); `keep_start`/
+    `keep_end` are the cut points in seconds on the original timeline.
+    """
+    index: int
+    start: int
+    end: int
+    keep_start: float
+    keep_end: float
+
+    @property
+    def offset(self) -> float:
+        return self.start / SAMPLE_RATE
+
+def frame_energy(audio: np.ndarray, sample_rate: int = SAMPLE_RATE, frame_seconds: float = ENERGY_FRAME_SECONDS) -> np.ndarray:
+    """
+    Return the RMS energy of consecutive, non-overlapping frames.
+    """
+    frame = max(1, int(sample_rate * frame_seconds))
+    usable = len(audio) - len(audio) % frame
+    if usable == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:usable].reshape(-1, frame)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+def find_split_points(
+    audio: np.ndarray,
+    window_seconds: float,
+    search_seconds: float = 10.0,
+    sample_rate: int = SAMPLE_RATE
+) -> List[int]:
+    """
+    Return sample offsets of cut points near every multiple of window_seconds, each moved
+    to the quietest frame within +/- search_seconds of its target.
+    """
+    energy = frame_energy(audio, sample_rate)
+    frame = max(1, int(sample_rate * ENERGY_FRAME_SECONDS))
+    total_seconds = len(audio) / sample_rate
+    cuts = []
+    target = window_seconds
+    while target < total_seconds - search_seconds:
+        low = max(0, int((target - search_seconds) * sample_rate) // frame)
+        high = min(len(energy), int((target + search_seconds) * sample_rate) // frame + 1)
+        if cuts:
+            low = max(low, cuts[-1] // frame + 1)
+        if low >= high:
+            break
+        quietest = low + int(np.argmin(energy[low:high]))
+        cuts.append(quietest * frame)
+        target = quietest * frame / sample_rate + window_seconds
+    return cuts
+
+def plan_windows(
+    audio: np.ndarray,
+    window_seconds: float = 300.0,
+    overlap_seconds: float = 1.0,
+    search_seconds: float = 10.0,
+    sample_rate: int = SAMPLE_RATE
+) -> List[AudioWindow]:
+    """
+    Split audio into overlapping windows cut at low-energy points.
+    """
+    cuts = find_split_points(audio, window_seconds, search_seconds, sample_rate)
+    bounds = [0] + cuts + [len(audio)]
+    overlap = int(overlap_seconds * sample_rate)
+    windows = []
+    for index, (cut_start, cut_end) in enumerate(zip(bounds, bounds[1:])):
+        windows.append(AudioWindow(
+            index=index,
+            start=max(0, cut_start - overlap),
+            end=min(len(audio), cut_end + overlap),
+            keep_start=cut_start / sample_rate,
+            keep_end=cut_end / sample_rate if cut_end < len(audio) else float("inf")
+        ))
+    return windows
+
+def stitch_segments(windows: List[AudioWindow], results: List[dict]) -> List[dict]:
+    """
+    Shift each window's segments onto the original timeline and drop duplicates from overlaps.
+    """
+    stitched = []
+    for window, raw in zip(windows, results):
+        for segment in raw.get("segments", []):
+            shifted = dict(segment)
+            shifted["start"] = segment["start"] + window.offset
+            if "end" in segment:
+                shifted["end"] = segment["end"] + window.offset
+            midpoint = (shifted["start"] + shifted.get("end", shifted["start"])) / 2
+            if window.keep_start <= midpoint < window.keep_end:
+                stitched.append(shifted)
+    stitched.sort(key=lambda s: s["start"])
+    for segment_id, segment in enumerate(stitched):
+        segment["id"] = segment_id
+    return stitched
+
+def _whisper_adapter(model_name: str) -> TranscriberAdapter:
+    """
+    Build a WhisperAdapter inside a worker process.
+    """
+    from pipeline.transcribers.adapters.whisper import WhisperAdapter
+    return WhisperAdapter(model_name=model_name)
+
+# Per-process adapter, created once by the pool initializer
+_worker_adapter: Optional[TranscriberAdapter] = None
+
+def _init_worker(adapter_factory: Callable[[str], TranscriberAdapter], model_name: str, threads: int) -> None:
+    """
+    Load the model once per worker and cap intra-op threads to avoid oversubscription.
+    """
+    global _worker_adapter
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    _worker_adapter = adapter_factory(model_name)
+
+def _transcribe_window(descriptor: SharedAudioDescriptor, start: int, end: int, language: Optional[str]) -> dict:
+    """
+    Transcribe one window of the shared audio with the worker's adapter (whose
+    transcribe() retries on failure).
+    """
+    return call_with_shared_audio(descriptor, lambda audio: _worker_adapter.transcribe(audio, language=language), start, end)
+
+class ChunkedTranscriber(TranscriberAdapter):
+    """
+    Transcriber adapter that splits long audio into windows and transcribes them in parallel.
+
+    The process pool (one model per worker) is created lazily and reused across files
+    until close() is called.
+    """
+    def __init__(
+        self,
+        model_name: str = "base",
+        workers: Optional[int] = None,
+        window_seconds: float = 300.0,
+        overlap_seconds: float = 1.0,
+        search_seconds: float = 10.0,
+        adapter_factory: Callable[[str], TranscriberAdapter] = _whisper_adapter
+    ):
+        self.model_name = model_name
+        self.workers = workers or os.cpu_count() or 1
+        self.window_seconds = window_seconds
+        self.overlap_seconds = overlap_seconds
+        self.search_seconds = search_seconds
+        self.adapter_factory = adapter_factory
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.adapter_factory, self.model_name, threads)
+            )
+        return self._pool
+
+    def transcribe(self, audio_path: str, language: Optional[str] = None) -> dict:
+        """
+        Transcribe the file window by window and return a stitched raw transcript dictionary.
+        """
+        audio = load_audio_cached(audio_path)
+        windows = plan_windows(audio, self.window_seconds, self.overlap_seconds, self.search_seconds)
+        logging.info(f"[chunked] {audio_path}: {len(audio) / SAMPLE_RATE:.1f}s in {len(windows)} window(s)")
+
+        finished: Dict[int, dict] = {}
+        # The owner reference keeps the block alive for windows resubmitted after a crash
+        with SharedAudioBlock(audio) as block:
+            for restart in range(MAX_POOL_RESTARTS + 1):
+                pending = [window for window in windows if window.index not in finished]
+                futures = self._submit(block, pending, language)
+                wait(futures.values())
+                broken = None
+                for index, future in futures.items():
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        broken = error
+                    elif error is not None:
+                        raise error
+                    else:
+                        finished[index] = future.result()
+                if broken is None:
+                    break
+                # A dead worker breaks the whole pool; later files need a fresh one too
+                self.close(wait=False)
+                if restart == MAX_POOL_RESTARTS:
+                    raise broken
+                logging.warning(f"[chunked] Worker process died; resubmitting {len(windows) - len(finished)} window(s)")
+        results = [finished[window.index] for window in windows]
+
+        segments = stitch_segments(windows, results)
+        return {
+            "text": "".join(s.get("text", "") for s in segments),
+            "segments": segments,
+            "language": language or _majority_language(results),
+        }
+
+    def _submit(self, block: SharedAudioBlock, windows: List[AudioWindow], language: Optional[str]) -> Dict[int, Future]:
+        """
+        Submit windows to the pool, each holding a reference to the shared audio until it completes.
+        """
+        pool = self._get_pool()
+        futures = {}
+        for window in windows:
+            descriptor = block.acquire()
+            try:
+                future = pool.submit(_transcribe_window, descriptor, window.start, window.end, language)
+            except BrokenProcessPool as e:
+                # The pool died while windows were still being submitted
+                block.release()
+                future = Future()
+                future.set_exception(e)
+            except BaseException:
+                block.release()
+                raise
+            else:
+                future.add_done_callback(block.release)
+            futures[window.index] = future
+        return futures
+
+    def get_engine_info(self) -> Tuple[str, str]:
+        """
+        Return the engine name and model variant.
+        """
+        return ("whisper", self.model_name)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pool.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _majority_language(results: List[dict]) -> Optional[str]:
+    """
+    Return the language reported by most windows, if any.
+    """
+    languages = Counter(r.get("language") for r in results if r.get("language"))
+    return languages.most_common(1)[0][0] if languages else None
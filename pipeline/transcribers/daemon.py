@@ -0,0 +1,277 @@
+"""
+File: daemon.py
+
+Warm-model transcription daemon and client for the content-pipeline project.
+
+The server keeps one or more transcriber adapters resident and accepts jobs over a
+local Unix domain socket, so each job pays inference only instead of interpreter
+startup plus model load. The wire protocol is one JSON object per line:
+
+    request:  {"action": "transcribe", "audio_path": "...", "language": null, "model": "base"}
+    response: {"status": "ok", "transcript": {...TranscriptV1...}}
+              {"status": "error", "error": "..."}
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from dataclasses import asdict
+from typing import Callable, Dict, Iterable, Optional
+from pipeline.transcribers.adapters.base import TranscriberAdapter
+from pipeline.transcribers.adapters.registry import get_model_registry
+from pipeline.transcribers.normalize import normalize_transcript_v1
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+
+SOCKET_ENV_VAR = "CONTENT_PIPELINE_SOCKET"
+
+# Largest request line accepted by the server (requests are small JSON objects)
+MAX_REQUEST_BYTES = 64 * 1024
+
+AdapterFactory = Callable[[str], TranscriberAdapter]
+
+class DaemonUnavailableError(Exception):
+    """
+    Raised when no daemon is listening on the configured socket.
+    """
+
+class DaemonError(Exception):
+    """
+    Raised when the daemon accepted a job but reported a failure.
+    """
+
+def default_socket_path() -> str:
+    """
+    Resolve the daemon socket path from the environment, falling back to a per-user
+    path in the runtime or temp directory.
+    """
+    if os.environ.get(SOCKET_ENV_VAR):
+        return os.environ[SOCKET_ENV_VAR]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "content-pipeline.sock")
+    return os.path.join(tempfile.gettempdir(), f"content-pipeline-{os.getuid()}.sock")
+
+def _whisper_adapter_factory(model_name: str) -> TranscriberAdapter:
+    """
+    Build a WhisperAdapter, importing Whisper only when a model is actually loaded.
+    """
+    from pipeline.transcribers.adapters.whisper import WhisperAdapter
+    return WhisperAdapter(model_name=model_name)
+
+class _TranscriptionRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a single JSON request per connection.
+    """
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+            response = self.server.dispatch(request)
+        except Exception as e:
+            logging.error(f"[daemon] Request failed: {e}")
+            response = {"status": "error", "error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+class TranscriptionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server that keeps transcriber adapters loaded between jobs.
+
+    Inference on a given model is serialized by the model registry's inference lock,
+    which the Whisper adapter takes around each call; jobs for different models run
+    concurrently.
+    """
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        model_names: Iterable[str] = ("base",),
+        adapter_factory: Optional[AdapterFactory] = None
+    ):
+        """
+        Load the requested models and bind the socket, replacing a stale socket file.
+        """
+        self.socket_path = socket_path
+        self.adapter_factory = adapter_factory or _whisper_adapter_factory
+        self.adapters: Dict[str, TranscriberAdapter] = {}
+        self._adapters_lock = threading.Lock()
+        for model_name in model_names:
+            self._get_adapter(model_name)
+
+        if os.path.exists(socket_path):
+            _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _TranscriptionRequestHandler)
+
+    def server_bind(self):
+        """
+        Bind the socket owner-only, so it is never connectable by other users.
+        """
+        previous = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous)
+
+    def _get_adapter(self, model_name: str) -> TranscriberAdapter:
+        """
+        Return the resident adapter for a model, loading it on first use.
+        """
+        with self._adapters_lock:
+            if model_name not in self.adapters:
+                logging.info(f"[daemon] Loading model: {model_name}")
+                self.adapters[model_name] = self.adapter_factory(model_name)
+            return self.adapters[model_name]
+
+    def dispatch(self, request: dict) -> dict:
+        """
+        Execute a decoded request and return the response payload.
+        """
+        action = request.get("action")
+        if action == "ping":
+            return {"status": "ok", "models": sorted(self.adapters), "registry": asdict(get_model_registry().stats())}
+        if action != "transcribe":
+            raise ValueError(f"Unknown action: {action}")
+
+        audio_path = request["audio_path"]
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        model_name = request.get("model") or "base"
+        adapter = self._get_adapter(model_name)
+        raw_transcript = adapter.transcribe(audio_path, language=request.get("language"))
+        transcript = normalize_transcript_v1(raw_transcript, adapter, trusted=True)
+        logging.info(f"[daemon] Transcribed {audio_path} with {model_name}")
+        return {"status": "ok", "transcript": json.loads(transcript.model_dump_json())}
+
+    def server_close(self):
+        """
+        Close the listening socket and remove the socket file.
+        """
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a leftover socket file, refusing if another daemon is still listening on it.
+    """
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+def serve(
+    socket_path: Optional[str] = None,
+    model_names: Iterable[str] = ("base",),
+    adapter_factory: Optional[AdapterFactory] = None
+) -> None:
+    """
+    Run the transcription daemon in the foreground until interrupted.
+    """
+    socket_path = socket_path or default_socket_path()
+    with TranscriptionServer(socket_path, model_names, adapter_factory) as server:
+        logging.info(f"[daemon] Listening on {socket_path} with models: {', '.join(sorted(server.adapters))}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logging.info("[daemon] Shutting down")
+
+class DaemonClient:
+    """
+    Thin client that submits transcription jobs to a running daemon.
+    """
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Configure the socket path and an optional per-request timeout in seconds.
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def _request(self, payload: dict) -> dict:
+        """
+        Send one request and return the decoded response.
+        Raises DaemonUnavailableError if nothing is listening on the socket.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            try:
+                sock.connect(self.socket_path)
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                raise DaemonUnavailableError(f"No daemon listening on {self.socket_path}: {e}")
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        finally:
+            sock.close()
+        if not line:
+            raise DaemonError("Daemon closed the connection without a response")
+
+        response = json.loads(line)
+        if response.get("status") != "ok":
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response
+
+    def ping(self) -> bool:
+        """
+        Return True if a daemon is reachable on the socket.
+        """
+        try:
+            self._request({"action": "ping"})
+            return True
+        except DaemonUnavailableError:
+            return False
+
+    def transcribe(self, audio_path: str, language: Optional[str] = None, model: str = "base") -> TranscriptV1:
+        """
+        Transcribe an audio file on the daemon and return the normalized transcript.
+        """
+        response = self._request({
+            "action": "transcribe",
+            "audio_path": os.path.abspath(audio_path),
+            "language": language,
+            "model": model,
+        })
+        return TranscriptV1(**response["transcript"])
+
+class DaemonFallbackTranscriber:
+    """
+    Callable that prefers a running daemon and falls back to in-process transcription.
+
+    Once the daemon is found unavailable, later calls stay in-process and reuse the
+    locally loaded adapter.
+    """
+    def __init__(
+        self,
+        model_name: str = "base",
+        socket_path: Optional[str] = None,
+        adapter_factory: Optional[AdapterFactory] = None
+    ):
+        self.model_name = model_name
+        self.client = DaemonClient(socket_path)
+        self.adapter_factory = adapter_factory or _whisper_adapter_factory
+        self.adapter: Optional[TranscriberAdapter] = None
+        self.use_daemon = True
+
+    def __call__(self, audio_path: str, language: Optional[str] = None) -> TranscriptV1:
+        """
+        Transcribe an audio file and return the normalized transcript.
+        """
+        if self.use_daemon:
+            try:
+                return self.client.transcribe(audio_path, language=language, model=self.model_name)
+            except DaemonUnavailableError as e:
+                logging.warning(f"[daemon] {e}; transcribing in-process")
+                self.use_daemon = False
+
+        if self.adapter is None:
+            self.adapter = self.adapter_factory(self.model_name)
+        raw_transcript = self.adapter.transcribe(audio_path, language=language)
+        return normalize_transcript_v1(raw_transcript, self.adapter, trusted=True)
@@ -0,0 +1,216 @@
+"""
+File: formats.py
+
+Serialization formats for TranscriptV1 in the content-pipeline project.
+
+- json:         formatted JSON, indented for reading (the historical default)
+- json-compact: JSON without whitespace
+- jsonl:        one segment object per line and a {"metadata": ...} footer line, the
+                layout JsonlStreamPersistence writes
+- msgpack:      MessagePack encoding of the same document (requires `msgpack`)
+
+Compact JSON, JSONL and MessagePack also come gzip-compressed (json.gz, jsonl.gz,
+msgpack.gz) and zstd-compressed (json.zst, jsonl.zst, msgpack.zst; requires
+`zstandard`). decode_transcript() detects the format from the data itself (compression
+magic bytes, then the document layout), so readers never need to know how a
+transcript was written.
+
+Only the standard library is imported at module level, so the CLI can list the
+formats without loading pydantic.
+"""
+import gzip
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+
+DEFAULT_FORMAT = "json"
+TRANSCRIPT_FORMAT_NAMES: Tuple[str, ...] = (
+    "json", "json-compact", "jsonl", "msgpack",
+    "json.gz", "jsonl.gz", "msgpack.gz",
+    "json.zst", "jsonl.zst", "msgpack.zst",
+)
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+@dataclass(frozen=True)
+class TranscriptFormat:
+    """
+    A named transcript encoding with its file extension and content type.
+    """
+    name: str
+    extension: str
+    content_type: str
+    encode: Callable[["TranscriptV1"], bytes]
+    decode: Callable[[bytes], "TranscriptV1"]
+
+def _require(module: str, package: str, name: str) -> Any:
+    """
+    Import an optional dependency, naming the format that needs it if it is missing.
+    """
+    import importlib
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"The {name} transcript format requires the {package} package (pip install {package})") from None
+
+def _model() -> type:
+    from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+    return TranscriptV1
+
+def _encode_json(transcript: "TranscriptV1") -> bytes:
+    return transcript.model_dump_json(indent=2).encode("utf-8")
+
+def _encode_json_compact(transcript: "TranscriptV1") -> bytes:
+    return transcript.model_dump_json().encode("utf-8")
+
+def _decode_json(data: bytes) -> "TranscriptV1":
+    return _model().model_validate_json(data)
+
+def _encode_jsonl(transcript: "TranscriptV1") -> bytes:
+    lines = [segment.model_dump_json() for segment in transcript.transcript]
+    lines.append(json.dumps({"metadata": transcript.metadata.model_dump(mode="json")}))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def _decode_jsonl(data: bytes) -> "TranscriptV1":
+    """
+    Decode a complete JSONL transcript; raises ValueError if the metadata footer is missing.
+    """
+    segments = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        if "metadata" in entry:
+            return _model().model_validate({"metadata": entry["metadata"], "transcript": segments})
+        segments.append(entry)
+    raise ValueError("Incomplete JSONL transcript (no metadata footer)")
+
+def _encode_msgpack(transcript: "TranscriptV1") -> bytes:
+    msgpack = _require("msgpack", "msgpack", "msgpack")
+    return msgpack.packb(transcript.model_dump(mode="json"), use_bin_type=True)
+
+def _decode_msgpack(data: bytes) -> "TranscriptV1":
+    msgpack = _require("msgpack", "msgpack", "msgpack")
+    return _model().model_validate(msgpack.unpackb(data, raw=False))
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output identical for identical transcripts
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _zstd(data: bytes) -> bytes:
+    zstandard = _require("zstandard", "zstandard", "zstd")
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+def _unzstd(data: bytes) -> bytes:
+    zstandard = _require("zstandard", "zstandard", "zstd")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+_BASE_FORMATS: Dict[str, Tuple[str, str, Callable, Callable]] = {
+    "json": (".json", "application/json", _encode_json, _decode_json),
+    "json-compact": (".json", "application/json", _encode_json_compact, _decode_json),
+    "jsonl": (".jsonl", "application/x-ndjson", _encode_jsonl, _decode_jsonl),
+    "msgpack": (".msgpack", "application/msgpack", _encode_msgpack, _decode_msgpack),
+}
+
+# Compressed JSON variants use compact JSON: whitespace only costs compression time
+_CODECS: Dict[str, Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "gz": ("application/gzip", _gzip, gzip.decompress),
+    "zst": ("application/zstd", _zstd, _unzstd),
+}
+
+def _compressed(base: str, codec: str) -> TranscriptFormat:
+    extension, _, encode, decode = _BASE_FORMATS["json-compact" if base == "json" else base]
+    content_type, compress, decompress = _CODECS[codec]
+    return TranscriptFormat(
+        name=f"{base}.{codec}",
+        extension=f"{extension}.{codec}",
+        content_type=content_type,
+        encode=lambda transcript: compress(encode(transcript)),
+        decode=lambda data: decode(decompress(data)),
+    )
+
+TRANSCRIPT_FORMATS: Dict[str, TranscriptFormat] = {
+    name: TranscriptFormat(name, extension, content_type, encode, decode)
+    for name, (extension, content_type, encode, decode) in _BASE_FORMATS.items()
+}
+TRANSCRIPT_FORMATS.update({
+    f"{base}.{codec}": _compressed(base, codec)
+    for codec in _CODECS for base in ("json", "jsonl", "msgpack")
+})
+
+def get_format(name: str) -> TranscriptFormat:
+    """
+    Return the format registered under name; raises ValueError for unknown names.
+    """
+    try:
+        return TRANSCRIPT_FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown transcript format '{name}'. Choose from: {', '.join(TRANSCRIPT_FORMAT_NAMES)}") from None
+
+def encode_transcript(transcript: "TranscriptV1", format: str = DEFAULT_FORMAT) -> bytes:
+    """
+    Serialize a transcript in the named format.
+    """
+    return get_format(format).encode(transcript)
+
+def _layout(data: bytes) -> str:
+    """
+    Return the uncompressed layout of data: json, json-compact, jsonl or msgpack.
+    """
+    if data.lstrip()[:1] != b"{":
+        return "msgpack"
+    first_line, _, rest = data.lstrip().partition(b"\n")
+    if first_line.rstrip() == b"{":
+        return "json"
+    if rest.strip():
+        return "jsonl"
+    # A single line is compact JSON, or a JSONL transcript with no segments (footer only)
+    return "json-compact" if b'"transcript"' in first_line else "jsonl"
+
+def detect_format(data: bytes) -> str:
+    """
+    Return the name of the format data was written in.
+    """
+    if data[:2] == GZIP_MAGIC:
+        codec, data = "gz", gzip.decompress(data)
+    elif data[:4] == ZSTD_MAGIC:
+        codec, data = "zst", _unzstd(data)
+    else:
+        return _layout(data)
+    layout = _layout(data)
+    return f"{'json' if layout == 'json-compact' else layout}.{codec}"
+
+def decode_transcript(data: bytes, format: Optional[str] = None) -> "TranscriptV1":
+    """
+    Deserialize a transcript, detecting its format unless one is given.
+    """
+    if format is None:
+        codec = "gz" if data[:2] == GZIP_MAGIC else "zst" if data[:4] == ZSTD_MAGIC else None
+        if codec is not None:
+            data = _CODECS[codec][2](data)
+        return TRANSCRIPT_FORMATS[_layout(data)].decode(data)
+    return get_format(format).decode(data)
+
+def load_transcript(path: Union[str, Path]) -> "TranscriptV1":
+    """
+    Load a transcript file written in any supported format.
+    """
+    return decode_transcript(Path(path).read_bytes())
+
+def with_format_extension(path: Union[str, Path], format: str) -> str:
+    """
+    Replace a transcript path's format extension (.json, .jsonl.gz, ...) with the one for format.
+    """
+    path = str(path)
+    for extension in sorted({f.extension for f in TRANSCRIPT_FORMATS.values()}, key=len, reverse=True):
+        if path.endswith(extension):
+            path = path[:-len(extension)]
+            break
+    return path + get_format(format).extension
@@ -2,14 +2,27 @@
 File: normalize.py
 
 Provides normalization utilities to convert raw transcript output into TranscriptV1 format.
+
+The trusted mode is for raw output from the pipeline's own adapters: models are built
+with model_construct instead of re-validating fields this module generates (timestamps),
+timestamps are formatted for all segments at once with numpy, and confidences are
+gathered in the same pass that builds the segments.
 """
+from typing import List, Sequence
+import numpy as np
 from pipeline.transcribers.adapters.base import TranscriberAdapter
 from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1, TranscriptSegment, build_transcript_metadata
 
-def normalize_transcript_v1(raw: dict, adapter: TranscriberAdapter) -> TranscriptV1:
+def normalize_transcript_v1(raw: dict, adapter: TranscriberAdapter, trusted: bool = False) -> TranscriptV1:
     """
     Normalize a raw transcript dictionary into a TranscriptV1 object using adapter metadata.
+
+    With trusted=True, segment text must already be strings; confidences and start times
+    are still checked. The result equals the validated one, and raw transcripts the
+    validated path rejects raise ValueError (as do NaN or infinite starts).
     """
+    if trusted:
+        return _normalize_trusted(raw, adapter)
     engine, version = adapter.get_engine_info()
 
     # Aggregate confidence scores
@@ -35,6 +48,45 @@ def normalize_transcript_v1(raw: dict, adapter: TranscriberAdapter) -> Transcrip
 
     return TranscriptV1(metadata=metadata, transcript=segments)
 
+# Starts from here on format to an hour of 24 or more, which TranscriptSegment rejects
+_TIMESTAMP_LIMIT_SECONDS = 24 * 3600
+
+def _normalize_trusted(raw: dict, adapter: TranscriberAdapter) -> TranscriptV1:
+    """
+    normalize_transcript_v1 for trusted adapter output, without per-segment validation.
+    """
+    texts, starts, segment_confidences, confidences = [], [], [], []
+    for segment in raw.get("segments", []):
+        confidence = segment.get("confidence")
+        if confidence is not None:
+            # Match the float coercion validation would apply (ints, numpy scalars)
+            confidence = float(confidence)
+            if not 0.0 <= confidence <= 1.0:
+                raise ValueError("Confidence must be between 0.0 and 1.0")
+            confidences.append(confidence)
+        texts.append(segment["text"])
+        starts.append(segment["start"])
+        segment_confidences.append(confidence)
+    confidence_avg = round(sum(confidences) / len(confidences), 3) if confidences else None
+
+    engine, version = adapter.get_engine_info()
+    metadata = build_transcript_metadata(
+        engine=engine,
+        engine_version=version,
+        language=raw.get("language"),
+        confidence_avg=confidence_avg
+    )
+    timestamps = format_timestamps(starts)
+    # TranscriptSegment parses timestamps with strptime, whose %H stops at 23
+    if starts and max(starts) >= _TIMESTAMP_LIMIT_SECONDS:
+        raise ValueError("Timestamp must be in HH:MM:SS.mmm format")
+    construct = TranscriptSegment.model_construct
+    segments = [
+        construct(text=text, timestamp=timestamp, confidence=confidence)
+        for text, timestamp, confidence in zip(texts, timestamps, segment_confidences)
+    ]
+    return TranscriptV1.model_construct(metadata=metadata, transcript=segments)
+
 def format_timestamp(seconds: float) -> str:
     """
     Convert float seconds to HH:MM:SS.mmm format, clamping negatives to zero
@@ -46,4 +98,31 @@ def format_timestamp(seconds: float) -> str:
     s = int(seconds % 60)
     return f"{h:02}:{m:02}:{s:02}.{ms:03}"
 
+# Zero-padded field strings, so formatting a timestamp is four lookups
+_TWO_DIGITS = [f"{n:02}" for n in range(100)]
+_THREE_DIGITS = [f"{n:03}" for n in range(1000)]
+
+# Beyond this the int64 conversions overflow; such starts go through format_timestamp
+_MAX_VECTOR_SECONDS = 2.0 ** 62
 
+def format_timestamps(starts: Sequence[float]) -> List[str]:
+    """
+    Format many start times at once; element-wise identical to format_timestamp.
+    Raises ValueError if any start is NaN or infinite.
+    """
+    seconds = np.asarray(starts, dtype=np.float64)
+    if not np.isfinite(seconds).all():
+        raise ValueError("Segment start times must be finite")
+    if seconds.size and seconds.max() >= _MAX_VECTOR_SECONDS:
+        return [format_timestamp(start) for start in seconds.tolist()]
+    # Same float operations as format_timestamp
+    seconds = np.where(seconds > 0.0, seconds, 0.0)
+    ms = ((seconds - np.trunc(seconds)) * 1000).astype(np.int64).tolist()
+    h = (seconds // 3600).astype(np.int64).tolist()
+    m = ((seconds % 3600) // 60).astype(np.int64).tolist()
+    s = (seconds % 60).astype(np.int64).tolist()
+    two, three = _TWO_DIGITS, _THREE_DIGITS
+    return [
+        f"{two[h] if h < 100 else h}:{two[m]}:{two[s]}.{three[ms]}"
+        for h, m, s, ms in zip(h, m, s, ms)
+    ]
@@ -2,10 +2,30 @@
 File: persistence.py
 
 Defines persistence strategies for saving transcript objects to local or remote destinations.
-Includes protocol interfaces and concrete implementations.
+Includes protocol interfaces and concrete implementations; CloudPersistence uploads to
+object storage through a background UploadQueue.
+
+Local files are written to a temporary file in the destination directory and published
+with an atomic rename, so a crash never leaves a truncated transcript at the final path.
+WriteBehindPersistence does this on a background thread, grouping the fsyncs of each
+batch of queued transcripts. Transcripts are encoded in any format from formats.py
+(formatted JSON by default).
 """
-from typing import Protocol, Union
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, Union
 from pathlib import Path
+from pipeline.transcribers.formats import DEFAULT_FORMAT, decode_transcript, encode_transcript, get_format
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptMetadata, TranscriptSegment, TranscriptV1
+
+if TYPE_CHECKING:
+    from pipeline.utils.uploads import UploadQueue, UploadStats
 
 class SerializableTranscript(Protocol):
     """
@@ -21,24 +41,315 @@ class TranscriptPersistenceStrategy(Protocol):
     def persist(self, transcript: SerializableTranscript, destination: Union[str, Path]) -> str:
         ...
 
+class PersistenceError(RuntimeError):
+    """
+    Raised by WriteBehindPersistence.flush() when queued writes failed.
+    """
+    def __init__(self, failures: List[Tuple[str, Exception]]):
+        details = "; ".join(f"{path}: {error}" for path, error in failures[:5])
+        super().__init__(f"{len(failures)} transcript write(s) failed: {details}")
+        self.failures = failures
+
+def _write_temp(path: Path, data: bytes) -> str:
+    """
+    Write data to a new temporary file next to path and return its name.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+def _fsync_path(path: Union[str, Path], directory: bool = False) -> None:
+    fd = os.open(path, os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0))
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems (and Windows directories) do not support fsync on directories
+        if not directory:
+            raise
+    finally:
+        os.close(fd)
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Durably replace path with data: temp file, fsync, rename, fsync of the directory.
+    """
+    tmp_path = _write_temp(path, data)
+    try:
+        _fsync_path(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    _fsync_path(path.parent, directory=True)
+
 class LocalFilePersistence:
     """
-    Persists a transcript object to a local JSON file.
+    Persists a transcript object to a local file, as formatted JSON unless another format is given.
     """
+    def __init__(self, format: str = DEFAULT_FORMAT):
+        self.format = get_format(format).name
+
     def persist(self, transcript: SerializableTranscript, destination: Union[str, Path]) -> str:
         """
-        Write the transcript to a local file as formatted JSON.
+        Write the transcript to a local file, replacing it atomically.
         Returns the path to the saved file.
         """
         path = Path(destination)
-        with open(path, "w") as f:
-            f.write(transcript.model_dump_json(indent=2))
+        _write_atomic(path, encode_transcript(transcript, self.format))
         return str(path)
 
+class WriteBehindPersistence:
+    """
+    Persists transcripts to local files from a background writer thread.
+
+    persist() serializes the transcript on the caller's thread, queues the write and
+    returns the destination path at once, so a transcription worker can move on while the
+    file is still being written; the file is in place once flush() returns (or once the
+    future from submit() resolves). The writer takes up to `batch_size` queued transcripts at a time, writes
+    each to a temporary file, fsyncs them together, publishes them with atomic renames
+    and fsyncs each affected directory once. The queue holds at most `max_pending`
+    transcripts; persist() blocks while it is full.
+
+    flush() waits for every queued write and raises PersistenceError if any failed;
+    close() flushes and stops the writer.
+    """
+    def __init__(self, max_pending: int = 64, batch_size: int = 32, format: str = DEFAULT_FORMAT):
+        self.batch_size = batch_size
+        self.format = get_format(format).name
+        self._queue: "queue.Queue[Optional[Tuple[Path, bytes, Future]]]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._failures: List[Tuple[str, Exception]] = []
+        self._written = 0
+        self._closed = False
+        self._writer = threading.Thread(target=self._work, name="write-behind", daemon=True)
+        self._writer.start()
+
+    def persist(self, transcript: SerializableTranscript, destination: Union[str, Path]) -> str:
+        """
+        Queue the transcript to be written. Returns the destination path.
+        """
+        self.submit(transcript, destination)
+        return str(Path(destination))
+
+    def submit(self, transcript: SerializableTranscript, destination: Union[str, Path]) -> Future:
+        """
+        Queue the transcript's write; the future resolves to the path once it is durable.
+        """
+        if self._closed:
+            raise RuntimeError("WriteBehindPersistence is closed")
+        future: Future = Future()
+        # Running futures cannot be cancelled, so the writer can always resolve them
+        future.set_running_or_notify_cancel()
+        data = encode_transcript(transcript, self.format)
+        self._queue.put((Path(destination), data, future))
+        return future
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in batch if item is not None]
+            try:
+                if writes:
+                    self._write_batch(writes)
+            except Exception as e:
+                # Keep the writer alive: fail whatever this batch left unresolved
+                for path, _, future in writes:
+                    if not future.done():
+                        self._fail(path, e, future)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _write_batch(self, writes: List[Tuple[Path, bytes, Future]]) -> None:
+        """
+        Write, fsync, rename, then fsync directories for one batch, in that order, so
+        the renamed files always hold complete data.
+        """
+        staged: List[Tuple[Path, str, Future]] = []
+        for path, data, future in writes:
+            try:
+                staged.append((path, _write_temp(path, data), future))
+            except Exception as e:
+                self._fail(path, e, future)
+        synced: List[Tuple[Path, str, Future]] = []
+        for path, tmp_path, future in staged:
+            try:
+                _fsync_path(tmp_path)
+            except Exception as e:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+                self._fail(path, e, future)
+                continue
+            synced.append((path, tmp_path, future))
+        published: Dict[Path, List[Tuple[Path, Future]]] = {}
+        for path, tmp_path, future in synced:
+            try:
+                os.replace(tmp_path, path)
+            except Exception as e:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+                self._fail(path, e, future)
+                continue
+            published.setdefault(path.parent, []).append((path, future))
+        for directory, files in published.items():
+            try:
+                _fsync_path(directory, directory=True)
+            except Exception as e:
+                for path, future in files:
+                    self._fail(path, e, future)
+                continue
+            with self._lock:
+                self._written += len(files)
+            for path, future in files:
+                future.set_result(str(path))
+
+    def _fail(self, path: Path, error: Exception, future: Future) -> None:
+        logging.error(f"[persistence] Failed to write {path}: {error}")
+        with self._lock:
+            self._failures.append((str(path), error))
+        future.set_exception(error)
+
+    def flush(self) -> int:
+        """
+        Wait until every queued transcript is written and durable.
+
+        Returns the number of files written since the previous flush, or raises
+        PersistenceError if any of those writes failed.
+        """
+        self._queue.join()
+        with self._lock:
+            written, self._written = self._written, 0
+            failures, self._failures = self._failures, []
+        if failures:
+            raise PersistenceError(failures)
+        return written
+
+    def close(self) -> int:
+        """
+        Flush queued writes and stop the writer thread.
+        """
+        if self._closed:
+            return 0
+        try:
+            return self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._writer.join()
+
+    def __enter__(self) -> "WriteBehindPersistence":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class JsonlStreamPersistence:
+    """
+    Persists a transcript as JSON Lines: one TranscriptSegment object per line, followed
+    by a {"metadata": {...}} footer line once transcription has finished.
+
+    Each line is flushed as soon as it is written, so a partially written file still
+    holds every segment produced before an interruption.
+    """
+    def persist_stream(
+        self,
+        segments: Iterable[TranscriptSegment],
+        metadata_fn: Callable[[], TranscriptMetadata],
+        destination: Union[str, Path]
+    ) -> str:
+        """
+        Append segments as they arrive, then write the metadata footer.
+        Returns the path to the saved file.
+        """
+        path = Path(destination)
+        with open(path, "w", encoding="utf-8") as f:
+            for segment in segments:
+                f.write(segment.model_dump_json() + "\n")
+                f.flush()
+            f.write(json.dumps({"metadata": json.loads(metadata_fn().model_dump_json())}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return str(path)
+
+    def persist(self, transcript: SerializableTranscript, destination: Union[str, Path]) -> str:
+        """
+        Write a complete transcript in the JSONL layout.
+        """
+        return self.persist_stream(transcript.transcript, lambda: transcript.metadata, destination)
+
+def iter_jsonl_segments(path: Union[str, Path]) -> Iterator[TranscriptSegment]:
+    """
+    Yield the segments of a JSONL transcript, including one that is still being written.
+    A truncated trailing line (from an interrupted write) is ignored.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            entry = json.loads(line)
+            if "metadata" in entry:
+                break
+            yield TranscriptSegment(**entry)
+
+def load_jsonl_transcript(path: Union[str, Path]) -> TranscriptV1:
+    """
+    Load a completed JSONL transcript into a TranscriptV1 object.
+    Raises ValueError if the metadata footer is missing (transcription did not finish).
+    """
+    try:
+        return decode_transcript(Path(path).read_bytes(), "jsonl")
+    except ValueError as e:
+        raise ValueError(f"{e}: {path}") from e
+
 class CloudPersistence:
     """
-    Stub implementation for uploading transcripts to a cloud destination.
+    Uploads transcripts and other artifacts to object storage (s3://, gs:// or https URLs)
+    in the background.
+
+    persist() serializes the transcript and queues its upload, returning as soon as it is
+    queued, so the transcription loop does not wait on the network. Artifacts such as
+    audio and metadata files are queued with persist_file(). flush() (or close()) waits
+    for all queued uploads and raises UploadError if any failed.
     """
+    def __init__(self, uploads: Optional["UploadQueue"] = None, format: str = DEFAULT_FORMAT, **queue_options):
+        from pipeline.utils.uploads import UploadQueue
+        self.format = get_format(format)
+        self.uploads = uploads or UploadQueue(**queue_options)
+
     def persist(self, transcript: SerializableTranscript, destination: str) -> str:
-        # Upload to cloud
-        return destination  # e.g., S3 URL
+        """
+        Queue the transcript's upload in this strategy's format. Returns the destination URL.
+        """
+        data = self.format.encode(transcript)
+        self.uploads.put_bytes(data, destination, content_type=self.format.content_type)
+        return destination
+
+    def persist_file(self, path: Union[str, Path], destination: str, content_type: Optional[str] = None) -> str:
+        """
+        Queue the upload of a local file (audio, metadata). Returns the destination URL.
+        """
+        self.uploads.put_file(path, destination, content_type)
+        return destination
+
+    def flush(self) -> "UploadStats":
+        """
+        Wait for queued uploads; returns their throughput statistics.
+        """
+        return self.uploads.flush()
+
+    def close(self) -> "UploadStats":
+        return self.uploads.close()
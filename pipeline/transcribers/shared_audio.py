@@ -0,0 +1,104 @@
+"""
+File: shared_audio.py
+
+Zero-copy audio handoff between processes for the transcription stage of the
+content-pipeline project.
+
+The decoding process copies PCM into a named `multiprocessing.shared_memory` block once;
+workers receive only a small SharedAudioDescriptor and map the block as a NumPy view
+instead of unpickling a multi-hundred-MB array. The creating process owns the block and
+reference-counts the jobs using it: each job acquires before submission and releases when
+its future completes (successfully, with an error, or because the worker died), and the
+block is unlinked when the last reference goes. If the owning process itself dies, the
+multiprocessing resource tracker it shares with its workers unlinks the block.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Optional, TypeVar
+import numpy as np
+from pipeline.transcribers.audio import SAMPLE_RATE
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class SharedAudioDescriptor:
+    """
+    Picklable handle to PCM audio held in a shared memory block.
+    """
+    name: str
+    dtype: str
+    length: int
+    sample_rate: int = SAMPLE_RATE
+
+class SharedAudioBlock:
+    """
+    Owner-side shared memory block holding one waveform.
+
+    The owner holds one reference from creation; release() it once no more jobs will be
+    submitted. Jobs acquire()/release() around their lifetime, and the block is unlinked
+    when the count reaches zero.
+    """
+    def __init__(self, audio: np.ndarray, sample_rate: int = SAMPLE_RATE):
+        """
+        Copy the waveform into a new shared memory block.
+        """
+        audio = np.ascontiguousarray(audio)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        np.ndarray(audio.shape, dtype=audio.dtype, buffer=self._shm.buf)[:] = audio
+        self.descriptor = SharedAudioDescriptor(self._shm.name, audio.dtype.str, len(audio), sample_rate)
+        self._refs = 1
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self._refs == 0
+
+    def acquire(self) -> SharedAudioDescriptor:
+        """
+        Take a reference for a job and return the descriptor to send to it.
+        """
+        with self._lock:
+            if self._refs == 0:
+                raise RuntimeError(f"Shared audio block {self.descriptor.name} was already released")
+            self._refs += 1
+            return self.descriptor
+
+    def release(self, *_) -> None:
+        """
+        Drop a reference, unlinking the block when none remain.
+        Accepts and ignores extra arguments so it can be used as a future done-callback.
+        """
+        with self._lock:
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs:
+                return
+        self._shm.close()
+        self._shm.unlink()
+        logging.debug(f"[shared_audio] Unlinked {self.descriptor.name}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+def call_with_shared_audio(descriptor: SharedAudioDescriptor, func: Callable[[np.ndarray], T], start: int = 0, end: Optional[int] = None) -> T:
+    """
+    Map a shared audio block without copying and call func with the [start:end] view.
+
+    The view is only valid during the call. The worker's mapping is closed afterwards;
+    unlinking stays with the owner.
+    """
+    shm = shared_memory.SharedMemory(name=descriptor.name)
+    try:
+        return func(np.ndarray((descriptor.length,), dtype=np.dtype(descriptor.dtype), buffer=shm.buf)[start:end])
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # A view outlived the call (e.g. held by an exception traceback); it is unmapped with it
+            logging.debug(f"[shared_audio] {descriptor.name} still referenced; leaving mapping open")
@@ -0,0 +1,114 @@
+"""
+File: streaming.py
+
+Incremental transcription output for the content-pipeline project.
+
+Audio is decoded once and transcribed window by window; each window's segments are
+shifted onto the original timeline, normalized to TranscriptSegment, and handed to the
+caller immediately. Paired with JsonlStreamPersistence, a transcript is written one
+segment per line as inference progresses, so a crash near the end keeps everything
+already produced and downstream consumers can start reading after the first window.
+"""
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+import numpy as np
+from pipeline.transcribers.adapters.base import StreamingTranscriberAdapter, TranscriberAdapter
+from pipeline.transcribers.chunking import plan_windows, stitch_segments
+from pipeline.transcribers.normalize import format_timestamp
+from pipeline.transcribers.persistence import JsonlStreamPersistence
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptMetadata, TranscriptSegment, build_transcript_metadata
+
+# Whisper decodes 30-second windows natively, so shorter windows gain nothing
+STREAM_WINDOW_SECONDS = 30.0
+
+def iter_window_segments(
+    transcribe_fn: Callable[[np.ndarray, Optional[str]], dict],
+    audio: np.ndarray,
+    language: Optional[str] = None,
+    window_seconds: float = STREAM_WINDOW_SECONDS,
+    overlap_seconds: float = 1.0,
+    search_seconds: float = 5.0
+) -> Iterator[dict]:
+    """
+    Transcribe audio window by window and yield raw segments on the original timeline.
+
+    The language detected in the first window is reused for the rest of the file.
+    """
+    windows = plan_windows(audio, window_seconds, overlap_seconds, search_seconds)
+    segment_id = 0
+    for window in windows:
+        raw = transcribe_fn(audio[window.start:window.end], language)
+        language = language or raw.get("language")
+        for segment in stitch_segments([window], [raw]):
+            segment["id"] = segment_id
+            segment["language"] = language
+            segment_id += 1
+            yield segment
+
+class StreamingNormalizer:
+    """
+    Converts raw segments to TranscriptSegment one at a time and builds the metadata
+    footer from what it has seen once the stream ends.
+    """
+    def __init__(self, adapter: TranscriberAdapter, language: Optional[str] = None):
+        self.adapter = adapter
+        self.language = language
+        self._confidences: List[float] = []
+
+    def normalize(self, segment: dict) -> TranscriptSegment:
+        """
+        Normalize a single raw segment, recording its confidence and language.
+        """
+        if segment.get("confidence") is not None:
+            self._confidences.append(segment["confidence"])
+        self.language = self.language or segment.get("language")
+        return TranscriptSegment(
+            text=segment["text"],
+            timestamp=format_timestamp(segment["start"]),
+            confidence=segment.get("confidence", None)
+        )
+
+    def normalize_stream(self, segments: Iterable[dict]) -> Iterator[TranscriptSegment]:
+        """
+        Lazily normalize a stream of raw segments.
+        """
+        for segment in segments:
+            yield self.normalize(segment)
+
+    def metadata(self) -> TranscriptMetadata:
+        """
+        Build transcript metadata from the segments normalized so far.
+        """
+        engine, version = self.adapter.get_engine_info()
+        confidence_avg = round(sum(self._confidences) / len(self._confidences), 3) if self._confidences else None
+        return build_transcript_metadata(
+            engine=engine,
+            engine_version=version,
+            language=self.language,
+            confidence_avg=confidence_avg
+        )
+
+def transcribe_to_jsonl(
+    adapter: StreamingTranscriberAdapter,
+    audio_path: str,
+    destination: Union[str, Path],
+    language: Optional[str] = None,
+    strategy: Optional[JsonlStreamPersistence] = None
+) -> str:
+    """
+    Stream a transcription into a JSONL file, one segment per line plus a metadata footer.
+    Returns the path to the saved file.
+    """
+    strategy = strategy or JsonlStreamPersistence()
+    normalizer = StreamingNormalizer(adapter, language)
+    start = time.perf_counter()
+
+    def timed_segments():
+        for index, segment in enumerate(normalizer.normalize_stream(adapter.transcribe_stream(audio_path, language=language))):
+            if index == 0:
+                logging.info(f"[stream] First segment after {time.perf_counter() - start:.1f}s")
+            yield segment
+
+    return strategy.persist_stream(timed_segments(), normalizer.metadata, destination)
@@ -0,0 +1,196 @@
+"""
+File: vad.py
+
+Energy-based voice-activity detection for the transcription stage of the content-pipeline project.
+
+Computes per-frame energy and zero-crossing rate over decoded 16 kHz PCM with vectorized
+NumPy, keeps only speech regions, and records an offset map so timestamps produced on
+the compacted audio can be mapped back to the original timeline. Long silences, intros,
+and low-level music beds are dropped before inference, which saves compute and avoids
+Whisper hallucinating text over non-speech.
+"""
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import numpy as np
+from pipeline.transcribers.adapters.base import TranscriberAdapter
+from pipeline.transcribers.audio import SAMPLE_RATE, load_audio_cached
+
+@dataclass
+class VadConfig:
+    """
+    Tuning parameters for speech detection.
+
+    Frames are speech when their energy is within `dynamic_range_db` of the loudest frames
+    and above `noise_margin_db` over the noise floor, and their zero-crossing rate stays
+    below `max_zcr` (broadband hiss crosses zero on most samples).
+    """
+    frame_seconds: float = 0.03
+    noise_margin_db: float = 12.0
+    dynamic_range_db: float = 45.0
+    min_energy_db: float = -55.0
+    max_zcr: float = 0.35
+    min_speech_seconds: float = 0.25
+    min_silence_seconds: float = 0.6
+    padding_seconds: float = 0.2
+
+class OffsetMap:
+    """
+    Piecewise mapping from compacted (speech-only) time back to original time.
+    """
+    def __init__(self, spans: List[Tuple[int, int]], sample_rate: int = SAMPLE_RATE):
+        """
+        Build the map from kept (start, end) sample spans in original order.
+        """
+        lengths = np.array([end - start for start, end in spans], dtype=np.int64)
+        self.original_starts = np.array([start for start, _ in spans], dtype=np.float64) / sample_rate
+        self.compact_starts = (np.cumsum(lengths) - lengths).astype(np.float64) / sample_rate
+
+    def to_original(self, seconds: float, is_end: bool = False) -> float:
+        """
+        Map a compacted timestamp to the original timeline.
+
+        End timestamps that fall exactly on a region boundary stay in the earlier region.
+        """
+        if len(self.compact_starts) == 0:
+            return seconds
+        side = "left" if is_end else "right"
+        index = max(0, int(np.searchsorted(self.compact_starts, seconds, side=side)) - 1)
+        return float(self.original_starts[index] + (seconds - self.compact_starts[index]))
+
+@dataclass
+class VadResult:
+    """
+    Speech-only audio plus the information needed to restore original timestamps.
+    """
+    audio: np.ndarray
+    spans: List[Tuple[int, int]]
+    offset_map: OffsetMap
+    total_seconds: float
+    skipped_seconds: float
+
+def _frame_features(audio: np.ndarray, frame: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return per-frame energy (dB) and zero-crossing rate for non-overlapping frames.
+    """
+    usable = len(audio) - len(audio) % frame
+    frames = audio[:usable].reshape(-1, frame)
+    energy_db = 10.0 * np.log10(np.mean(np.square(frames, dtype=np.float32), axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame - 1)
+    return energy_db, zcr
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    """
+    Return (start, end) frame indices of consecutive True runs.
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return edges.reshape(-1, 2)
+
+def detect_speech(audio: np.ndarray, sample_rate: int = SAMPLE_RATE, config: Optional[VadConfig] = None) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) sample spans of detected speech, padded and merged.
+    """
+    config = config or VadConfig()
+    frame = max(2, int(sample_rate * config.frame_seconds))
+    if len(audio) < frame:
+        return [(0, len(audio))] if len(audio) else []
+
+    energy_db, zcr = _frame_features(audio, frame)
+    noise_floor = np.percentile(energy_db, 10)
+    peak = np.percentile(energy_db, 99)
+    threshold = max(noise_floor + config.noise_margin_db, peak - config.dynamic_range_db, config.min_energy_db)
+    active = (energy_db > threshold) & (zcr < config.max_zcr)
+
+    # Bridge short pauses inside speech, then drop isolated blips
+    min_silence = int(config.min_silence_seconds / config.frame_seconds)
+    for start, end in _runs(~active):
+        if 0 < start and end < len(active) and end - start < min_silence:
+            active[start:end] = True
+    min_speech = int(config.min_speech_seconds / config.frame_seconds)
+    spans = [(start, end) for start, end in _runs(active) if end - start >= min_speech]
+
+    padding = int(config.padding_seconds * sample_rate)
+    merged: List[Tuple[int, int]] = []
+    for start, end in spans:
+        start = max(0, start * frame - padding)
+        end = min(len(audio), end * frame + padding)
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def apply_vad(audio: np.ndarray, sample_rate: int = SAMPLE_RATE, config: Optional[VadConfig] = None) -> VadResult:
+    """
+    Drop non-speech regions and return the compacted audio with its offset map.
+    """
+    spans = detect_speech(audio, sample_rate, config)
+    compacted = np.concatenate([audio[start:end] for start, end in spans]) if spans else audio[:0]
+    total_seconds = len(audio) / sample_rate
+    return VadResult(
+        audio=compacted,
+        spans=spans,
+        offset_map=OffsetMap(spans, sample_rate),
+        total_seconds=total_seconds,
+        skipped_seconds=total_seconds - len(compacted) / sample_rate
+    )
+
+class VadTranscriber(TranscriberAdapter):
+    """
+    Transcriber adapter that runs voice-activity detection before delegating to another adapter.
+
+    The wrapped adapter must accept a decoded 16 kHz float32 array (as WhisperAdapter does).
+    Segment times are mapped back to the original timeline, and the raw transcript carries
+    a "vad" entry with the total and skipped seconds.
+    """
+    def __init__(self, adapter: TranscriberAdapter, config: Optional[VadConfig] = None):
+        self.adapter = adapter
+        self.config = config or VadConfig()
+        self.skipped_seconds = 0.0
+        self.total_seconds = 0.0
+
+    def transcribe(self, audio_path: str, language: Optional[str] = None) -> dict:
+        """
+        Transcribe only the speech regions of the file and return a raw transcript dictionary.
+        """
+        result = apply_vad(load_audio_cached(audio_path), SAMPLE_RATE, self.config)
+        self.skipped_seconds += result.skipped_seconds
+        self.total_seconds += result.total_seconds
+        logging.info(
+            f"[vad] {audio_path}: skipped {result.skipped_seconds:.1f}s of "
+            f"{result.total_seconds:.1f}s ({len(result.spans)} speech region(s))"
+        )
+
+        if len(result.audio) == 0:
+            raw = {"text": "", "segments": [], "language": language}
+        else:
+            raw = dict(self.adapter.transcribe(result.audio, language=language))
+            raw["segments"] = [self._restore(segment, result.offset_map) for segment in raw.get("segments", [])]
+        raw["vad"] = {"total_seconds": result.total_seconds, "skipped_seconds": result.skipped_seconds}
+        return raw
+
+    @staticmethod
+    def _restore(segment: dict, offset_map: OffsetMap) -> dict:
+        """
+        Return a copy of a segment with start/end mapped to the original timeline.
+        """
+        restored = dict(segment)
+        restored["start"] = offset_map.to_original(segment["start"])
+        if "end" in segment:
+            restored["end"] = offset_map.to_original(segment["end"], is_end=True)
+        return restored
+
+    def get_engine_info(self) -> Tuple[str, str]:
+        """
+        Return the wrapped adapter's engine name and version.
+        """
+        return self.adapter.get_engine_info()
+
+    def close(self) -> None:
+        """
+        Release the wrapped adapter's resources when supported.
+        """
+        close = getattr(self.adapter, "close", None)
+        if close:
+            close()
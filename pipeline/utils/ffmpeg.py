@@ -0,0 +1,24 @@
+"""
+File: ffmpeg.py
+
+Helpers for locating and invoking the ffmpeg binary in the content-pipeline project.
+
+Prefers an ffmpeg on PATH (as Whisper does) and falls back to the binary bundled with
+imageio-ffmpeg, which is installed alongside moviepy.
+"""
+import shutil
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def ffmpeg_executable() -> str:
+    """
+    Return the path of an ffmpeg executable or raise RuntimeError if none is available.
+    """
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception as e:
+        raise RuntimeError(f"ffmpeg executable not found on PATH or via imageio-ffmpeg: {e}")
@@ -0,0 +1,402 @@
+"""
+File: object_storage.py
+
+Pooled HTTP client for S3-compatible object storage in the content-pipeline project.
+
+Resolves s3://, gs:// and https storage URLs to HTTP locations and keeps keep-alive
+http.client connections per host, so consecutive requests (ranged reads of one object,
+uploads of many) skip the TCP and TLS handshakes. Objects are read as a sequence of
+ranged GETs pinned to the object's ETag: a connection dropped mid-range resumes from
+the last byte received, and an object replaced while it is being read fails instead
+of mixing versions.
+
+Writes use PUT for small objects and the S3 multipart API (create, upload parts,
+complete or abort) for large ones.
+
+s3:// sources, and URLs on the configured S3 endpoint, are signed with SigV4 when AWS
+credentials are available; other sources must be public or presigned. Set
+CONTENT_PIPELINE_S3_ENDPOINT (or AWS_ENDPOINT_URL) to use an S3-compatible service.
+"""
+import atexit
+import http.client
+import logging
+import os
+import threading
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote, urlparse
+from pipeline.utils.sigv4 import (
+    EMPTY_PAYLOAD_SHA256,
+    UNSIGNED_PAYLOAD,
+    Credentials,
+    canonical_query,
+    presign_query,
+    sign_request,
+)
+
+S3_ENDPOINT_ENV = "CONTENT_PIPELINE_S3_ENDPOINT"
+GCS_ENDPOINT = "https://storage.googleapis.com"
+# Bytes requested per ranged GET, and per read from a response
+DEFAULT_RANGE_BYTES = 8 * 1024 * 1024
+READ_CHUNK_BYTES = 256 * 1024
+# Idle keep-alive connections kept per host
+MAX_IDLE_PER_HOST = 8
+# Consecutive failed reads without progress before giving up on an object
+MAX_RANGE_RETRIES = 3
+
+class ObjectStorageError(RuntimeError):
+    """
+    Raised when the storage service answers with an unexpected status.
+    """
+    def __init__(self, method: str, url: str, status: int, body: bytes = b""):
+        detail = body[:200].decode("utf-8", errors="replace").strip()
+        super().__init__(f"{method} {url} failed with HTTP {status}" + (f": {detail}" if detail else ""))
+        self.status = status
+
+@dataclass(frozen=True)
+class ObjectLocation:
+    """
+    HTTP location of an object, with whether requests to it should be SigV4-signed.
+    """
+    scheme: str
+    host: str
+    path: str
+    signed: bool = False
+
+    @property
+    def url(self) -> str:
+        return f"{self.scheme}://{self.host}{self.path}"
+
+    def child(self, suffix: str) -> "ObjectLocation":
+        """
+        Return the location of a key under this one (treating it as a prefix).
+        """
+        return ObjectLocation(self.scheme, self.host, self.path.rstrip("/") + "/" + quote(suffix.lstrip("/")), self.signed)
+
+@dataclass
+class ObjectInfo:
+    """
+    Object properties returned by HEAD.
+    """
+    size: Optional[int]
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
+    last_modified: Optional[str] = None
+
+@dataclass
+class StorageResponse:
+    """
+    A fully read response.
+    """
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+def s3_endpoint_from_env() -> Optional[str]:
+    return os.environ.get(S3_ENDPOINT_ENV) or os.environ.get("AWS_ENDPOINT_URL")
+
+class HTTPConnectionPool:
+    """
+    Idle keep-alive http.client connections keyed by (scheme, host).
+    """
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST, timeout: float = 30.0):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def acquire(self, scheme: str, host: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Return (connection, reused) for a host, reusing the most recently returned idle one.
+        """
+        with self._lock:
+            idle = self._idle[(scheme, host)]
+            if idle:
+                return idle.pop(), True
+            self.opened += 1
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, timeout=self.timeout), False
+
+    def release(self, scheme: str, host: str, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle[(scheme, host)]
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+class ObjectStorageClient:
+    """
+    Thread-safe object storage client over pooled keep-alive connections.
+    """
+    def __init__(
+        self,
+        credentials: Optional[Credentials] = None,
+        s3_endpoint: Optional[str] = None,
+        range_bytes: int = DEFAULT_RANGE_BYTES,
+        pool: Optional[HTTPConnectionPool] = None
+    ):
+        self.credentials = credentials
+        self.s3_endpoint = s3_endpoint.rstrip("/") if s3_endpoint else None
+        self.range_bytes = range_bytes
+        self.pool = pool or HTTPConnectionPool()
+
+    @classmethod
+    def from_env(cls) -> "ObjectStorageClient":
+        """
+        Build a client from AWS_* credentials and the S3 endpoint environment variables.
+        """
+        return cls(Credentials.from_env(), s3_endpoint_from_env())
+
+    def locate(self, source: str) -> ObjectLocation:
+        """
+        Resolve an s3://, gs:// or http(s) storage URL to an HTTP location.
+        """
+        parsed = urlparse(source)
+        key = quote(parsed.path.lstrip("/"))
+        if parsed.scheme == "s3":
+            if self.s3_endpoint:
+                endpoint = urlparse(self.s3_endpoint)
+                return ObjectLocation(endpoint.scheme, endpoint.netloc, f"/{parsed.netloc}/{key}", True)
+            region = self.credentials.region if self.credentials else "us-east-1"
+            return ObjectLocation("https", f"{parsed.netloc}.s3.{region}.amazonaws.com", f"/{key}", True)
+        if parsed.scheme == "gs":
+            return ObjectLocation("https", urlparse(GCS_ENDPOINT).netloc, f"/{parsed.netloc}/{key}")
+        if parsed.scheme in ("http", "https"):
+            on_endpoint = bool(self.s3_endpoint) and parsed.netloc == urlparse(self.s3_endpoint).netloc
+            signed = on_endpoint or parsed.netloc.endswith(".amazonaws.com")
+            path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+            return ObjectLocation(parsed.scheme, parsed.netloc, path or "/", signed and not parsed.query)
+        raise ValueError(f"Unsupported object storage source: {source}")
+
+    def _headers(
+        self,
+        method: str,
+        location: ObjectLocation,
+        query: Optional[Mapping[str, str]],
+        headers: Optional[Mapping[str, str]],
+        payload_hash: str
+    ) -> Dict[str, str]:
+        headers = dict(headers or {})
+        if location.signed and self.credentials:
+            return sign_request(self.credentials, method, location.host, location.path, query, headers, payload_hash)
+        return headers
+
+    @contextmanager
+    def open(
+        self,
+        method: str,
+        location: ObjectLocation,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        query: Optional[Mapping[str, str]] = None,
+        payload_hash: Optional[str] = None
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request and yield the unread response.
+
+        The connection returns to the pool if the body was read to the end, and is
+        closed otherwise. A reused connection that the server had already closed is
+        replaced once, transparently.
+        """
+        if payload_hash is None:
+            # Bodies are sent unsigned, which S3 accepts over TLS
+            payload_hash = UNSIGNED_PAYLOAD if body else EMPTY_PAYLOAD_SHA256
+        signed_headers = self._headers(method, location, query, headers, payload_hash)
+        target = location.path + (("&" if "?" in location.path else "?") + canonical_query(query) if query else "")
+        while True:
+            connection, reused = self.pool.acquire(location.scheme, location.host)
+            try:
+                connection.request(method, target, body=body, headers=signed_headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            break
+        try:
+            yield response
+        except BaseException:
+            connection.close()
+            raise
+        if response.isclosed() and not response.will_close:
+            self.pool.release(location.scheme, location.host, connection)
+        else:
+            connection.close()
+
+    def request(
+        self,
+        method: str,
+        location: ObjectLocation,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        query: Optional[Mapping[str, str]] = None,
+        expect: Tuple[int, ...] = (200,)
+    ) -> StorageResponse:
+        """
+        Send a request, read the whole response and raise ObjectStorageError on an unexpected status.
+        """
+        with self.open(method, location, headers, body, query) as response:
+            payload = response.read()
+            result = StorageResponse(response.status, {k.lower(): v for k, v in response.getheaders()}, payload)
+        if result.status not in expect:
+            raise ObjectStorageError(method, location.url, result.status, payload)
+        return result
+
+    def head(self, source: str) -> ObjectInfo:
+        """
+        Return an object's size, ETag, content type and modification time.
+        """
+        headers = self.request("HEAD", self.locate(source)).headers
+        size = headers.get("content-length")
+        return ObjectInfo(
+            size=int(size) if size is not None else None,
+            etag=headers.get("etag"),
+            content_type=headers.get("content-type"),
+            last_modified=headers.get("last-modified")
+        )
+
+    def iter_object(self, source: str, start: int = 0, length: Optional[int] = None, etag: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Yield an object's bytes from `start` (up to `length` bytes) using ranged GETs.
+
+        Each range is at most range_bytes long and, once the ETag is known, sent with
+        If-Match, so a replaced object raises ObjectStorageError (412) instead of mixing
+        versions. A connection dropped mid-range is retried from the next unread byte.
+        """
+        location = self.locate(source)
+        offset, end, failures = start, (start + length if length is not None else None), 0
+        while end is None or offset < end:
+            last = offset + self.range_bytes - 1 if end is None else min(end, offset + self.range_bytes) - 1
+            headers = {"Range": f"bytes={offset}-{last}"}
+            if etag:
+                headers["If-Match"] = etag
+            try:
+                with self.open("GET", location, headers) as response:
+                    if response.status == 416:
+                        response.read()
+                        return
+                    if response.status not in (200, 206):
+                        raise ObjectStorageError("GET", location.url, response.status, response.read())
+                    etag = etag or response.getheader("ETag")
+                    if response.status == 200 and offset:
+                        raise ObjectStorageError("GET", location.url, 200, b"server ignored the Range header")
+                    total = response.getheader("Content-Range", "").rpartition("/")[2]
+                    if total.isdigit():
+                        end = min(end, int(total)) if end is not None else int(total)
+                    while end is None or offset < end:
+                        chunk = response.read(READ_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        if end is not None and offset + len(chunk) > end:
+                            chunk = chunk[:end - offset]
+                        offset += len(chunk)
+                        failures = 0
+                        yield chunk
+                    if response.status == 200:
+                        # The server ignored Range and sent the whole object
+                        return
+            except (http.client.HTTPException, ConnectionError, TimeoutError) as e:
+                failures += 1
+                if failures > MAX_RANGE_RETRIES:
+                    raise
+                logging.warning(f"[object_storage] Read of {location.url} interrupted at byte {offset}, resuming: {e}")
+
+    def put_object(self, destination: str, data: bytes, content_type: Optional[str] = None) -> Optional[str]:
+        """
+        Upload a whole object in one request. Returns its ETag.
+        """
+        headers = {"Content-Type": content_type} if content_type else None
+        return self.request("PUT", self.locate(destination), headers, body=data).headers.get("etag")
+
+    def create_multipart_upload(self, destination: str, content_type: Optional[str] = None) -> str:
+        """
+        Start a multipart upload and return its upload ID.
+        """
+        headers = {"Content-Type": content_type} if content_type else None
+        response = self.request("POST", self.locate(destination), headers, query={"uploads": ""})
+        upload_id = _xml_text(response.body, "UploadId")
+        if not upload_id:
+            raise ObjectStorageError("POST", destination, response.status, response.body)
+        return upload_id
+
+    def upload_part(self, destination: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """
+        Upload one part (numbered from 1) of a multipart upload. Returns the part's ETag.
+        """
+        query = {"partNumber": str(part_number), "uploadId": upload_id}
+        response = self.request("PUT", self.locate(destination), body=data, query=query)
+        return response.headers.get("etag", "")
+
+    def complete_multipart_upload(self, destination: str, upload_id: str, parts: Sequence[Tuple[int, str]]) -> None:
+        """
+        Assemble uploaded (part number, ETag) pairs into the final object.
+        """
+        body = "<CompleteMultipartUpload>" + "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>" for number, etag in sorted(parts)
+        ) + "</CompleteMultipartUpload>"
+        response = self.request("POST", self.locate(destination), body=body.encode("utf-8"), query={"uploadId": upload_id})
+        # S3 can report a failed completion in the body of a 200 response
+        if _xml_text(response.body, "Code"):
+            raise ObjectStorageError("POST", destination, response.status, response.body)
+
+    def abort_multipart_upload(self, destination: str, upload_id: str) -> None:
+        """
+        Discard a multipart upload and its uploaded parts.
+        """
+        self.request("DELETE", self.locate(destination), query={"uploadId": upload_id}, expect=(200, 204, 404))
+
+    def presigned_url(self, source: str, expires: int = 3600) -> str:
+        """
+        Return a URL that other programs (e.g. ffmpeg) can GET without credentials.
+        """
+        location = self.locate(source)
+        if not (location.signed and self.credentials):
+            return location.url
+        query = presign_query(self.credentials, "GET", location.host, location.path, expires)
+        return f"{location.url}?{query}"
+
+    def close(self) -> None:
+        self.pool.close()
+
+def _xml_text(body: bytes, tag: str) -> Optional[str]:
+    """
+    Return the text of the first element named tag in an S3 XML response, ignoring namespaces.
+    """
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError:
+        return None
+    for element in root.iter():
+        if element.tag.rsplit("}", 1)[-1] == tag:
+            return element.text
+    return None
+
+_client: Optional[ObjectStorageClient] = None
+_client_lock = threading.Lock()
+
+def get_storage_client() -> ObjectStorageClient:
+    """
+    Return the process-wide storage client, closing its connections at interpreter exit.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ObjectStorageClient.from_env()
+            atexit.register(_client.close)
+        return _client
@@ -10,19 +10,34 @@ import time
 import logging
 from functools import wraps
 
-def retry(max_attempts=3, delay=2, backoff=2):
+def retry(max_attempts=3, delay=2, backoff=2, no_retry=(), progress=None):
     """
-    Decorator to retry a function on exception
+    Decorator to retry a function on exception.
+    Exceptions listed in no_retry (e.g. cancellations) are raised immediately.
+
+    progress, if given, is called with the function's arguments and returns a number
+    that grows as work is saved (e.g. bytes of a partial download). A failed attempt
+    that advanced it is not counted: the function is retried at once with the
+    backoff reset, since the next attempt resumes rather than restarts.
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempts = 0
             wait = delay
+            done = progress(*args, **kwargs) if progress else None
             while attempts < max_attempts:
                 try:
                     return func(*args, **kwargs)
+                except no_retry:
+                    raise
                 except Exception as e:
+                    if progress:
+                        previous, done = done, progress(*args, **kwargs)
+                        if done > previous:
+                            logging.warning(f"Attempt failed after making progress ({previous} -> {done}), resuming: {e}")
+                            wait = delay
+                            continue
                     attempts += 1
                     logging.warning(f"Attempt {attempts} failed: {e}")
                     if attempts < max_attempts:
@@ -33,5 +48,3 @@ def retry(max_attempts=3, delay=2, backoff=2):
                         raise
         return wrapper
     return decorator
-                    
-
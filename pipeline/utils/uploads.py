@@ -0,0 +1,244 @@
+"""
+File: uploads.py
+
+Background object-storage uploads for the content-pipeline project.
+
+UploadQueue accepts uploads of bytes or files and returns immediately; a few worker
+threads perform them over the ObjectStorageClient's pooled keep-alive connections.
+The queue is bounded, so a producer that outruns the network blocks (backpressure)
+instead of buffering without limit. Each worker drains up to `batch_size` queued
+uploads at a time and sends them back to back on one connection, which keeps small
+objects such as transcripts from paying a queue hand-off and connection checkout each.
+Objects of at least `multipart_threshold` bytes use the S3 multipart API with their
+parts uploaded in parallel, reading one part at a time from disk.
+
+Failures do not stop the queue: flush() waits for everything submitted so far and
+raises UploadError listing the uploads that failed.
+"""
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+from pipeline.utils.object_storage import ObjectStorageClient, get_storage_client
+from pipeline.utils.retry import retry
+
+# Objects at least this large use multipart uploads, in parts of PART_SIZE bytes
+# (S3 requires parts of at least 5 MiB, except the last)
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+PART_SIZE = 8 * 1024 * 1024
+DEFAULT_WORKERS = 4
+DEFAULT_PART_WORKERS = 4
+DEFAULT_MAX_PENDING = 64
+DEFAULT_BATCH_SIZE = 16
+
+class UploadError(RuntimeError):
+    """
+    Raised by flush() when uploads submitted since the previous flush failed.
+    """
+    def __init__(self, failures: List[Tuple[str, Exception]]):
+        details = "; ".join(f"{destination}: {error}" for destination, error in failures[:5])
+        super().__init__(f"{len(failures)} upload(s) failed: {details}")
+        self.failures = failures
+
+@dataclass
+class UploadStats:
+    """
+    Objects and bytes uploaded between two flushes, and the wall-clock time from the
+    first of those submissions until the flush finished.
+    """
+    objects: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    failed: int = 0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.objects / self.seconds if self.seconds > 0 else 0.0
+
+@dataclass
+class _Upload:
+    destination: str
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+    content_type: Optional[str] = None
+    future: Future = field(default_factory=Future)
+
+    @property
+    def size(self) -> int:
+        return len(self.data) if self.data is not None else os.path.getsize(self.path)
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self.data is not None:
+            return self.data[offset:offset + length]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+class UploadQueue:
+    """
+    Bounded background queue of object-storage uploads.
+    """
+    def __init__(
+        self,
+        client: Optional[ObjectStorageClient] = None,
+        workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+        part_size: int = PART_SIZE,
+        part_workers: int = DEFAULT_PART_WORKERS
+    ):
+        self.client = client or get_storage_client()
+        self.batch_size = batch_size
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+        self._queue: "queue.Queue[Optional[_Upload]]" = queue.Queue(maxsize=max_pending)
+        self._parts = ThreadPoolExecutor(max_workers=part_workers, thread_name_prefix="upload-part")
+        self._lock = threading.Lock()
+        self._failures: List[Tuple[str, Exception]] = []
+        self._stats = UploadStats()
+        self._started: Optional[float] = None
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"upload-{n}", daemon=True) for n in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _submit(self, upload: _Upload) -> Future:
+        if self._closed:
+            raise RuntimeError("UploadQueue is closed")
+        with self._lock:
+            if self._started is None:
+                self._started = time.perf_counter()
+        self._queue.put(upload)
+        return upload.future
+
+    def put_bytes(self, data: bytes, destination: str, content_type: Optional[str] = None) -> Future:
+        """
+        Queue an upload of data to destination; the future resolves to the destination.
+        Blocks only while the queue is full.
+        """
+        return self._submit(_Upload(destination, data=data, content_type=content_type))
+
+    def put_file(self, path: Union[str, os.PathLike], destination: str, content_type: Optional[str] = None) -> Future:
+        """
+        Queue an upload of a local file to destination; the future resolves to the destination.
+        The file is read when it is uploaded and must not change until then.
+        """
+        return self._submit(_Upload(destination, path=os.fspath(path), content_type=content_type))
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for upload in batch:
+                if upload is None:
+                    continue
+                self._run(upload)
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _run(self, upload: _Upload) -> None:
+        try:
+            size = upload.size
+            if size >= self.multipart_threshold:
+                self._upload_multipart(upload, size)
+            else:
+                self._put(upload)
+        except Exception as e:
+            logging.error(f"[uploads] Upload to {upload.destination} failed: {e}")
+            with self._lock:
+                self._failures.append((upload.destination, e))
+                self._stats.failed += 1
+            upload.future.set_exception(e)
+            return
+        with self._lock:
+            self._stats.objects += 1
+            self._stats.bytes += size
+        upload.future.set_result(upload.destination)
+
+    @retry(max_attempts=3, delay=0.5)
+    def _put(self, upload: _Upload) -> None:
+        self.client.put_object(upload.destination, upload.read(0, upload.size), upload.content_type)
+
+    @retry(max_attempts=3, delay=0.5)
+    def _put_part(self, upload: _Upload, upload_id: str, number: int) -> Tuple[int, str]:
+        data = upload.read((number - 1) * self.part_size, self.part_size)
+        return number, self.client.upload_part(upload.destination, upload_id, number, data)
+
+    def _upload_multipart(self, upload: _Upload, size: int) -> None:
+        """
+        Upload parts in parallel, then complete the upload; abort it if any part fails.
+        """
+        count = math.ceil(size / self.part_size)
+        upload_id = self.client.create_multipart_upload(upload.destination, upload.content_type)
+        logging.info(f"[uploads] Multipart upload of {upload.destination}: {count} part(s) of {self.part_size} bytes")
+        futures = []
+        try:
+            futures = [self._parts.submit(self._put_part, upload, upload_id, n) for n in range(1, count + 1)]
+            parts = [future.result() for future in futures]
+            self.client.complete_multipart_upload(upload.destination, upload_id, parts)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            try:
+                self.client.abort_multipart_upload(upload.destination, upload_id)
+            except Exception as e:
+                logging.warning(f"[uploads] Could not abort multipart upload of {upload.destination}: {e}")
+            raise
+
+    def flush(self) -> UploadStats:
+        """
+        Wait until every upload submitted so far has finished.
+
+        Returns the statistics since the previous flush, or raises UploadError if any of
+        those uploads failed.
+        """
+        self._queue.join()
+        with self._lock:
+            stats, self._stats = self._stats, UploadStats()
+            failures, self._failures = self._failures, []
+            if self._started is not None:
+                stats.seconds = time.perf_counter() - self._started
+            self._started = None
+        if failures:
+            raise UploadError(failures)
+        return stats
+
+    def close(self) -> UploadStats:
+        """
+        Flush the queue and stop the workers.
+        """
+        if self._closed:
+            return UploadStats()
+        try:
+            return self.flush()
+        finally:
+            self._closed = True
+            for _ in self._workers:
+                self._queue.put(None)
+            for worker in self._workers:
+                worker.join()
+            self._parts.shutdown(wait=True)
+
+    def __enter__(self) -> "UploadQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
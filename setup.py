@@ -21,7 +21,12 @@ setup(
         "pydantic>=2.0",
         "ffmpeg-python",
         "openai-whisper",
+        "numpy",
     ],
+    extras_require={
+        # MessagePack and zstd-compressed transcript formats
+        "formats": ["msgpack", "zstandard"],
+    },
     entry_points={
         "console_scripts": [
             "content-pipeline=main_cli:cli",
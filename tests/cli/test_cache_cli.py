@@ -0,0 +1,45 @@
+"""
+File: test_cache_cli.py
+
+Test suite for the transcript cache in the content-pipeline CLI.
+
+Covers:
+- `transcribe --cache` answering from the cache without loading a model
+- `cache stats` and `cache prune` output
+"""
+import json
+import os
+import subprocess
+import sys
+from pipeline.transcribers.cache import TranscriptCache, cache_key, file_digest
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptSegment, TranscriptV1, build_transcript_metadata
+
+CLI_PATH = os.path.abspath("main_cli.py")
+
+def run_cli(args, cwd, cache_dir):
+    env = dict(os.environ, CONTENT_PIPELINE_CACHE_DIR=str(cache_dir))
+    return subprocess.run([sys.executable, CLI_PATH] + args, cwd=cwd, env=env, capture_output=True, text=True)
+
+def test_transcribe_cache_hit_skips_model(tmp_path):
+    cache_dir = tmp_path / "cache"
+    audio = tmp_path / "clip.mp3"
+    audio.write_bytes(b"not really audio")
+    transcript = TranscriptV1(
+        metadata=build_transcript_metadata("whisper", "tiny"),
+        transcript=[TranscriptSegment(text="cached", timestamp="00:00:01.000")]
+    )
+    TranscriptCache(str(cache_dir)).put(cache_key(file_digest(str(audio)), "whisper", "tiny", None), transcript)
+
+    result = run_cli(["transcribe", "--source", str(audio), "--model", "tiny", "--cache"], tmp_path, cache_dir)
+
+    assert result.returncode == 0, result.stderr
+    with open(tmp_path / "output" / "transcript.json") as f:
+        assert json.load(f)["transcript"][0]["text"] == "cached"
+
+    stats = run_cli(["cache", "stats"], tmp_path, cache_dir)
+    assert "Entries:  1" in stats.stdout
+    assert "Hit rate: 100.0%" in stats.stdout
+
+    prune = run_cli(["cache", "prune", "--max-mb", "0"], tmp_path, cache_dir)
+    assert "Removed 1 transcript(s)" in prune.stdout
+    assert TranscriptCache(str(cache_dir)).stats().entries == 0
@@ -0,0 +1,45 @@
+"""
+File: test_cli_startup.py
+
+Test suite for lazy command loading in the content-pipeline CLI.
+
+Covers:
+- Importing the CLI entry point without pulling in heavy stage dependencies
+- Help output for every lazily registered subcommand
+- Deferred logging configuration until a subcommand runs
+"""
+import subprocess
+import sys
+import os
+import pytest
+
+CLI_PATH = os.path.abspath("main_cli.py")
+
+HEAVY_MODULES = ("whisper", "torch", "moviepy", "yt_dlp")
+
+@pytest.mark.parametrize("args", [["--help"], ["extract", "--help"], ["transcribe", "--help"], ["serve", "--help"], ["run", "--help"], ["cache", "--help"], ["cache", "prune", "--help"], ["expand", "--help"], ["index", "verify", "--help"]])
+def test_cli_help_does_not_import_heavy_modules(args):
+    probe = (
+        "import sys, runpy\n"
+        f"sys.argv = {[CLI_PATH] + args!r}\n"
+        "try:\n"
+        f"    runpy.run_path({CLI_PATH!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+def test_cli_lists_lazy_subcommands():
+    result = subprocess.run([sys.executable, CLI_PATH, "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "extract" in result.stdout
+    assert "transcribe" in result.stdout
+
+def test_cli_import_does_not_configure_logging():
+    probe = "import logging, main_cli; print(len(logging.getLogger().handlers))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "0"
@@ -5,10 +5,12 @@ Test suite for the 'extract' subcommand of the content-pipeline CLI.
 
 Covers:
 - Help output and argument parsing for the extract command
-- Audio extraction from YouTube URLs and local video files
+- Audio extraction from YouTube URLs, local video files and object storage
 - Metadata enrichment and fallback behavior
 - Error handling for missing or invalid extract arguments
 - Output path resolution and file generation
+- Single-source extraction recording into and reusing the extraction index
+- Warning, not failing, when the metadata file cannot be written
 """
 
 import subprocess
@@ -151,3 +153,94 @@ def test_cli_extract_local_audio_and_placeholder_metadata(tmp_path):
     for path in [output_path, metadata_path]:
         if path.exists():
             path.unlink()
+
+def test_cli_extract_storage_object_streams_audio(tmp_path, s3_standin):
+    """
+    Verifies that an s3:// source is streamed from the configured endpoint and extracted with its metadata.
+    """
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+    video_path = tmp_path / "sample_video.mp4"
+    subprocess.run([
+        ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=2", "-f", "lavfi", "-i", "sine=duration=2",
+        "-c:v", "mpeg4", "-c:a", "aac", "-shortest", str(video_path)
+    ], check=True)
+    s3_standin.objects["media/sample_video.mp4"] = video_path.read_bytes()
+    output_path = tmp_path / "cli_storage.mp3"
+    env = {k: v for k, v in os.environ.items() if not k.startswith("AWS_")}
+    env["CONTENT_PIPELINE_S3_ENDPOINT"] = s3_standin.endpoint
+
+    result = subprocess.run([
+        sys.executable, CLI_PATH,
+        "extract",
+        "--source", "s3://media/sample_video.mp4",
+        "--output", str(output_path),
+        "--profile", "asr",
+        "--no-index"
+    ], capture_output=True, text=True, env=env)
+
+    assert result.returncode == 0, result.stderr
+    assert output_path.with_suffix(".flac").stat().st_size > 0
+    metadata = json.loads(output_path.with_suffix(".json").read_text())
+    assert metadata["source_type"] == "storage"
+    assert metadata["source_url"] == f"{s3_standin.endpoint}/media/sample_video.mp4"
+    assert metadata["service_metadata"]["size"] == len(s3_standin.objects["media/sample_video.mp4"])
+
+def test_cli_extract_single_source_uses_extraction_index(tmp_path):
+    """
+    Verifies that a single local source is recorded in the extraction index and skipped on re-runs.
+    """
+    from pipeline.extractors.index import INDEX_PATH_ENV_VAR, ExtractionIndex
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+    video_path = tmp_path / "sample_video.mp4"
+    subprocess.run([
+        ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=2", "-f", "lavfi", "-i", "sine=duration=2",
+        "-c:v", "mpeg4", "-c:a", "aac", "-shortest", str(video_path)
+    ], check=True)
+    output_path = tmp_path / "indexed.mp3"
+    index_path = tmp_path / "index.sqlite"
+    env = dict(os.environ, **{INDEX_PATH_ENV_VAR: str(index_path)})
+    command = [sys.executable, CLI_PATH, "extract", "--source", str(video_path),
+               "--output", str(output_path), "--profile", "asr"]
+
+    first = subprocess.run(command, capture_output=True, text=True, env=env)
+    audio_path = output_path.with_suffix(".flac")
+    mtime = audio_path.stat().st_mtime_ns
+    second = subprocess.run(command, capture_output=True, text=True, env=env)
+
+    assert first.returncode == 0 and second.returncode == 0, first.stderr + second.stderr
+    assert audio_path.stat().st_mtime_ns == mtime
+    with ExtractionIndex(str(index_path)) as index:
+        [entry] = index.entries()
+    assert entry.audio_path == str(audio_path)
+    assert entry.metadata_path == str(output_path.with_suffix(".json"))
+
+def test_cli_extract_warns_when_metadata_cannot_be_saved(tmp_path):
+    """
+    Verifies that audio is still extracted when the metadata JSON cannot be written.
+    """
+    from pipeline.utils.ffmpeg import ffmpeg_executable
+    video_path = tmp_path / "sample_video.mp4"
+    subprocess.run([
+        ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=2", "-f", "lavfi", "-i", "sine=duration=2",
+        "-c:v", "mpeg4", "-c:a", "aac", "-shortest", str(video_path)
+    ], check=True)
+    output_path = tmp_path / "blocked.mp3"
+    # A directory where the metadata file should go makes it unwritable
+    output_path.with_suffix(".json").mkdir()
+
+    result = subprocess.run([
+        sys.executable, CLI_PATH,
+        "extract",
+        "--source", str(video_path),
+        "--output", str(output_path),
+        "--profile", "asr",
+        "--no-index"
+    ], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "Warning: Could not save metadata." in result.stdout
+    assert "Audio extraction failed" not in result.stdout
+    assert output_path.with_suffix(".flac").stat().st_size > 0
@@ -0,0 +1,39 @@
+"""
+File: test_index_cli.py
+
+Test suite for the extraction index commands of the content-pipeline CLI.
+
+Covers:
+- `index verify --dry-run` reporting stale entries without removing them
+- `index verify` dropping entries for deleted audio
+- `index stats` output
+"""
+import os
+import subprocess
+import sys
+from pipeline.extractors.index import ExtractionIndex
+
+CLI_PATH = os.path.abspath("main_cli.py")
+
+def run_cli(args, cwd):
+    return subprocess.run([sys.executable, CLI_PATH] + args, cwd=cwd, capture_output=True, text=True)
+
+def test_index_verify_drops_deleted_audio(tmp_path):
+    index_path = str(tmp_path / "index.sqlite")
+    with ExtractionIndex(index_path) as index:
+        for name in ("kept", "deleted"):
+            audio = tmp_path / f"{name}.opus"
+            audio.write_bytes(b"audio")
+            index.record(f"youtube:{name}", "asr", name, str(audio))
+    os.remove(tmp_path / "deleted.opus")
+
+    dry_run = run_cli(["index", "--index-path", index_path, "verify", "--dry-run"], tmp_path)
+    assert dry_run.returncode == 1
+    assert f"[missing] {tmp_path / 'deleted.opus'}" in dry_run.stdout
+
+    result = run_cli(["index", "--index-path", index_path, "verify"], tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert "Checked 2 entries, removed 1 stale." in result.stdout
+
+    stats = run_cli(["index", "--index-path", index_path, "stats"], tmp_path)
+    assert "Entries:  1" in stats.stdout
@@ -10,6 +10,7 @@ Covers:
 - Raw output passthrough and schema normalization
 - Transcript validation and persistence
 - Error handling for missing files or invalid inputs
+- Rejecting --output in batch mode
 """
 
 import subprocess
@@ -103,4 +104,15 @@ def test_cli_transcribe_with_language_flag(tmp_path):
         assert "metadata" in data
         assert data["metadata"].get("language") == "en"
 
+def test_cli_transcribe_rejects_output_in_batch_mode(tmp_path):
+    result = subprocess.run([
+        sys.executable, CLI_PATH,
+        "transcribe",
+        "--source", str(tmp_path / "a.wav"),
+        "--source", str(tmp_path / "b.wav"),
+        "--output", "combined.json"
+    ], cwd=tmp_path, capture_output=True, text=True)
 
+    assert result.returncode == 2
+    assert "--output applies to a single --source" in result.stderr
+    assert not (tmp_path / "output").exists()
@@ -0,0 +1,221 @@
+"""
+File: conftest.py
+
+Local S3-compatible stand-in shared by the object storage tests.
+
+A threaded HTTP/1.1 server keeps objects in memory under path-style /<bucket>/<key>
+URLs and implements HEAD, GET (with Range and If-Match), PUT and the multipart upload
+calls (create, upload part, complete, abort). When
+`server.credentials` is set, requests must carry a valid SigV4 header or presigned
+query, checked by recomputing the signature. Setting `server.drop_after` closes every
+GET response after that many bytes, like a flaky link. Requests, client connections
+and the ranges served are recorded, and `server.fail_parts` lists part numbers whose
+upload is rejected. `server.latency` (seconds, default 0) delays every new connection
+and every request by one simulated network round trip, and `server.bandwidth` (bytes
+per second, default unlimited) caps how fast each connection uploads a request body.
+"""
+import hashlib
+import itertools
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlparse
+import pytest
+from pipeline.utils.sigv4 import UNSIGNED_PAYLOAD, _signature
+
+def _etag(data):
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+class S3StandInHandler(BaseHTTPRequestHandler):
+    """Serves in-memory objects with the subset of the S3 REST API the pipeline uses."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        super().setup()
+
+    def _key(self):
+        return unquote(urlparse(self.path).path.lstrip("/"))
+
+    def _query(self):
+        return dict(parse_qsl(urlparse(self.path).query, keep_blank_values=True))
+
+    def _authorized(self):
+        credentials = self.server.credentials
+        if credentials is None:
+            return True
+        parsed = urlparse(self.path)
+        query = self._query()
+        if "X-Amz-Signature" in query:
+            signature = query.pop("X-Amz-Signature")
+            amz_date = query["X-Amz-Date"]
+            headers = {"host": self.headers["Host"]}
+            payload_hash = UNSIGNED_PAYLOAD
+        else:
+            match = re.search(r"SignedHeaders=([^,]+), Signature=(\w+)", self.headers.get("Authorization", ""))
+            if not match:
+                return False
+            signature = match.group(2)
+            amz_date = self.headers["x-amz-date"]
+            headers = {name: self.headers[name] for name in match.group(1).split(";")}
+            payload_hash = self.headers["x-amz-content-sha256"]
+        _, expected = _signature(credentials, self.command, parsed.path, query, headers, payload_hash, amz_date, "s3")
+        return signature == expected
+
+    def _record(self):
+        self.server.requests.append((self.command, self.path, self.headers.get("Range")))
+        self.server.connections.add(self.client_address)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if not self._authorized():
+            self._send(403, b"SignatureDoesNotMatch")
+            return False
+        return True
+
+    def _send(self, status, body=b"", headers=None, send_body=True):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not self.server.bandwidth:
+            return self.rfile.read(length)
+        chunks, start = [], time.perf_counter()
+        while length > 0:
+            chunks.append(self.rfile.read(min(length, 256 * 1024)))
+            length -= len(chunks[-1])
+            time.sleep(max(0.0, start + sum(map(len, chunks)) / self.server.bandwidth - time.perf_counter()))
+        return b"".join(chunks)
+
+    def do_HEAD(self):
+        if not self._record():
+            return
+        data = self.server.objects.get(self._key())
+        if data is None:
+            return self._send(404, send_body=False)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", _etag(data))
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        if not self._record():
+            return
+        data = self.server.objects.get(self._key())
+        if data is None:
+            return self._send(404, b"NoSuchKey")
+        if self.headers.get("If-Match") not in (None, _etag(data)):
+            return self._send(412, b"PreconditionFailed")
+        for hook in self.server.on_get:
+            hook(self)
+        start, end = 0, len(data) - 1
+        requested = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        headers = {"ETag": _etag(data), "Accept-Ranges": "bytes"}
+        if requested:
+            start = int(requested.group(1))
+            if start >= len(data):
+                return self._send(416, headers={"Content-Range": f"bytes */{len(data)}"})
+            end = min(int(requested.group(2) or end), end)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+        self.server.ranges.append((start, end))
+        body = data[start:end + 1]
+        self.send_response(206 if requested else 200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.server.drop_after is not None and len(body) > self.server.drop_after:
+            body = body[:self.server.drop_after]
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        data = self._read_body()
+        if not self._record():
+            return
+        query = self._query()
+        if "uploadId" in query:
+            parts = self.server.uploads.get(query["uploadId"])
+            number = int(query["partNumber"])
+            if parts is None:
+                return self._send(404, b"NoSuchUpload")
+            if number in self.server.fail_parts:
+                return self._send(500, b"InternalError")
+            parts[number] = data
+            return self._send(200, headers={"ETag": _etag(data)})
+        self.server.objects[self._key()] = data
+        self._send(200, headers={"ETag": _etag(data)})
+
+    def do_POST(self):
+        body = self._read_body()
+        if not self._record():
+            return
+        query = self._query()
+        if "uploads" in query:
+            upload_id = f"upload-{next(self.server.upload_ids)}"
+            self.server.uploads[upload_id] = {}
+            return self._send(200, f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>".encode())
+        parts = self.server.uploads.pop(query.get("uploadId"), None)
+        if parts is None:
+            return self._send(404, b"NoSuchUpload")
+        numbers = [int(n) for n in re.findall(rb"<PartNumber>(\d+)</PartNumber>", body)]
+        if numbers != sorted(parts):
+            return self._send(200, b"<Error><Code>InvalidPart</Code></Error>")
+        data = b"".join(parts[n] for n in numbers)
+        self.server.objects[self._key()] = data
+        self.server.completed.append((self._key(), len(numbers)))
+        self._send(200, f"<CompleteMultipartUploadResult><ETag>{_etag(data)}</ETag></CompleteMultipartUploadResult>".encode())
+
+    def do_DELETE(self):
+        if not self._record():
+            return
+        query = self._query()
+        if "uploadId" in query:
+            self.server.uploads.pop(query["uploadId"], None)
+            self.server.aborted.append(self._key())
+        else:
+            self.server.objects.pop(self._key(), None)
+        self._send(204)
+
+    def log_message(self, *args):
+        pass
+
+def start_s3_standin() -> ThreadingHTTPServer:
+    """Start an S3-compatible stand-in on 127.0.0.1 in a background thread and return the server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), S3StandInHandler)
+    server.daemon_threads = True
+    server.endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    server.objects = {}
+    server.credentials = None
+    server.drop_after = None
+    server.on_get = []
+    server.uploads = {}
+    server.upload_ids = itertools.count(1)
+    server.completed = []
+    server.aborted = []
+    server.fail_parts = set()
+    server.latency = 0
+    server.bandwidth = None
+    server.requests = []
+    server.ranges = []
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+@pytest.fixture
+def s3_standin():
+    """Start an S3-compatible stand-in on 127.0.0.1 and yield the server."""
+    server = start_s3_standin()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,65 @@
+"""
+File: test_async_extractor.py
+
+Tests for the asyncio local-file extractor.
+
+Covers:
+- Concurrent ffmpeg subprocess extraction bounded by max_processes
+- Timeouts killing ffmpeg and removing partial output
+- The synchronous facade running calls on fresh event loops
+"""
+import asyncio
+import subprocess
+import pytest
+from pipeline.extractors.base import SyncExtractorFacade
+from pipeline.extractors.local.async_extractor import AsyncLocalExtractor
+from pipeline.extractors.local.ffmpeg_audio import probe_audio_stream
+from pipeline.utils.ffmpeg import ffmpeg_executable
+
+@pytest.fixture(scope="module")
+def video(tmp_path_factory):
+    path = tmp_path_factory.mktemp("async_local") / "talk.mp4"
+    subprocess.run([
+        ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=3",
+        "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100:duration=3",
+        "-c:v", "mpeg4", "-c:a", "aac", "-shortest", str(path)
+    ], check=True)
+    return str(path)
+
+def test_concurrent_extractions(video, tmp_path):
+    async def main():
+        extractor = AsyncLocalExtractor("asr", max_processes=2)
+        return await asyncio.gather(*(extractor.extract_audio(video, str(tmp_path / f"out{i}.mp3")) for i in range(5)))
+
+    paths = asyncio.run(main())
+
+    assert paths == [str(tmp_path / f"out{i}.flac") for i in range(5)]
+    assert all(probe_audio_stream(path).sample_rate == 16000 for path in paths)
+
+def test_timeout_kills_ffmpeg_and_removes_partial_output(tmp_path, monkeypatch):
+    # A slow stand-in for ffmpeg that creates its output file and then hangs
+    script = tmp_path / "slow_ffmpeg.sh"
+    script.write_text('#!/bin/sh\nfor last; do :; done\ntouch "$last"\nexec sleep 30\n')
+    script.chmod(0o755)
+    monkeypatch.setattr("pipeline.extractors.local.ffmpeg_audio.ffmpeg_executable", lambda: str(script))
+    source = tmp_path / "talk.mp4"
+    source.write_bytes(b"video")
+
+    async def main():
+        extractor = AsyncLocalExtractor("asr", timeout=0.5)
+        with pytest.raises(asyncio.TimeoutError):
+            await extractor.extract_audio(str(source), str(tmp_path / "talk.mp3"))
+
+    asyncio.run(main())
+
+    assert not (tmp_path / "talk.flac").exists()
+
+def test_sync_facade_and_metadata(video, tmp_path):
+    extractor = SyncExtractorFacade(AsyncLocalExtractor("copy"))
+
+    assert extractor.extract_audio(video, str(tmp_path / "a.mp3")).endswith(".m4a")
+    assert extractor.extract_audio(video, str(tmp_path / "b.mp3")).endswith(".m4a")
+    assert extractor.extract_metadata(video)["title"] == "talk.mp4"
+    with pytest.raises(FileNotFoundError):
+        extractor.extract_audio(str(tmp_path / "missing.mp4"), str(tmp_path / "c.mp3"))
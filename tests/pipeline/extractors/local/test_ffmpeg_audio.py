@@ -0,0 +1,86 @@
+"""
+File: test_ffmpeg_audio.py
+
+Unit tests for direct ffmpeg audio extraction from local media files.
+
+Covers:
+- Probing the first audio stream's codec, sample rate and channels
+- Stream-copying audio into a container matching its codec
+- Writing 16 kHz mono FLAC for the asr profile
+- Profile routing between moviepy and ffmpeg in the extraction runner
+"""
+import subprocess
+from unittest.mock import patch
+import pytest
+from pipeline.extractors.local.ffmpeg_audio import (
+    extract_audio_asr,
+    extract_audio_copy,
+    extract_audio_fast,
+    probe_audio_stream,
+)
+from pipeline.extractors.runner import extract_local_audio
+from pipeline.utils.ffmpeg import ffmpeg_executable
+
+def make_video(path, audio_codec="aac", with_audio=True):
+    inputs = ["-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=2"]
+    codecs = ["-c:v", "mpeg4"]
+    if with_audio:
+        inputs += ["-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100:duration=2"]
+        codecs += ["-c:a", audio_codec, "-ac", "2"]
+    subprocess.run(
+        [ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y"] + inputs + codecs + ["-shortest", str(path)],
+        check=True
+    )
+    return str(path)
+
+@pytest.fixture
+def video(tmp_path):
+    return make_video(tmp_path / "clip.mp4")
+
+def test_probe_reports_audio_stream(video):
+    info = probe_audio_stream(video)
+
+    assert info.codec == "aac"
+    assert info.sample_rate == 44100
+    assert info.channels == "stereo"
+
+def test_probe_without_audio_returns_none(tmp_path):
+    assert probe_audio_stream(make_video(tmp_path / "silent.mp4", with_audio=False)) is None
+
+def test_probe_unreadable_file_raises(tmp_path):
+    bogus = tmp_path / "bogus.mp4"
+    bogus.write_text("not a video")
+
+    with pytest.raises(RuntimeError):
+        probe_audio_stream(str(bogus))
+
+def test_copy_keeps_codec_in_matching_container(video, tmp_path):
+    audio_path = extract_audio_copy(video, str(tmp_path / "out.mp3"))
+
+    assert audio_path.endswith("out.m4a")
+    info = probe_audio_stream(audio_path)
+    assert (info.codec, info.sample_rate, info.channels) == ("aac", 44100, "stereo")
+
+def test_copy_falls_back_to_asr_for_uncopyable_codec(tmp_path):
+    video = make_video(tmp_path / "pcm.mov", audio_codec="pcm_s16le")
+
+    audio_path = extract_audio_copy(video, str(tmp_path / "out.mp3"))
+
+    assert audio_path.endswith("out.flac")
+
+def test_asr_writes_16k_mono_flac(video, tmp_path):
+    audio_path = extract_audio_asr(video, str(tmp_path / "out.mp3"))
+
+    info = probe_audio_stream(audio_path)
+    assert (info.codec, info.sample_rate, info.channels) == ("flac", 16000, "mono")
+
+def test_fast_path_rejects_archive_profile(video, tmp_path):
+    with pytest.raises(ValueError):
+        extract_audio_fast(video, str(tmp_path / "out.mp3"), "archive")
+
+def test_runner_routes_profiles(video, tmp_path):
+    with patch("pipeline.extractors.local.file_audio.extract_audio_from_file", return_value="archived.mp3") as archive:
+        assert extract_local_audio(video, str(tmp_path / "a.mp3"), "archive") == "archived.mp3"
+    archive.assert_called_once()
+
+    assert extract_local_audio(video, str(tmp_path / "b.mp3"), "asr").endswith("b.flac")
@@ -0,0 +1,149 @@
+"""
+File: test_bulk.py
+
+Unit tests for concurrent bulk extraction.
+
+Covers:
+- Source collection from directory walks and line-based streams (e.g. stdin)
+- Host grouping by exact registered domain and per-host concurrency limits
+- Bounded worker pool with unique per-source output names
+- Lazy reading of sources, and busy hosts not blocking sources for other hosts
+- Per-source failure isolation
+"""
+import io
+import threading
+import time
+import pytest
+from pipeline.extractors.bulk import (
+    iter_directory_sources,
+    iter_stream_sources,
+    host_key,
+    HostLimiter,
+    extract_many,
+)
+from pipeline.extractors.runner import ExtractionResult
+
+def test_iter_directory_sources_filters_video_files(tmp_path):
+    (tmp_path / "nested").mkdir()
+    for name in ("b.mp4", "a.MKV", "notes.txt", "nested/c.webm"):
+        (tmp_path / name).write_bytes(b"x")
+
+    sources = list(iter_directory_sources(str(tmp_path)))
+
+    assert [s[len(str(tmp_path)) + 1:] for s in sources] == ["a.MKV", "b.mp4", "nested/c.webm"]
+
+def test_iter_stream_sources_skips_comments():
+    stream = io.StringIO("# header\nhttps://youtu.be/a\n\n  https://youtu.be/b  \n")
+    assert list(iter_stream_sources(stream)) == ["https://youtu.be/a", "https://youtu.be/b"]
+
+@pytest.mark.parametrize("source, expected", [
+    ("https://www.youtube.com/watch?v=a", "youtube.com"),
+    ("https://youtu.be/a", "youtube.com"),
+    ("https://vimeo.com/1", "vimeo.com"),
+    ("https://www.youtube.com:443/watch?v=a", "youtube.com"),
+    ("https://notyoutube.com/watch?v=a", "notyoutube.com"),
+    ("https://bucket.s3.amazonaws.com/video.mp4", "s3.amazonaws.com"),
+    ("s3://bucket/video.mp4", "s3://bucket"),
+    ("/home/user/video.mp4", None),
+])
+def test_host_key(source, expected):
+    assert host_key(source) == expected
+
+def test_host_limiter_try_acquire_caps_slots_per_host():
+    limiter = HostLimiter(per_host=2)
+
+    assert limiter.try_acquire("youtube.com") and limiter.try_acquire("youtube.com")
+    assert not limiter.try_acquire("youtube.com")
+    assert limiter.try_acquire("vimeo.com")
+    limiter.release("youtube.com")
+    assert limiter.try_acquire("youtube.com")
+
+def test_extract_many_caps_concurrency_per_host(tmp_path):
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def slow_extract(source, output_path):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return ExtractionResult(source, "streaming", output_path)
+
+    sources = [f"https://youtu.be/{i}" for i in range(8)]
+    report = extract_many(sources, str(tmp_path), workers=8, per_host=2, extract_fn=slow_extract)
+
+    assert report.succeeded == 8
+    assert peak[0] == 2
+
+def test_extract_many_uses_unique_names_and_isolates_failures(tmp_path):
+    seen_outputs = []
+
+    def fake_extract(source, output_path):
+        seen_outputs.append(output_path)
+        if "bad" in source:
+            raise RuntimeError("download failed")
+        return ExtractionResult(source, "streaming", output_path, output_path.replace(".mp3", ".json"))
+
+    sources = ["https://youtu.be/one", "https://youtu.be/two", "https://youtu.be/bad", "https://youtu.be/one"]
+    completed = []
+    report = extract_many(sources, str(tmp_path), workers=3, per_host=2,
+                          on_result=completed.append, extract_fn=fake_extract)
+
+    assert report.succeeded == 2 and report.failed == 1
+    assert len(completed) == 3
+    assert sorted(seen_outputs) == sorted(str(tmp_path / f"{vid}.mp3") for vid in ("one", "two", "bad"))
+
+def test_extract_many_runs_sources_concurrently(tmp_path):
+    def slow_extract(source, output_path):
+        time.sleep(0.1)
+        return ExtractionResult(source, "file_system", output_path)
+
+    sources = [f"/videos/clip{i}.mp4" for i in range(8)]
+    report = extract_many(sources, str(tmp_path), workers=8, extract_fn=slow_extract)
+
+    assert report.succeeded == 8
+    assert report.elapsed < 0.5
+
+def test_extract_many_reads_sources_lazily(tmp_path):
+    release = threading.Event()
+    consumed = []
+
+    def sources():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"/videos/clip{i}.mp4"
+
+    def blocking_extract(source, output_path):
+        release.wait(5)
+        return ExtractionResult(source, "file_system", output_path)
+
+    runner = threading.Thread(target=extract_many, args=(sources(), str(tmp_path)),
+                              kwargs={"workers": 2, "extract_fn": blocking_extract})
+    runner.start()
+    time.sleep(0.1)
+    in_flight = len(consumed)
+    release.set()
+    runner.join(5)
+
+    assert in_flight <= 3
+    assert len(consumed) == 1000
+
+def test_busy_host_does_not_block_other_hosts(tmp_path):
+    release = threading.Event()
+    order = []
+
+    def fake_extract(source, output_path):
+        if "youtu" in source:
+            release.wait(5)
+        order.append(source)
+        if "vimeo" in source:
+            release.set()
+        return ExtractionResult(source, "streaming", output_path)
+
+    sources = ["https://youtu.be/a", "https://youtu.be/b", "https://youtu.be/c", "https://vimeo.com/1"]
+    report = extract_many(sources, str(tmp_path), workers=2, per_host=1, extract_fn=fake_extract)
+
+    assert report.succeeded == 4
+    assert order[0] == "https://vimeo.com/1"
+    assert order[1:] == ["https://youtu.be/a", "https://youtu.be/b", "https://youtu.be/c"]
@@ -0,0 +1,87 @@
+"""
+File: test_index.py
+
+Unit tests for the persistent extraction index.
+
+Covers:
+- Recording and looking up extractions per key and profile
+- Dropping entries whose audio was deleted or modified, on lookup and in verify()
+- Memoized local file hashes keyed by path, size and mtime
+- extract_source() skipping local files already extracted to the requested location
+"""
+import os
+from unittest.mock import patch
+from pipeline.extractors.index import ExtractionIndex
+from pipeline.extractors.runner import extract_source
+
+def write(path, payload=b"audio"):
+    path.write_bytes(payload)
+    return str(path)
+
+def test_record_and_lookup_per_profile(tmp_path):
+    audio = write(tmp_path / "abc.opus")
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        index.record("youtube:abc", "asr", "https://youtu.be/abc", audio, metadata={"service_metadata": {"channel_id": "UC1"}})
+
+        entry = index.lookup("youtube:abc", "asr")
+        assert (entry.format, entry.size_bytes, entry.channel_id) == ("opus", 5, "UC1")
+        assert entry.matches_output(str(tmp_path / "abc.mp3"))
+        assert not entry.matches_output(str(tmp_path / "other.mp3"))
+        assert index.lookup("youtube:abc", "archive") is None
+
+    # Entries persist across connections
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        assert [e.key for e in index.entries(channel_id="UC1")] == ["youtube:abc"]
+
+def test_lookup_drops_deleted_or_modified_audio(tmp_path):
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        deleted = write(tmp_path / "a.mp3")
+        modified = write(tmp_path / "b.mp3")
+        index.record("youtube:a", "archive", "a", deleted)
+        index.record("youtube:b", "archive", "b", modified)
+        os.remove(deleted)
+        write(tmp_path / "b.mp3", b"truncated")
+
+        assert index.lookup("youtube:a", "archive") is None
+        assert index.lookup("youtube:b", "archive") is None
+        assert index.entries() == []
+
+def test_verify_reports_and_removes_stale_entries(tmp_path):
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        for name in ("a", "b", "c"):
+            index.record(f"youtube:{name}", "archive", name, write(tmp_path / f"{name}.mp3"))
+        os.remove(tmp_path / "a.mp3")
+        write(tmp_path / "b.mp3", b"rewritten")
+
+        dry_run = index.verify(remove=False)
+        report = index.verify()
+
+        assert (dry_run.checked, dry_run.removed) == (3, 2)
+        assert report.missing == [str(tmp_path / "a.mp3")] and report.changed == [str(tmp_path / "b.mp3")]
+        assert [e.key for e in index.entries()] == ["youtube:c"]
+
+def test_file_key_is_memoized_until_file_changes(tmp_path):
+    video = write(tmp_path / "clip.mp4", b"video bytes")
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        first = index.file_key(video)
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert index.file_key(video) == first
+
+        write(tmp_path / "clip.mp4", b"other video bytes")
+        assert index.file_key(video) != first
+        assert first.startswith("sha256:")
+
+@patch("pipeline.extractors.local.file_audio.extract_audio_from_file")
+def test_extract_source_skips_indexed_local_files(mock_extract, tmp_path):
+    video = write(tmp_path / "clip.mp4", b"video")
+    output_path = tmp_path / "clip.mp3"
+    mock_extract.side_effect = lambda source, output: write(output_path)
+
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        first = extract_source(video, str(output_path), index=index)
+        second = extract_source(video, str(output_path), index=index)
+        extract_source(video, str(tmp_path / "elsewhere.mp3"), index=index)
+
+    assert mock_extract.call_count == 2
+    assert second.audio_path == first.audio_path
+    assert second.metadata_path == str(tmp_path / "clip.json")
@@ -0,0 +1,100 @@
+"""
+File: test_runner.py
+
+Unit tests for single-source extraction routing.
+
+Covers:
+- YouTube video ID parsing and unique output naming per source
+- Source de-duplication
+- File-system extraction with placeholder metadata written next to the audio
+- Extraction continuing (and indexing no metadata path) when metadata cannot be saved
+- Error handling for missing files
+- Storage sources routed to the streaming StorageExtractor
+"""
+import json
+from unittest.mock import patch
+import pytest
+from pipeline.extractors.runner import (
+    youtube_video_id,
+    output_stem_for,
+    unique_sources,
+    extract_source,
+)
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.youtube.com/watch?v=abc123&t=10", "abc123"),
+    ("https://youtu.be/xyz789", "xyz789"),
+    ("https://www.youtube.com/shorts/short01", "short01"),
+    ("https://vimeo.com/12345", None),
+    ("https://m.youtube.com/watch?v=mobile1", "mobile1"),
+    ("https://notyoutube.com/watch?v=abc123", None),
+    ("https://evil-youtube.com.example/watch?v=abc123", None),
+    ("https://notyoutu.be/xyz789", None),
+    ("/home/user/video.mp4", None),
+])
+def test_youtube_video_id(url, expected):
+    assert youtube_video_id(url) == expected
+
+def test_output_stem_for_is_unique_and_safe():
+    assert output_stem_for("https://youtu.be/xyz789") == "xyz789"
+    first = output_stem_for("/a/talk one.mp4")
+    second = output_stem_for("/b/talk one.mp4")
+    assert first.startswith("talk_one-") and second.startswith("talk_one-")
+    assert first != second
+
+def test_unique_sources_preserves_order():
+    sources = ["https://youtu.be/a", "https://youtu.be/b", "https://youtu.be/a"]
+
+    assert list(unique_sources(sources)) == ["https://youtu.be/a", "https://youtu.be/b"]
+
+@patch("pipeline.extractors.local.file_audio.extract_audio_from_file")
+def test_extract_source_local_file_writes_metadata(mock_extract, tmp_path):
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    output_path = tmp_path / "clip.mp3"
+    mock_extract.return_value = str(output_path)
+
+    result = extract_source(str(video), str(output_path))
+
+    mock_extract.assert_called_once_with(str(video), str(output_path))
+    assert result.source_type == "file_system"
+    assert result.audio_path == str(output_path)
+    metadata = json.loads((tmp_path / "clip.json").read_text())
+    assert metadata["title"] == "clip.mp4"
+    assert metadata["metadata_status"] == "incomplete"
+
+@patch("pipeline.extractors.local.file_audio.extract_audio_from_file")
+def test_extract_source_continues_when_metadata_cannot_be_saved(mock_extract, tmp_path):
+    from pipeline.extractors.index import ExtractionIndex
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    output_path = tmp_path / "clip.mp3"
+    (tmp_path / "clip.json").mkdir()        # the metadata path cannot be opened for writing
+
+    def fake_extract(source, output):
+        output_path.write_bytes(b"audio")
+        return str(output_path)
+
+    mock_extract.side_effect = fake_extract
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        result = extract_source(str(video), str(output_path), index=index)
+        [entry] = index.entries()
+
+    assert result.audio_path == str(output_path)
+    assert result.metadata_path is None
+    assert entry.metadata_path is None
+
+def test_extract_source_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        extract_source(str(tmp_path / "missing.mp4"), str(tmp_path / "out.mp3"))
+
+def test_extract_source_storage_uses_storage_extractor(tmp_path):
+    metadata = {"title": "video.mp4", "source_type": "storage"}
+    with patch("pipeline.extractors.storage.extractor.StorageExtractor") as extractor_class:
+        extractor_class.return_value.extract.return_value = (metadata, str(tmp_path / "out.flac"))
+        result = extract_source("s3://bucket/video.mp4", str(tmp_path / "out.mp3"), profile="asr")
+
+    extractor_class.assert_called_once_with("asr")
+    assert result.source_type == "storage"
+    assert result.audio_path == str(tmp_path / "out.flac")
+    assert json.loads((tmp_path / "out.json").read_text()) == metadata
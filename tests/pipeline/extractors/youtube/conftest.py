@@ -0,0 +1,201 @@
+"""
+File: conftest.py
+
+Local stand-in for YouTube used by the YouTube extractor tests.
+
+An HTTP server on 127.0.0.1 serves a fake format list per video (JSON), playlist and
+channel listings, and small real media files for each format. yt_dlp InfoExtractors
+registered for youtube.com watch, playlist and @channel URLs resolve against that server, so the extractor runs the real yt_dlp download and
+post-processing code without network access. Media honours HTTP Range requests, and
+setting `server.drop_after` closes every media response after that many bytes, like a
+flaky link. Every request path, client connection and media range start is recorded,
+and each test gets its own yt_dlp session pool.
+"""
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from yt_dlp import YoutubeDL
+from yt_dlp.extractor.common import InfoExtractor
+from pipeline.extractors.youtube.sessions import YoutubeDLSessionPool
+from pipeline.utils.ffmpeg import ffmpeg_executable
+
+# (file name, ffmpeg output arguments) for the served media
+MEDIA_FILES = {
+    "tiny.m4a": ["-vn", "-c:a", "aac", "-b:a", "24k"],
+    "low.webm": ["-vn", "-c:a", "libopus", "-b:a", "48k"],
+    "high.m4a": ["-vn", "-c:a", "aac", "-b:a", "128k"],
+    "best.webm": ["-vn", "-c:a", "libopus", "-b:a", "160k"],
+    "muxed.mp4": ["-c:v", "mpeg4", "-c:a", "aac"],
+    "video.mp4": ["-an", "-c:v", "mpeg4"],
+}
+
+def standin_playlist(list_id):
+    """Video IDs of a stand-in playlist: <prefix><n> holds the first n videos <prefix>v0, <prefix>v1, ..."""
+    prefix = list_id.rstrip("0123456789")
+    return [f"{prefix}v{index}" for index in range(int(list_id[len(prefix):]))]
+
+# Channel handle -> playlists shown as channel tabs (videos, shorts)
+STANDIN_CHANNELS = {"standin": ["VD3", "SH2"]}
+
+def standin_formats(base_url):
+    """Format list resembling YouTube's: muxed, video-only and several audio-only streams."""
+    return [
+        {"format_id": "18", "url": f"{base_url}/media/muxed.mp4", "ext": "mp4", "vcodec": "mp4v", "acodec": "mp4a.40.2", "tbr": 500},
+        {"format_id": "137", "url": f"{base_url}/media/video.mp4", "ext": "mp4", "vcodec": "mp4v", "acodec": "none", "tbr": 2000},
+        {"format_id": "599", "url": f"{base_url}/media/tiny.m4a", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.5", "abr": 24},
+        {"format_id": "249", "url": f"{base_url}/media/low.webm", "ext": "webm", "vcodec": "none", "acodec": "opus", "abr": 50},
+        {"format_id": "140", "url": f"{base_url}/media/high.m4a", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 129},
+        {"format_id": "251", "url": f"{base_url}/media/best.webm", "ext": "webm", "vcodec": "none", "acodec": "opus", "abr": 160},
+    ]
+
+class StandInHandler(SimpleHTTPRequestHandler):
+    """Serves /api/<video id>.json format lists and /media/<file> from the media directory."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        self.server.connections.add(self.client_address)
+        if self.path.startswith("/api/"):
+            video_id = self.path[len("/api/"):].removesuffix(".json")
+            if video_id.startswith("playlist-"):
+                list_id = video_id[len("playlist-"):]
+                return self._send_json({"id": list_id, "title": f"Playlist {list_id}", "entries": standin_playlist(list_id)})
+            if video_id.startswith("channel-"):
+                return self._send_json({"playlists": STANDIN_CHANNELS[video_id[len("channel-"):]]})
+            if "missing" in video_id:
+                self.send_error(404)
+                return
+            self._send_json({
+                "id": video_id,
+                "title": f"Stand-in video {video_id}",
+                "uploader": "Stand-in Channel",
+                "channel_id": "UCstandin",
+                "duration": 2,
+                "view_count": 42,
+                "formats": standin_formats(self.server.base_url),
+            })
+            return
+        time.sleep(self.server.media_delay)
+        self._send_media()
+
+    def _send_media(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        start, end = 0, len(data) - 1
+        requested = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if requested:
+            start = int(requested.group(1))
+            end = min(int(requested.group(2) or end), end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        else:
+            self.send_response(200)
+        self.server.range_starts.append(start)
+        body = data[start:end + 1]
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.server.drop_after is not None and len(body) > self.server.drop_after:
+            body = body[:self.server.drop_after]
+            self.close_connection = True
+        self.server.media_bytes += len(body)
+        self.wfile.write(body)
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def translate_path(self, path):
+        return os.path.join(self.server.media_dir, os.path.basename(path.split("?")[0]))
+
+    def log_message(self, *args):
+        pass
+
+class StandInIE(InfoExtractor):
+    """Resolves youtube.com watch URLs against the stand-in server."""
+    IE_NAME = "standin"
+    _VALID_URL = r"https?://(?:www\.)?youtube\.com/watch\?v=(?P<id>[\w-]+)"
+    base_url = None
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        return self._download_json(f"{self.base_url}/api/{video_id}.json", video_id)
+
+class StandInPlaylistIE(InfoExtractor):
+    """Lists stand-in playlists as unresolved video URLs."""
+    IE_NAME = "standin:playlist"
+    _VALID_URL = r"https?://(?:www\.)?youtube\.com/playlist\?list=(?P<id>\w+)"
+
+    def _real_extract(self, url):
+        list_id = self._match_id(url)
+        listing = self._download_json(f"{StandInIE.base_url}/api/playlist-{list_id}.json", list_id)
+        entries = [self.url_result(f"https://www.youtube.com/watch?v={video_id}", StandInIE, video_id) for video_id in listing["entries"]]
+        return self.playlist_result(entries, list_id, listing["title"])
+
+class StandInChannelIE(InfoExtractor):
+    """Lists a stand-in channel's tabs as playlist URLs."""
+    IE_NAME = "standin:channel"
+    _VALID_URL = r"https?://(?:www\.)?youtube\.com/@(?P<id>\w+)"
+
+    def _real_extract(self, url):
+        handle = self._match_id(url)
+        listing = self._download_json(f"{StandInIE.base_url}/api/channel-{handle}.json", handle)
+        entries = [self.url_result(f"https://www.youtube.com/playlist?list={list_id}", StandInPlaylistIE, list_id) for list_id in listing["playlists"]]
+        return self.playlist_result(entries, handle, handle)
+
+class StandInYoutubeDL(YoutubeDL):
+    """YoutubeDL that only knows the stand-in extractors."""
+    def __init__(self, params=None, auto_init=True):
+        super().__init__(params, auto_init=False)
+        for ie in (StandInIE(), StandInPlaylistIE(), StandInChannelIE()):
+            self.add_info_extractor(ie)
+
+@pytest.fixture(scope="session")
+def standin_media(tmp_path_factory):
+    media_dir = tmp_path_factory.mktemp("standin_media")
+    for name, output_args in MEDIA_FILES.items():
+        subprocess.run([
+            ffmpeg_executable(), "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=96x64:rate=5:duration=2",
+            "-f", "lavfi", "-i", "sine=frequency=330:sample_rate=48000:duration=2",
+            *output_args, "-shortest", str(media_dir / name)
+        ], check=True)
+    return media_dir
+
+@pytest.fixture
+def youtube_standin(standin_media, monkeypatch):
+    """Start the stand-in server and route the extractor's YoutubeDL to it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.media_dir = str(standin_media)
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.requests = []
+    server.connections = set()
+    server.media_delay = 0
+    server.drop_after = None
+    server.range_starts = []
+    server.media_bytes = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(StandInIE, "base_url", server.base_url)
+    monkeypatch.setattr("pipeline.extractors.youtube.extractor.YoutubeDL", StandInYoutubeDL)
+    pool = YoutubeDLSessionPool()
+    monkeypatch.setattr("pipeline.extractors.youtube.sessions._pool", pool)
+    server.pool = pool
+    yield server
+    pool.close()
+    server.shutdown()
+    server.server_close()
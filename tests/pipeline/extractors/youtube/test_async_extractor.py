@@ -0,0 +1,76 @@
+"""
+File: test_async_extractor.py
+
+Tests for the asyncio YouTube extractor against the local YouTube stand-in.
+
+Covers:
+- Driving many concurrent extractions from one event loop with a bounded thread pool
+- Timeouts and task cancellation aborting the underlying yt_dlp download
+- The synchronous facade over the async extractor
+"""
+import asyncio
+import threading
+import pytest
+from pipeline.extractors.base import SyncExtractorFacade
+from pipeline.extractors.youtube.async_extractor import AsyncYouTubeExtractor
+
+def watch(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+def test_many_extractions_share_a_bounded_pool(youtube_standin, tmp_path):
+    async def main():
+        extractor = AsyncYouTubeExtractor("asr", max_workers=3)
+        try:
+            return await asyncio.gather(*(
+                extractor.extract(watch(f"async{index}"), str(tmp_path / f"async{index}.mp3")) for index in range(9)
+            ))
+        finally:
+            await extractor.aclose()
+
+    results = asyncio.run(main())
+
+    assert [metadata["source_url"] for metadata, _ in results] == [watch(f"async{index}") for index in range(9)]
+    assert all(audio_path.endswith(".opus") for _, audio_path in results)
+    assert youtube_standin.pool.created <= 3
+    assert not any(thread.name.startswith("yt-async") for thread in threading.enumerate())
+
+def test_timeout_aborts_the_download(youtube_standin, tmp_path):
+    youtube_standin.media_delay = 0.5
+
+    async def main():
+        extractor = AsyncYouTubeExtractor("asr", timeout=0.2)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await extractor.extract_audio(watch("slow"), str(tmp_path / "slow.mp3"))
+        finally:
+            await extractor.aclose()
+
+    asyncio.run(main())
+
+    # The worker stopped at its first progress callback instead of finishing the download
+    assert not (tmp_path / "slow.opus").exists()
+    assert youtube_standin.pool.idle_count == 0
+
+def test_cancelled_jobs_that_have_not_started_never_run(youtube_standin, tmp_path):
+    youtube_standin.media_delay = 0.3
+
+    async def main():
+        extractor = AsyncYouTubeExtractor("asr", max_workers=1)
+        first = asyncio.ensure_future(extractor.extract_audio(watch("first"), str(tmp_path / "first.mp3")))
+        queued = asyncio.ensure_future(extractor.extract_audio(watch("queued"), str(tmp_path / "queued.mp3")))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        path = await first
+        await extractor.aclose()
+        return path, queued.cancelled()
+
+    path, cancelled = asyncio.run(main())
+
+    assert path.endswith("first.opus") and cancelled
+    assert "/api/queued.json" not in youtube_standin.requests
+
+def test_sync_facade(youtube_standin, tmp_path):
+    extractor = SyncExtractorFacade(AsyncYouTubeExtractor("copy"))
+
+    assert extractor.extract_metadata(watch("facade"))["title"] == "Stand-in video facade"
+    assert extractor.extract_audio(watch("facade"), str(tmp_path / "facade.mp3")).endswith(".opus")
@@ -0,0 +1,101 @@
+"""
+File: test_collection.py
+
+Tests for playlist and channel expansion against the local YouTube stand-in.
+
+Covers:
+- Listing playlist entries with flat extraction (no per-video requests)
+- Expanding channel tabs into their videos, and single videos to themselves
+- Concurrent, rate-limited metadata extraction yielding results as they complete
+- Reporting and skipping videos whose metadata cannot be fetched
+- Retried metadata requests each taking a rate-limit token
+"""
+import time
+from pipeline.extractors.youtube import collection
+from pipeline.extractors.youtube.collection import iter_collection_metadata
+from pipeline.extractors.runner import is_collection_url
+from pipeline.extractors.youtube.extractor import YouTubeExtractor
+
+PLAYLIST = "https://www.youtube.com/playlist?list=PL5"
+CHANNEL = "https://www.youtube.com/@standin"
+
+def api_requests(server):
+    return [path for path in server.requests if path.startswith("/api/")]
+
+def test_is_collection_url():
+    assert is_collection_url(PLAYLIST)
+    assert is_collection_url(CHANNEL)
+    assert is_collection_url("https://www.youtube.com/channel/UCabc/videos")
+    assert not is_collection_url("https://www.youtube.com/watch?v=abc")
+
+def test_expand_playlist_lists_entries_without_resolving_videos(youtube_standin):
+    urls = YouTubeExtractor().expand(PLAYLIST)
+
+    assert urls == [f"https://www.youtube.com/watch?v=PLv{index}" for index in range(5)]
+    assert api_requests(youtube_standin) == ["/api/playlist-PL5.json"]
+
+def test_expand_channel_follows_tabs(youtube_standin):
+    urls = YouTubeExtractor().expand(CHANNEL)
+
+    assert [url.rsplit("=", 1)[1] for url in urls] == ["VDv0", "VDv1", "VDv2", "SHv0", "SHv1"]
+
+def test_expand_single_video_returns_itself(youtube_standin):
+    url = "https://www.youtube.com/watch?v=solo"
+
+    assert YouTubeExtractor().expand(url) == [url]
+
+def test_collection_metadata_is_fetched_concurrently(youtube_standin):
+    results = list(iter_collection_metadata("https://www.youtube.com/playlist?list=PL12", workers=4, rate=1000))
+
+    assert sorted(m["source_url"] for m in results) == sorted(YouTubeExtractor().expand("https://www.youtube.com/playlist?list=PL12"))
+    assert all(m["title"].startswith("Stand-in video PLv") for m in results)
+    assert youtube_standin.pool.created <= 5
+
+def test_collection_metadata_respects_rate(youtube_standin):
+    start = time.monotonic()
+    results = list(iter_collection_metadata(PLAYLIST, workers=4, rate=20, burst=1))
+
+    assert len(results) == 5
+    # One banked token, then four refills at 20/s
+    assert time.monotonic() - start >= 0.19
+
+def test_failed_videos_are_reported_and_skipped(youtube_standin, monkeypatch):
+    monkeypatch.setattr("pipeline.utils.retry.time.sleep", lambda seconds: None)
+    extractor = YouTubeExtractor()
+    monkeypatch.setattr(extractor, "expand", lambda source: ["https://www.youtube.com/watch?v=ok1", "https://www.youtube.com/watch?v=missing1"])
+    failures = []
+
+    results = list(iter_collection_metadata(PLAYLIST, extractor=extractor, on_error=lambda url, e: failures.append(url)))
+
+    assert [m["source_url"] for m in results] == ["https://www.youtube.com/watch?v=ok1"]
+    assert failures == ["https://www.youtube.com/watch?v=missing1"]
+
+def test_retries_take_a_token_per_attempt(monkeypatch):
+    monkeypatch.setattr("pipeline.utils.retry.time.sleep", lambda seconds: None)
+    acquired = []
+
+    class CountingBucket:
+        def __init__(self, rate, capacity=1.0):
+            pass
+
+        def acquire(self):
+            acquired.append(1)
+
+    monkeypatch.setattr(collection, "TokenBucket", CountingBucket)
+    extractor = YouTubeExtractor()
+    monkeypatch.setattr(extractor, "expand", lambda source: ["https://www.youtube.com/watch?v=flaky"])
+    attempts = []
+
+    def flaky_fetch(url):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise RuntimeError("HTTP 429")
+        return {"source_url": url}
+
+    monkeypatch.setattr(extractor, "fetch_metadata", flaky_fetch)
+
+    results = list(iter_collection_metadata(PLAYLIST, extractor=extractor))
+
+    assert results == [{"source_url": "https://www.youtube.com/watch?v=flaky"}]
+    assert len(attempts) == 3
+    assert len(acquired) == 3
@@ -6,6 +6,7 @@ Test suite for audio extraction and download functionality.
 Covers:
 - Unit tests for internal logic using mocks (e.g. download_audio behavior)
 - Metadata enrichment and fallback logic
+- yt_dlp options used for metadata-only requests
 - Schema validation for local and YouTube sources
 """
 import os
@@ -58,4 +59,15 @@ def test_extract_metadata_from_youtube_returns_expected_structure(mock_yt_dlp):
 
     # Validate service_metadata
     assert "view_count" in metadata["service_metadata"]
-    assert metadata["service_metadata"]["channel_id"] == "UCabc123"    
\ No newline at end of file
+    assert metadata["service_metadata"]["channel_id"] == "UCabc123"
+
+@patch("pipeline.extractors.youtube.extractor.YoutubeDL")
+def test_extract_metadata_skips_download_without_dumping_json(mock_yt_dlp):
+    mock_yt_dlp.return_value.__enter__.return_value.extract_info.return_value = {"title": "Test Title"}
+
+    YouTubeExtractor().extract_metadata("https://youtube.com/watch?v=abc123")
+
+    options = mock_yt_dlp.call_args[0][0]
+    assert options["skip_download"] is True
+    # forcejson would only echo the info dict to stdout
+    assert "forcejson" not in options
@@ -0,0 +1,49 @@
+"""
+File: test_incremental.py
+
+Tests for skipping already-extracted YouTube videos via the extraction index, against
+the local YouTube stand-in.
+
+Covers:
+- Re-extracting an indexed video without any yt_dlp request
+- Re-downloading after the indexed audio was deleted
+- Incremental channel syncs that only download videos missing from the index
+"""
+import os
+from functools import partial
+from pipeline.extractors.bulk import expand_collections, extract_many
+from pipeline.extractors.index import ExtractionIndex
+from pipeline.extractors.runner import extract_source
+from pipeline.extractors.youtube.extractor import YouTubeExtractor
+
+URL = "https://www.youtube.com/watch?v=standin01"
+
+def test_indexed_video_is_not_requested_again(youtube_standin, tmp_path):
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        extractor = YouTubeExtractor("asr", index=index)
+        metadata, audio_path = extractor.extract(URL, str(tmp_path / "standin01.mp3"))
+        requests_after_first = len(youtube_standin.requests)
+
+        assert extractor.extract(URL, str(tmp_path / "standin01.mp3")) == (metadata, audio_path)
+        assert extractor.extract_audio(URL, str(tmp_path / "standin01.mp3")) == audio_path
+        assert len(youtube_standin.requests) == requests_after_first
+
+        os.remove(audio_path)
+        assert extractor.extract(URL, str(tmp_path / "standin01.mp3"))[1] == audio_path
+        assert len(youtube_standin.requests) > requests_after_first
+
+def test_channel_sync_only_downloads_new_videos(youtube_standin, tmp_path):
+    output_dir = str(tmp_path / "output")
+    with ExtractionIndex(str(tmp_path / "index.sqlite")) as index:
+        extract_fn = partial(extract_source, profile="asr", index=index)
+        first = extract_many(expand_collections(["https://www.youtube.com/playlist?list=VD3"]), output_dir, extract_fn=extract_fn)
+        youtube_standin.requests.clear()
+
+        # The uploads playlist gained one video since the last sync
+        second = extract_many(expand_collections(["https://www.youtube.com/playlist?list=VD4"]), output_dir, extract_fn=extract_fn)
+
+    assert (first.succeeded, second.succeeded) == (3, 4)
+    assert [path for path in youtube_standin.requests if not path.startswith("/media/")] == [
+        "/api/playlist-VD4.json", "/api/VDv3.json"
+    ]
+    assert len([path for path in youtube_standin.requests if path.startswith("/media/")]) == 1
@@ -0,0 +1,74 @@
+"""
+File: test_profiles.py
+
+Tests for YouTube audio extraction profiles against a local HTTP stand-in.
+
+Covers:
+- Choosing the smallest adequate audio-only format for the asr profile
+- Keeping the native container for asr/copy downloads (no MP3 transcode)
+- The archive profile still producing 192 kbps MP3
+- Combined extract() resolving each video with a single info request
+"""
+import os
+import pytest
+from pipeline.extractors.youtube.extractor import YouTubeExtractor, pick_asr_format
+from pipeline.extractors.local.ffmpeg_audio import probe_audio_stream
+from tests.pipeline.extractors.youtube.conftest import standin_formats
+
+URL = "https://www.youtube.com/watch?v=standin01"
+
+def media_requests(server):
+    return [path for path in server.requests if path.startswith("/media/")]
+
+def test_pick_asr_format_prefers_smallest_adequate_audio_only():
+    assert pick_asr_format(standin_formats("http://x"))["format_id"] == "249"
+
+def test_pick_asr_format_fallbacks():
+    formats = standin_formats("http://x")
+    low_only = [f for f in formats if f["format_id"] in ("599", "18", "137")]
+    muxed_only = [f for f in formats if f["format_id"] in ("18", "137")]
+
+    assert pick_asr_format(low_only)["format_id"] == "599"
+    assert pick_asr_format(muxed_only)["format_id"] == "18"
+    assert pick_asr_format([f for f in formats if f["format_id"] == "137"]) is None
+
+def test_asr_profile_downloads_small_stream_in_native_container(youtube_standin, tmp_path):
+    audio_path = YouTubeExtractor("asr").extract_audio(URL, str(tmp_path / "clip.mp3"))
+
+    assert media_requests(youtube_standin) == ["/media/low.webm"]
+    assert audio_path == str(tmp_path / "clip.opus")
+    assert probe_audio_stream(audio_path).codec == "opus"
+    assert not os.path.exists(tmp_path / "clip.mp3")
+
+def test_copy_profile_keeps_best_stream_without_transcode(youtube_standin, tmp_path):
+    audio_path = YouTubeExtractor("copy").extract_audio(URL, str(tmp_path / "clip.mp3"))
+
+    assert media_requests(youtube_standin) == ["/media/best.webm"]
+    assert probe_audio_stream(audio_path).codec == "opus"
+
+def test_archive_profile_transcodes_to_mp3(youtube_standin, tmp_path):
+    audio_path = YouTubeExtractor().extract_audio(URL, str(tmp_path / "clip.mp3"))
+
+    assert audio_path == str(tmp_path / "clip.mp3")
+    assert probe_audio_stream(audio_path).codec == "mp3"
+
+def test_unknown_profile_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        YouTubeExtractor("lossless").session_options()
+
+def test_extract_fetches_info_once_for_metadata_and_audio(youtube_standin, tmp_path):
+    metadata, audio_path = YouTubeExtractor("asr").extract(URL, str(tmp_path / "clip.mp3"))
+
+    api_requests = [path for path in youtube_standin.requests if path.startswith("/api/")]
+    assert api_requests == ["/api/standin01.json"]
+    assert media_requests(youtube_standin) == ["/media/low.webm"]
+    assert metadata["title"] == "Stand-in video standin01"
+    assert metadata["service_metadata"] == {"view_count": 42, "channel_id": "UCstandin"}
+    assert os.path.exists(audio_path)
+
+def test_separate_calls_fetch_info_twice(youtube_standin, tmp_path):
+    extractor = YouTubeExtractor("asr")
+    extractor.extract_metadata(URL)
+    extractor.extract_audio(URL, str(tmp_path / "clip.mp3"))
+
+    assert len([path for path in youtube_standin.requests if path.startswith("/api/")]) == 2
@@ -0,0 +1,77 @@
+"""
+File: test_resume.py
+
+Resumable downloads in YouTubeExtractor, against a stand-in server that drops connections.
+
+Covers:
+- A download interrupted many times completes by resuming with Range requests, never restarting from zero
+- Failed attempts that grew the partial file are retried at once and do not exhaust the retry limit
+- A partial file left by another source is discarded instead of resumed
+- A checkpoint whose format no longer matches restarts the download from byte zero
+- Checkpoint sidecars are removed once the download finishes
+"""
+import os
+from types import SimpleNamespace
+from pipeline.extractors.youtube.checkpoints import DownloadCheckpoint, read_checkpoint, write_checkpoint
+from pipeline.extractors.youtube.extractor import DOWNLOAD_RETRIES, YouTubeExtractor
+
+SOURCE = "https://www.youtube.com/watch?v=resume01"
+
+def _no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("pipeline.utils.retry.time", SimpleNamespace(sleep=sleeps.append))
+    return sleeps
+
+def test_dropped_connections_resume_from_last_byte(youtube_standin, standin_media, tmp_path, monkeypatch):
+    sleeps = _no_sleep(monkeypatch)
+    size = os.path.getsize(standin_media / "best.webm")
+    # Enough drops to exhaust yt_dlp's own retries several times over
+    youtube_standin.drop_after = size // (4 * (DOWNLOAD_RETRIES + 1)) + 1
+
+    audio_path = YouTubeExtractor(profile="copy").extract_audio(SOURCE, str(tmp_path / "clip"))
+
+    assert audio_path == str(tmp_path / "clip.opus")
+    assert os.path.getsize(audio_path) > 0
+    starts = youtube_standin.range_starts
+    assert starts[0] == 0 and starts == sorted(set(starts))
+    assert len(starts) > 3 * (DOWNLOAD_RETRIES + 1)
+    assert sleeps == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["clip.opus"]
+
+def test_partial_file_from_another_source_is_discarded(youtube_standin, standin_media, tmp_path):
+    part_path = str(tmp_path / "clip.webm.part")
+    with open(part_path, "wb") as f:
+        f.write(b"\0" * 4096)
+    write_checkpoint(DownloadCheckpoint("https://www.youtube.com/watch?v=other", part_path, "251", None, 4096))
+
+    YouTubeExtractor(profile="copy").extract_audio(SOURCE, str(tmp_path / "clip"))
+
+    assert youtube_standin.range_starts == [0]
+    assert youtube_standin.media_bytes == os.path.getsize(standin_media / "best.webm")
+
+def test_partial_file_for_same_source_is_resumed(youtube_standin, standin_media, tmp_path):
+    part_path = str(tmp_path / "clip.webm.part")
+    with open(standin_media / "best.webm", "rb") as f:
+        head = f.read(4096)
+    with open(part_path, "wb") as f:
+        f.write(head)
+    write_checkpoint(DownloadCheckpoint(SOURCE, part_path, "251", os.path.getsize(standin_media / "best.webm"), 4096))
+
+    YouTubeExtractor(profile="copy").extract_audio(SOURCE, str(tmp_path / "clip"))
+
+    assert youtube_standin.range_starts == [4096]
+    assert read_checkpoint(part_path) is None
+
+def test_stale_format_restarts_download(youtube_standin, standin_media, tmp_path, monkeypatch):
+    sleeps = _no_sleep(monkeypatch)
+    part_path = str(tmp_path / "clip.webm.part")
+    with open(part_path, "wb") as f:
+        f.write(b"\0" * 4096)
+    write_checkpoint(DownloadCheckpoint(SOURCE, part_path, "249", None, 4096))
+
+    _, audio_path = YouTubeExtractor(profile="copy").extract(SOURCE, str(tmp_path / "clip"))
+
+    assert audio_path == str(tmp_path / "clip.opus")
+    assert youtube_standin.range_starts[-1] == 0
+    assert len(sleeps) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["clip.opus"]
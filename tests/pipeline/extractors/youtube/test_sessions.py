@@ -0,0 +1,100 @@
+"""
+File: test_sessions.py
+
+Tests for the pooled yt_dlp sessions used by the YouTube extractor.
+
+Covers:
+- Reusing one session (and its keep-alive connection) across extractions
+- Separate sessions per option set, and resetting per-call state on each lease
+- Closing sessions whose call raised instead of returning them to the pool
+- Exclusive leases when extracting from several threads
+- Idle caps per option set and across the pool
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pipeline.extractors.youtube.extractor import YouTubeExtractor
+from pipeline.extractors.youtube.sessions import YoutubeDLSessionPool
+
+class FakeYoutubeDL:
+    instances = []
+
+    def __init__(self, params):
+        self.params = {**params, "outtmpl": {"default": None}}
+        self.closed = False
+        self.in_use = threading.Lock()
+        FakeYoutubeDL.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+@pytest.fixture(autouse=True)
+def reset_fake_instances():
+    FakeYoutubeDL.instances = []
+
+def test_extractions_reuse_one_session_and_connection(youtube_standin, tmp_path):
+    extractor = YouTubeExtractor("asr")
+    for index in range(3):
+        extractor.extract(f"https://www.youtube.com/watch?v=standin{index}", str(tmp_path / f"clip{index}.mp3"))
+
+    assert (youtube_standin.pool.created, youtube_standin.pool.reused) == (1, 2)
+    assert len(youtube_standin.connections) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["clip0.opus", "clip1.opus", "clip2.opus"]
+
+def test_sessions_are_keyed_by_options_and_reset_per_lease():
+    pool = YoutubeDLSessionPool()
+    with pool.lease(FakeYoutubeDL, {"format": "a"}, outtmpl="first.%(ext)s") as session:
+        session.final_paths.append("first.opus")
+        first = session.ydl
+    with pool.lease(FakeYoutubeDL, {"format": "b"}) as session:
+        assert session.ydl is not first
+    with pool.lease(FakeYoutubeDL, {"format": "a"}, outtmpl="second.%(ext)s") as session:
+        assert session.ydl is first
+        assert session.final_paths == []
+        assert session.ydl.params["outtmpl"]["default"] == "second.%(ext)s"
+
+def test_failed_lease_closes_session():
+    pool = YoutubeDLSessionPool()
+    with pytest.raises(RuntimeError):
+        with pool.lease(FakeYoutubeDL, {}) as session:
+            raise RuntimeError("connection reset")
+
+    assert session.ydl.closed
+    assert pool.idle_count == 0
+
+def test_concurrent_leases_never_share_a_session():
+    pool = YoutubeDLSessionPool()
+    shared = []
+
+    def work(_):
+        with pool.lease(FakeYoutubeDL, {}) as session:
+            if not session.ydl.in_use.acquire(blocking=False):
+                shared.append(session.ydl)
+                return
+            threading.Event().wait(0.01)
+            session.ydl.in_use.release()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(work, range(32)))
+
+    assert shared == []
+    assert len(FakeYoutubeDL.instances) <= 4
+    assert pool.created + pool.reused == 32
+
+def test_idle_sessions_are_capped():
+    pool = YoutubeDLSessionPool(max_idle_per_key=1, max_idle_total=2)
+    with pool.lease(FakeYoutubeDL, {"format": "a"}):
+        with pool.lease(FakeYoutubeDL, {"format": "a"}):
+            pass
+    for fmt in ("b", "c"):
+        with pool.lease(FakeYoutubeDL, {"format": fmt}):
+            pass
+
+    assert pool.idle_count == 2
+    assert [ydl.closed for ydl in FakeYoutubeDL.instances] == [True, True, False, False]
+
+    pool.close()
+    assert all(ydl.closed for ydl in FakeYoutubeDL.instances)
@@ -0,0 +1,108 @@
+"""
+File: test_streaming.py
+
+Unit tests for the streaming extract -> transcribe pipeline.
+
+Covers:
+- End-to-end processing of every source through both stages
+- Overlap of extraction and transcription across concurrent workers
+- Backpressure from bounded queues between stages
+- Per-stage failure isolation and one transcriber per worker
+"""
+import threading
+import time
+import pytest
+from pipeline.orchestration.streaming import StreamingPipeline
+
+def test_pipeline_processes_all_sources():
+    pipeline = StreamingPipeline(
+        extract_fn=lambda source: f"{source}.mp3",
+        transcriber_factory=lambda: (lambda source, audio: f"{audio}.json"),
+        extract_workers=3,
+        transcribe_workers=2
+    )
+
+    report = pipeline.run([f"s{i}" for i in range(20)])
+
+    assert report.succeeded == 20 and report.failed == 0
+    assert sorted(r.transcript_path for r in report.results) == sorted(f"s{i}.mp3.json" for i in range(20))
+    assert all(r.stage == "done" for r in report.results)
+
+def test_pipeline_overlaps_extraction_and_transcription():
+    sources = [f"s{i}" for i in range(6)]
+
+    def extract(source):
+        time.sleep(0.05)
+        return source
+
+    def factory():
+        def transcribe(source, audio):
+            time.sleep(0.05)
+            return audio
+        return transcribe
+
+    report = StreamingPipeline(extract, factory, extract_workers=1, transcribe_workers=1).run(sources)
+
+    # Serial execution would take ~0.6s; overlapped stages take ~0.35s
+    assert report.succeeded == 6
+    assert report.elapsed < 0.5
+
+def test_pipeline_applies_backpressure():
+    release = threading.Event()
+    extracted = []
+
+    def extract(source):
+        extracted.append(source)
+        return source
+
+    def factory():
+        def transcribe(source, audio):
+            release.wait(timeout=5)
+            return audio
+        return transcribe
+
+    pipeline = StreamingPipeline(extract, factory, extract_workers=1, transcribe_workers=1, queue_size=2)
+    worker = threading.Thread(target=pipeline.run, args=([f"s{i}" for i in range(10)],))
+    worker.start()
+    time.sleep(0.2)
+
+    # One item in transcription, two queued, one held by the blocked extractor
+    assert len(extracted) <= 4
+    release.set()
+    worker.join(timeout=5)
+    assert len(extracted) == 10
+
+def test_pipeline_isolates_failures_per_stage():
+    def extract(source):
+        if source == "bad-extract":
+            raise RuntimeError("download failed")
+        return source
+
+    def factory():
+        def transcribe(source, audio):
+            if source == "bad-transcribe":
+                raise RuntimeError("inference failed")
+            return audio
+        return transcribe
+
+    report = StreamingPipeline(extract, factory).run(["ok", "bad-extract", "bad-transcribe"])
+
+    by_source = {r.source: r for r in report.results}
+    assert by_source["ok"].status == "ok"
+    assert (by_source["bad-extract"].status, by_source["bad-extract"].stage) == ("failed", "extract")
+    assert (by_source["bad-transcribe"].status, by_source["bad-transcribe"].stage) == ("failed", "transcribe")
+
+def test_pipeline_builds_one_transcriber_per_worker():
+    created = []
+
+    def factory():
+        created.append(threading.current_thread().name)
+        return lambda source, audio: audio
+
+    StreamingPipeline(lambda s: s, factory, transcribe_workers=3).run([f"s{i}" for i in range(30)])
+
+    assert len(created) == len(set(created)) <= 3
+
+def test_pipeline_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        StreamingPipeline(lambda s: s, lambda: None, extract_workers=0)
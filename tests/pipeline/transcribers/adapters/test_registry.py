@@ -0,0 +1,213 @@
+"""
+File: test_registry.py
+
+Unit tests for the process-wide transcription model registry.
+
+Covers:
+- Reuse of loaded models keyed by (model_name, device, dtype)
+- Least-recently-used eviction under a memory budget, before loading when the size can be estimated
+- Loads outside the registry lock: hits are not delayed and concurrent requests load once
+- Releasing GPU memory when a CUDA model is evicted
+- Hit, miss, and eviction counters
+- WhisperAdapter sharing models through the registry
+- Serialized inference on a shared model, and one model per adapter with private registries
+"""
+import sys
+import threading
+import time
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from pipeline.transcribers.adapters.registry import ModelRegistry, whisper_size_hint
+from pipeline.transcribers.adapters.whisper import WhisperAdapter
+
+SIZES = {"tiny": 40, "base": 80, "small": 250}
+
+class FakeModel:
+    def __init__(self, name, device, dtype):
+        self.name, self.device, self.dtype = name, device, dtype
+
+@pytest.fixture
+def loads():
+    return []
+
+@pytest.fixture
+def registry_factory(loads):
+    def make(budget_bytes=None):
+        def loader(name, device, dtype):
+            loads.append((name, device, dtype))
+            return FakeModel(name, device, dtype)
+        return ModelRegistry(
+            budget_bytes=budget_bytes, loader=loader,
+            size_fn=lambda m: SIZES[m.name], size_hint=lambda name, dtype: SIZES[name]
+        )
+    return make
+
+def test_registry_reuses_models_per_key(registry_factory, loads):
+    registry = registry_factory()
+
+    first = registry.get("base")
+    second = registry.get("base")
+    other_dtype = registry.get("base", dtype="float16")
+
+    assert first is second
+    assert other_dtype is not first
+    assert loads == [("base", None, "float32"), ("base", None, "float16")]
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 2, 0)
+
+def test_registry_evicts_least_recently_used(registry_factory, loads):
+    registry = registry_factory(budget_bytes=150)
+
+    registry.get("tiny")
+    registry.get("base")
+    registry.get("tiny")            # tiny becomes most recently used
+    registry.get("small")           # exceeds budget on its own; evicts everything else
+
+    stats = registry.stats()
+    assert stats.models == [("small", None, "float32")]
+    assert stats.evictions == 2
+    assert stats.resident_bytes == 250
+
+def test_registry_keeps_within_budget_when_switching(registry_factory, loads):
+    registry = registry_factory(budget_bytes=130)
+
+    for name in ["tiny", "base", "tiny", "base", "tiny"]:
+        registry.get(name)
+
+    assert [name for name, _, _ in loads] == ["tiny", "base"]
+    assert registry.stats().resident_bytes <= 130
+
+    registry.get("small")
+    registry.get("tiny")
+    assert registry.stats().evictions == 3
+    assert registry.stats().models == [("tiny", None, "float32")]
+
+def test_whisper_adapters_share_registry_models(registry_factory, loads):
+    registry = registry_factory()
+
+    first = WhisperAdapter(model_name="tiny", registry=registry)
+    second = WhisperAdapter(model_name="tiny", registry=registry)
+
+    assert first.model is second.model
+    assert loads == [("tiny", None, "float32")]
+    assert first.get_engine_info() == ("whisper", "tiny")
+
+def test_registry_evicts_before_loading(registry_factory, loads):
+    registry = registry_factory(budget_bytes=150)
+    resident_at_load = []
+    loader = registry.loader
+    registry.loader = lambda *key: (resident_at_load.append(registry.stats().models), loader(*key))[1]
+
+    registry.get("tiny")
+    registry.get("base")
+    registry.get("small")
+
+    assert resident_at_load[-1] == []
+    assert registry.stats().models == [("small", None, "float32")]
+
+def test_hit_is_not_blocked_by_cold_load(registry_factory):
+    registry = registry_factory()
+    registry.get("tiny")
+    started, release = threading.Event(), threading.Event()
+    loader = registry.loader
+
+    def slow_loader(*key):
+        started.set()
+        release.wait(5)
+        return loader(*key)
+
+    registry.loader = slow_loader
+    cold = threading.Thread(target=registry.get, args=("small",))
+    cold.start()
+    assert started.wait(5)
+
+    begin = time.perf_counter()
+    assert registry.get("tiny").name == "tiny"
+    assert time.perf_counter() - begin < 1
+
+    release.set()
+    cold.join(5)
+
+def test_concurrent_requests_load_once(registry_factory, loads):
+    registry = registry_factory()
+    loader = registry.loader
+    registry.loader = lambda *key: (time.sleep(0.05), loader(*key))[1]
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("base"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [("base", None, "float32")]
+    assert len({id(model) for model in results}) == 1
+
+def test_failed_load_is_not_cached(registry_factory, loads):
+    registry = registry_factory()
+    registry.loader = lambda *key: (_ for _ in ()).throw(OSError("no weights"))
+    with pytest.raises(OSError):
+        registry.get("base")
+    assert registry.stats().models == []
+
+def test_evicted_cuda_model_releases_gpu_memory(monkeypatch):
+    emptied = []
+    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=SimpleNamespace(empty_cache=lambda: emptied.append(1))))
+
+    def loader(name, device, dtype):
+        model = FakeModel(name, device, dtype)
+        model.device = "cuda:0"
+        return model
+
+    registry = ModelRegistry(budget_bytes=100, loader=loader, size_fn=lambda m: SIZES[m.name], size_hint=lambda name, dtype: SIZES[name])
+    registry.get("tiny")
+    registry.get("base")
+
+    assert registry.stats().evictions == 1
+    assert emptied == [1]
+
+def test_whisper_size_hint():
+    assert whisper_size_hint("small.en", "float32") == 244_000_000 * 4
+    assert whisper_size_hint("large-v3", "float16") == 1_550_000_000 * 2
+    assert whisper_size_hint("custom", "float32") == 0
+
+class ReentrancyCheckingModel(FakeModel):
+    """Fails if transcribe() runs on this model from two threads at once."""
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.active = 0
+        self.peak = 0
+        self.guard = threading.Lock()
+
+    def transcribe(self, audio, language=None):
+        with self.guard:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.guard:
+            self.active -= 1
+        return {"text": "", "segments": [], "language": language}
+
+def _transcribe_concurrently(adapters):
+    audio = np.zeros(16000, dtype=np.float32)
+    threads = [threading.Thread(target=a.transcribe, args=(audio,)) for a in adapters for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_shared_model_inference_is_serialized():
+    registry = ModelRegistry(loader=ReentrancyCheckingModel, size_fn=lambda m: 0)
+    adapters = [WhisperAdapter(model_name="tiny", registry=registry) for _ in range(4)]
+
+    _transcribe_concurrently(adapters)
+
+    assert registry.get("tiny").peak == 1
+
+def test_private_registries_give_each_adapter_its_own_model():
+    adapters = [WhisperAdapter(model_name="tiny", registry=ModelRegistry(loader=ReentrancyCheckingModel, size_fn=lambda m: 0)) for _ in range(4)]
+
+    _transcribe_concurrently(adapters)
+
+    assert all(a.model.peak == 1 for a in adapters)
+    assert len({id(a.model) for a in adapters}) == 4
@@ -0,0 +1,149 @@
+"""
+File: test_audio.py
+
+Unit tests for audio decoding and the decoded-PCM cache.
+
+Covers:
+- Decoding to 16 kHz mono float32 and writing the .npy entry to the cache directory
+- Warm loads memory-mapping the cache without running ffmpeg
+- Re-decoding when the artifact changes, and the cache being off by default
+- Least-recently-used eviction to the size budget
+- WhisperAdapter passing cached arrays straight to the model
+"""
+import os
+import subprocess
+import threading
+import wave
+import numpy as np
+import pytest
+from pipeline.transcribers import audio as audio_module
+from pipeline.transcribers.adapters.whisper import WhisperAdapter
+from pipeline.transcribers.audio import (
+    PCM_CACHE_DIR_ENV_VAR, PCM_CACHE_ENV_VAR, PCM_CACHE_MAX_MB_ENV_VAR, SAMPLE_RATE,
+    load_audio_cached, pcm_cache_path
+)
+
+@pytest.fixture
+def pcm_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "pcm-cache"
+    monkeypatch.setenv(PCM_CACHE_ENV_VAR, "1")
+    monkeypatch.setenv(PCM_CACHE_DIR_ENV_VAR, str(cache_dir))
+    return cache_dir
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "tone.wav"
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((0.25 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16).tobytes())
+    return str(path)
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(audio_module.subprocess, "run", counting_run)
+    return calls
+
+class FakeModel:
+    def __init__(self):
+        self.inputs = []
+
+    def transcribe(self, audio, language=None):
+        self.inputs.append(audio)
+        return {"text": "", "segments": [], "language": language}
+
+class FakeRegistry:
+    def __init__(self, model):
+        self.model = model
+
+    def get(self, model_name, device=None, dtype="float32"):
+        return self.model
+
+    def inference_lock(self, model_name, device=None, dtype="float32"):
+        return threading.Lock()
+
+def test_first_load_decodes_and_writes_cache(wav_path, ffmpeg_calls, pcm_cache_dir):
+    audio = load_audio_cached(wav_path)
+
+    assert len(ffmpeg_calls) == 1
+    assert pcm_cache_path(wav_path).startswith(str(pcm_cache_dir))
+    assert os.path.exists(pcm_cache_path(wav_path))
+    assert sorted(os.listdir(os.path.dirname(wav_path))) == ["pcm-cache", "tone.wav"]
+    assert audio.dtype == np.float32 and len(audio) == SAMPLE_RATE
+    assert abs(float(np.max(audio)) - 0.25) < 0.01
+
+def test_warm_load_memory_maps_without_ffmpeg(wav_path, ffmpeg_calls, pcm_cache_dir):
+    cold = load_audio_cached(wav_path)
+    warm = load_audio_cached(wav_path)
+
+    assert len(ffmpeg_calls) == 1
+    assert isinstance(warm, np.memmap)
+    np.testing.assert_array_equal(cold, warm)
+    # Copy-on-write: modifying the loaded array leaves the cache intact
+    warm[:10] = 1.0
+    assert float(load_audio_cached(wav_path)[0]) != 1.0
+
+def test_stale_cache_is_redecoded(wav_path, ffmpeg_calls, pcm_cache_dir):
+    load_audio_cached(wav_path)
+    stale_path = pcm_cache_path(wav_path)
+    mtime = os.path.getmtime(wav_path)
+    os.utime(wav_path, (mtime + 10, mtime + 10))
+
+    load_audio_cached(wav_path)
+
+    assert len(ffmpeg_calls) == 2
+    assert pcm_cache_path(wav_path) != stale_path
+
+def test_cache_is_off_by_default(wav_path, ffmpeg_calls, tmp_path, monkeypatch):
+    monkeypatch.delenv(PCM_CACHE_ENV_VAR, raising=False)
+    monkeypatch.setenv(PCM_CACHE_DIR_ENV_VAR, str(tmp_path / "pcm-cache"))
+
+    load_audio_cached(wav_path)
+    load_audio_cached(wav_path)
+
+    assert len(ffmpeg_calls) == 2
+    assert os.listdir(tmp_path) == ["tone.wav"]
+
+def test_cache_evicts_least_recently_used(tmp_path, ffmpeg_calls, pcm_cache_dir, monkeypatch):
+    # Each 1 s entry is ~64 KB; the budget fits two
+    monkeypatch.setenv(PCM_CACHE_MAX_MB_ENV_VAR, str(150 / 1024))
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"tone{index}.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes(np.zeros(SAMPLE_RATE, dtype=np.int16).tobytes())
+        paths.append(str(path))
+
+    load_audio_cached(paths[0])
+    load_audio_cached(paths[1])
+    os.utime(pcm_cache_path(paths[0]), (0, 0))
+    os.utime(pcm_cache_path(paths[1]), (1, 1))
+    load_audio_cached(paths[0])            # hit refreshes tone0
+    load_audio_cached(paths[2])            # evicts tone1
+
+    assert os.path.exists(pcm_cache_path(paths[0]))
+    assert not os.path.exists(pcm_cache_path(paths[1]))
+    assert os.path.exists(pcm_cache_path(paths[2]))
+    assert len(ffmpeg_calls) == 3
+
+def test_whisper_adapter_passes_cached_array_to_model(wav_path, ffmpeg_calls, pcm_cache_dir):
+    model = FakeModel()
+    adapter = WhisperAdapter(model_name="tiny", registry=FakeRegistry(model))
+
+    adapter.transcribe(wav_path)
+    adapter.transcribe(wav_path)
+
+    assert len(ffmpeg_calls) == 1
+    assert all(isinstance(audio, np.ndarray) for audio in model.inputs)
@@ -0,0 +1,84 @@
+"""
+File: test_batch.py
+
+Unit tests for batch transcription utilities.
+
+Covers:
+- Source resolution from explicit paths, glob patterns, and manifest files (plain and JSONL)
+- Single adapter reuse across all files in a batch
+- Per-file failure isolation, unique output naming, and throughput reporting
+"""
+import json
+import pytest
+from pipeline.transcribers.batch import (
+    read_manifest,
+    resolve_audio_sources,
+    batch_output_name,
+    transcribe_batch,
+)
+
+class FakeAdapter:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_path, language=None):
+        self.calls.append(audio_path)
+        return {"language": language or "en", "segments": [{"text": "hi", "start": 0.0}]}
+
+    def get_engine_info(self):
+        return ("fake", "1.0")
+
+@pytest.fixture
+def audio_files(tmp_path):
+    paths = []
+    for name in ("a.mp3", "b.mp3", "c.wav"):
+        path = tmp_path / name
+        path.write_bytes(b"audio")
+        paths.append(path)
+    return paths
+
+def test_read_manifest_plain_and_jsonl(tmp_path, audio_files):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# comment\na.mp3\n\n" + json.dumps({"path": str(audio_files[1])}) + "\n")
+
+    paths = read_manifest(str(manifest))
+
+    assert paths == [str(tmp_path / "a.mp3"), str(audio_files[1])]
+
+def test_read_manifest_rejects_entry_without_path(tmp_path):
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(json.dumps({"title": "no path"}) + "\n")
+
+    with pytest.raises(ValueError):
+        read_manifest(str(manifest))
+
+def test_resolve_audio_sources_combines_and_deduplicates(tmp_path, audio_files):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("a.mp3\nc.wav\n")
+
+    paths = resolve_audio_sources([str(audio_files[0])], pattern=str(tmp_path / "*.mp3"), manifest=str(manifest))
+
+    assert paths == [str(audio_files[0]), str(audio_files[1]), str(tmp_path / "c.wav")]
+
+def test_batch_output_name_is_unique_per_stem():
+    used = set()
+    assert batch_output_name("/x/talk.mp3", used) == "talk.json"
+    assert batch_output_name("/y/talk.mp3", used) == "talk-2.json"
+    assert batch_output_name("/z/talk.mp3", used, ".jsonl.gz") == "talk.jsonl.gz"
+
+def test_transcribe_batch_reuses_adapter_and_isolates_failures(tmp_path, audio_files):
+    adapter = FakeAdapter()
+    sources = [str(audio_files[0]), str(tmp_path / "missing.mp3"), str(audio_files[1])]
+    seen = []
+
+    report = transcribe_batch(adapter, sources, str(tmp_path / "out"), language="en", on_result=seen.append)
+
+    assert adapter.calls == [str(audio_files[0]), str(audio_files[1])]
+    assert [r.status for r in report.results] == ["ok", "failed", "ok"]
+    assert seen == report.results
+    assert report.succeeded == 2 and report.failed == 1
+    assert report.files_per_hour > 0
+
+    data = json.loads((tmp_path / "out" / "a.json").read_text())
+    assert data["metadata"]["engine"] == "fake"
+    assert data["transcript"][0]["text"] == "hi"
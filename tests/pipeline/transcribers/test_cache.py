@@ -0,0 +1,122 @@
+"""
+File: test_cache.py
+
+Unit tests for the content-addressed transcript cache.
+
+Covers:
+- Cache keys derived from audio content, engine, model, language and options
+- Serving hits without invoking the transcriber
+- Size-bounded LRU eviction and pruning, scanning only once the running size exceeds the budget
+- Persisted hit/miss statistics, including without fcntl
+"""
+import os
+import time
+from pipeline.transcribers import cache as cache_module
+from pipeline.transcribers.cache import CachedTranscriber, TranscriptCache, cache_key
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptSegment, TranscriptV1, build_transcript_metadata
+
+def make_transcript(text="hello"):
+    return TranscriptV1(
+        metadata=build_transcript_metadata("whisper", "base", language="en"),
+        transcript=[TranscriptSegment(text=text, timestamp="00:00:00.000")]
+    )
+
+class CountingTranscribe:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, audio_path, language):
+        self.calls.append((audio_path, language))
+        return make_transcript(f"{os.path.basename(audio_path)}:{language}")
+
+def write_audio(path, payload):
+    path.write_bytes(payload)
+    return str(path)
+
+def test_cache_key_depends_on_every_component():
+    base = cache_key("abc", "whisper", "base", None)
+
+    assert base == cache_key("abc", "whisper", "base", None)
+    assert len({
+        base,
+        cache_key("abd", "whisper", "base", None),
+        cache_key("abc", "whisper", "small", None),
+        cache_key("abc", "whisper", "base", "en"),
+        cache_key("abc", "whisper", "base", None, options="vad"),
+    }) == 5
+
+def test_cached_transcriber_serves_identical_content_from_cache(tmp_path):
+    first = write_audio(tmp_path / "a.mp3", b"same audio bytes")
+    reupload = write_audio(tmp_path / "b.mp3", b"same audio bytes")
+    transcribe_fn = CountingTranscribe()
+    cached = CachedTranscriber(transcribe_fn, ("whisper", "base"), TranscriptCache(str(tmp_path / "cache")))
+
+    original = cached(first, None)
+    repeated = cached(reupload, None)
+    cached(first, "de")
+
+    assert repeated == original
+    assert transcribe_fn.calls == [(first, None), (first, "de")]
+    assert (cached.hits, cached.misses) == (1, 2)
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TranscriptCache(str(tmp_path / "cache"))
+    for index, key in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+        cache.put(key, make_transcript(key))
+        os.utime(cache._entry_path(key), (time.time() - 100 + index, time.time() - 100 + index))
+    # Touch the oldest entry so the middle one becomes least recently used
+    assert cache.get("aa" * 32) is not None
+    entry_size = cache._entry_path("aa" * 32).stat().st_size
+
+    result = cache.prune(max_bytes=2 * entry_size)
+
+    assert result.removed == 1
+    assert cache.get("bb" * 32) is None
+    assert cache.get("aa" * 32) is not None and cache.get("cc" * 32) is not None
+
+def test_put_enforces_size_budget(tmp_path):
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=0)
+
+    cache.put("dd" * 32, make_transcript())
+
+    assert cache.stats().entries == 0
+
+def test_put_scans_only_when_over_budget(tmp_path, monkeypatch):
+    entry_size = len(make_transcript().model_dump_json().encode("utf-8"))
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=3 * entry_size)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: (scans.append(1), entries())[1])
+
+    for index in range(3):
+        cache.put(f"{index:02}" * 32, make_transcript())
+    cache.put("00" * 32, make_transcript())          # replacing an entry does not grow the cache
+    assert len(scans) == 1
+
+    cache.put("aa" * 32, make_transcript())
+    assert len(scans) == 2
+    assert cache.stats().size_bytes <= 3 * entry_size
+
+def test_stats_are_persisted_across_instances(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    audio = write_audio(tmp_path / "a.mp3", b"bytes")
+    cached = CachedTranscriber(CountingTranscribe(), ("whisper", "base"), TranscriptCache(cache_dir))
+    cached(audio, None)
+    cached(audio, None)
+    cached(audio, None)
+
+    stats = TranscriptCache(cache_dir).stats()
+
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+    assert round(stats.hit_rate, 2) == 0.67
+
+def test_stats_without_fcntl(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "fcntl", None)
+    cache = TranscriptCache(str(tmp_path / "cache"))
+
+    cache.get("ee" * 32)
+    cache.put("ee" * 32, make_transcript())
+    cache.get("ee" * 32)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
@@ -0,0 +1,158 @@
+"""
+File: test_chunking.py
+
+Unit tests for chunked parallel transcription of long audio.
+
+Covers:
+- Window planning with cut points moved to low-energy regions
+- Timestamp shifting and overlap resolution when stitching window results
+- Parallel transcription through a process pool with per-window retries
+- Replacing the pool after a worker process dies and resubmitting unfinished windows
+"""
+import os
+import wave
+import numpy as np
+from pipeline.utils.retry import retry
+from pipeline.transcribers.audio import SAMPLE_RATE
+from pipeline.transcribers.chunking import (
+    AudioWindow,
+    frame_energy,
+    find_split_points,
+    plan_windows,
+    stitch_segments,
+    ChunkedTranscriber,
+)
+
+FAIL_DIR_ENV = "TEST_CHUNKING_FAIL_DIR"
+CRASH_DIR_ENV = "TEST_CHUNKING_CRASH_DIR"
+
+def bursts_audio(bursts, total_seconds):
+    """Build a waveform that is silent except for tone bursts at (start, end) seconds."""
+    audio = np.zeros(int(total_seconds * SAMPLE_RATE), dtype=np.float32)
+    t = np.arange(len(audio)) / SAMPLE_RATE
+    for start, end in bursts:
+        mask = (t >= start) & (t < end)
+        audio[mask] = 0.5 * np.sin(2 * np.pi * 440 * t[mask])
+    return audio
+
+def speech_spans(audio, frame_seconds=0.05):
+    """Return (start, end) seconds of non-silent runs, in the audio's own timeline."""
+    voiced = frame_energy(audio, SAMPLE_RATE, frame_seconds) > 1e-3
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    return [(s * frame_seconds, e * frame_seconds) for s, e in zip(edges[::2], edges[1::2])]
+
+class BurstAdapter:
+    """Fake adapter emitting one segment per tone burst; fails once per window when asked."""
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    @retry(max_attempts=3, delay=0)
+    def transcribe(self, audio, language=None):
+        fail_dir = os.environ.get(FAIL_DIR_ENV)
+        if fail_dir:
+            marker = os.path.join(fail_dir, f"{len(audio)}")
+            if not os.path.exists(marker):
+                open(marker, "w").close()
+                raise RuntimeError("transient failure")
+        segments = [
+            {"text": f" burst{round(start, 1)}", "start": start, "end": end}
+            for start, end in speech_spans(audio)
+            if end - start > 0.2
+        ]
+        return {"language": "en", "segments": segments}
+
+    def get_engine_info(self):
+        return ("fake", self.model_name)
+
+def burst_adapter_factory(model_name):
+    return BurstAdapter(model_name)
+
+class CrashOnceAdapter(BurstAdapter):
+    """Kills its worker process on the first call across the whole pool."""
+    def transcribe(self, audio, language=None):
+        marker = os.path.join(os.environ[CRASH_DIR_ENV], "crashed")
+        if not os.path.exists(marker):
+            open(marker, "w").close()
+            os._exit(1)
+        return super().transcribe(audio, language=language)
+
+def crash_once_adapter_factory(model_name):
+    return CrashOnceAdapter(model_name)
+
+def write_wav(path, audio):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+BURSTS = [(1.0, 9.0), (10.0, 19.0), (21.0, 29.5), (31.0, 38.0), (40.0, 47.0)]
+
+def test_split_points_land_in_silence():
+    audio = bursts_audio(BURSTS, 50.0)
+
+    cuts = find_split_points(audio, window_seconds=20.0, search_seconds=3.0)
+
+    assert len(cuts) == 2
+    for cut in cuts:
+        assert np.max(np.abs(audio[cut:cut + 800])) < 1e-3
+
+def test_plan_windows_cover_audio_with_overlap():
+    audio = bursts_audio(BURSTS, 50.0)
+
+    windows = plan_windows(audio, window_seconds=20.0, overlap_seconds=1.0, search_seconds=3.0)
+
+    assert windows[0].start == 0 and windows[-1].end == len(audio)
+    for left, right in zip(windows, windows[1:]):
+        assert left.keep_end == right.keep_start
+        assert right.start < left.end
+    assert windows[-1].keep_end == float("inf")
+
+def test_stitch_segments_shifts_and_deduplicates():
+    windows = [
+        AudioWindow(0, 0, 11 * SAMPLE_RATE, 0.0, 10.0),
+        AudioWindow(1, 9 * SAMPLE_RATE, 20 * SAMPLE_RATE, 10.0, float("inf")),
+    ]
+    results = [
+        {"segments": [{"text": "a", "start": 1.0, "end": 4.0}, {"text": "b", "start": 8.5, "end": 10.5}]},
+        {"segments": [{"text": "b", "start": 0.0, "end": 1.5}, {"text": "c", "start": 3.0, "end": 6.0}]},
+    ]
+
+    stitched = stitch_segments(windows, results)
+
+    assert [(s["text"], s["start"]) for s in stitched] == [("a", 1.0), ("b", 8.5), ("c", 12.0)]
+    assert [s["id"] for s in stitched] == [0, 1, 2]
+
+def test_chunked_transcriber_matches_original_timeline(tmp_path, monkeypatch):
+    fail_dir = tmp_path / "failures"
+    fail_dir.mkdir()
+    monkeypatch.setenv(FAIL_DIR_ENV, str(fail_dir))
+    audio_path = tmp_path / "long.wav"
+    write_wav(audio_path, bursts_audio(BURSTS, 50.0))
+
+    with ChunkedTranscriber("tiny", workers=2, window_seconds=20.0, search_seconds=3.0,
+                            adapter_factory=burst_adapter_factory) as transcriber:
+        raw = transcriber.transcribe(str(audio_path))
+
+    starts = [round(s["start"], 1) for s in raw["segments"]]
+    assert starts == [start for start, _ in BURSTS]
+    assert raw["language"] == "en"
+    # Every window failed once and was retried individually
+    assert len(os.listdir(fail_dir)) == 3
+    assert transcriber.get_engine_info() == ("whisper", "tiny")
+
+def test_chunked_transcriber_recovers_from_a_dead_worker(tmp_path, monkeypatch):
+    crash_dir = tmp_path / "crashes"
+    crash_dir.mkdir()
+    monkeypatch.setenv(CRASH_DIR_ENV, str(crash_dir))
+    audio_path = tmp_path / "long.wav"
+    write_wav(audio_path, bursts_audio(BURSTS, 50.0))
+
+    with ChunkedTranscriber("tiny", workers=1, window_seconds=20.0, search_seconds=3.0,
+                            adapter_factory=crash_once_adapter_factory) as transcriber:
+        first = transcriber.transcribe(str(audio_path))
+        second = transcriber.transcribe(str(audio_path))
+
+    assert os.listdir(crash_dir) == ["crashed"]
+    for raw in (first, second):
+        assert [round(s["start"], 1) for s in raw["segments"]] == [start for start, _ in BURSTS]
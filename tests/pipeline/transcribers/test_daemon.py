@@ -0,0 +1,127 @@
+"""
+File: test_daemon.py
+
+Unit tests for the warm-model transcription daemon and its client.
+
+Covers:
+- Serving TranscriptV1 JSON over a Unix domain socket with resident adapters
+- Model preloading, on-demand loading, and error responses
+- Binding the socket owner-only regardless of the process umask
+- Client behavior when no daemon is listening and in-process fallback
+"""
+import os
+import stat
+import tempfile
+import threading
+import pytest
+from pipeline.transcribers.daemon import (
+    TranscriptionServer,
+    DaemonClient,
+    DaemonError,
+    DaemonUnavailableError,
+    DaemonFallbackTranscriber,
+)
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+
+class FakeAdapter:
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.calls = 0
+
+    def transcribe(self, audio_path, language=None):
+        self.calls += 1
+        return {"language": language or "en", "segments": [{"text": "warm", "start": 1.5, "confidence": 0.8}]}
+
+    def get_engine_info(self):
+        return ("fake", self.model_name)
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are length-limited, so avoid deep pytest tmp directories
+    with tempfile.TemporaryDirectory(prefix="cp-") as directory:
+        yield os.path.join(directory, "daemon.sock")
+
+@pytest.fixture
+def server(socket_path):
+    loaded = []
+
+    def factory(model_name):
+        loaded.append(model_name)
+        return FakeAdapter(model_name)
+
+    server = TranscriptionServer(socket_path, ["base"], adapter_factory=factory)
+    server.loaded = loaded
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "clip.mp3"
+    path.write_bytes(b"audio")
+    return path
+
+def test_daemon_returns_transcript_with_resident_model(server, socket_path, audio_file):
+    client = DaemonClient(socket_path, timeout=5)
+
+    first = client.transcribe(str(audio_file), language="fr")
+    second = client.transcribe(str(audio_file))
+
+    assert isinstance(first, TranscriptV1)
+    assert first.metadata.language == "fr"
+    assert first.transcript[0].timestamp == "00:00:01.500"
+    assert second.metadata.engine_version == "base"
+    assert server.loaded == ["base"]
+    assert server.adapters["base"].calls == 2
+
+def test_daemon_loads_additional_models_on_demand(server, socket_path, audio_file):
+    transcript = DaemonClient(socket_path, timeout=5).transcribe(str(audio_file), model="tiny")
+
+    assert transcript.metadata.engine_version == "tiny"
+    assert server.loaded == ["base", "tiny"]
+
+def test_daemon_reports_errors(server, socket_path, tmp_path):
+    with pytest.raises(DaemonError):
+        DaemonClient(socket_path, timeout=5).transcribe(str(tmp_path / "missing.mp3"))
+
+def test_daemon_removes_socket_on_close(server, socket_path):
+    assert DaemonClient(socket_path, timeout=5).ping()
+    server.shutdown()
+    server.server_close()
+    assert not os.path.exists(socket_path)
+
+def test_daemon_binds_socket_owner_only(socket_path):
+    previous = os.umask(0)
+    try:
+        server = TranscriptionServer(socket_path, [], adapter_factory=FakeAdapter)
+    finally:
+        restored = os.umask(previous)
+    try:
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        assert restored == 0
+    finally:
+        server.server_close()
+
+def test_client_raises_when_no_daemon(socket_path, audio_file):
+    client = DaemonClient(socket_path)
+
+    assert not client.ping()
+    with pytest.raises(DaemonUnavailableError):
+        client.transcribe(str(audio_file))
+
+def test_fallback_transcriber_runs_in_process_without_daemon(socket_path, audio_file):
+    created = []
+
+    def factory(model_name):
+        created.append(model_name)
+        return FakeAdapter(model_name)
+
+    transcriber = DaemonFallbackTranscriber("small", socket_path, adapter_factory=factory)
+    transcript = transcriber(str(audio_file), "en")
+    transcriber(str(audio_file), "en")
+
+    assert transcript.metadata.engine_version == "small"
+    assert created == ["small"]
+    assert transcriber.use_daemon is False
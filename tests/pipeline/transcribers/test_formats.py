@@ -0,0 +1,95 @@
+"""
+File: test_formats.py
+
+Unit tests for transcript serialization formats.
+
+Covers:
+- Round trips through every format whose optional dependency is installed
+- Format detection from the data for plain, compressed and footer-only transcripts
+- JSONL output readable by load_jsonl_transcript
+- Compact and compressed formats being smaller than formatted JSON
+- A clear error when msgpack or zstandard is missing
+- Replacing a path's format extension, and LocalFilePersistence writing other formats
+"""
+import importlib.util
+import sys
+import pytest
+from pipeline.transcribers.formats import (
+    TRANSCRIPT_FORMAT_NAMES,
+    decode_transcript,
+    detect_format,
+    encode_transcript,
+    load_transcript,
+    with_format_extension,
+)
+from pipeline.transcribers.persistence import LocalFilePersistence, load_jsonl_transcript
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptSegment, TranscriptV1, build_transcript_metadata
+
+OPTIONAL = {"msgpack": "msgpack", "zst": "zstandard"}
+
+def make_transcript(count=50):
+    segments = [
+        TranscriptSegment(text=f"segment {i} été", timestamp=f"00:{i // 60:02}:{i % 60:02}.500",
+                          speaker="A" if i % 2 else None, confidence=0.5 if i % 3 else None)
+        for i in range(count)
+    ]
+    return TranscriptV1(metadata=build_transcript_metadata("whisper", "base", language="fr", confidence_avg=0.5), transcript=segments)
+
+def _skip_unavailable(name):
+    for marker, module in OPTIONAL.items():
+        if marker in name and importlib.util.find_spec(module) is None:
+            pytest.skip(f"{module} is not installed")
+
+@pytest.mark.parametrize("name", TRANSCRIPT_FORMAT_NAMES)
+def test_round_trip_and_detection(name):
+    _skip_unavailable(name)
+    transcript = make_transcript()
+
+    data = encode_transcript(transcript, name)
+
+    assert detect_format(data) == name
+    assert decode_transcript(data) == transcript
+    assert decode_transcript(data, name) == transcript
+
+@pytest.mark.parametrize("name", ["jsonl", "jsonl.gz", "json-compact"])
+def test_empty_transcript_round_trip(name):
+    transcript = make_transcript(0)
+    data = encode_transcript(transcript, name)
+    assert detect_format(data) == name
+    assert decode_transcript(data) == transcript
+
+def test_jsonl_format_matches_stream_layout(tmp_path):
+    transcript = make_transcript()
+    path = tmp_path / "t.jsonl"
+    path.write_bytes(encode_transcript(transcript, "jsonl"))
+    assert load_jsonl_transcript(path) == transcript
+
+def test_compact_formats_are_smaller():
+    transcript = make_transcript(500)
+    sizes = {name: len(encode_transcript(transcript, name)) for name in ("json", "json-compact", "jsonl", "json.gz", "jsonl.gz")}
+    assert sizes["json-compact"] < sizes["json"]
+    assert sizes["jsonl"] < sizes["json"]
+    assert sizes["json.gz"] < sizes["json-compact"] / 4
+
+def test_missing_optional_dependency_is_named(monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ImportError, match="pip install msgpack"):
+        encode_transcript(make_transcript(), "msgpack")
+    with pytest.raises(ImportError, match="pip install zstandard"):
+        encode_transcript(make_transcript(), "jsonl.zst")
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unknown transcript format"):
+        encode_transcript(make_transcript(), "xml")
+
+def test_with_format_extension():
+    assert with_format_extension("output/talk.json", "jsonl.gz") == "output/talk.jsonl.gz"
+    assert with_format_extension("output/talk.jsonl.gz", "json") == "output/talk.json"
+    assert with_format_extension("output/talk", "msgpack") == "output/talk.msgpack"
+
+def test_local_persistence_writes_selected_format(tmp_path):
+    transcript = make_transcript()
+    path = LocalFilePersistence("json.gz").persist(transcript, tmp_path / "talk.json.gz")
+    assert (tmp_path / "talk.json.gz").read_bytes()[:2] == b"\x1f\x8b"
+    assert load_transcript(path) == transcript
@@ -7,9 +7,12 @@ Covers:
 - Conversion of raw adapter output to TranscriptV1 format
 - Metadata construction and segment transformation
 - Adapter-specific normalization edge cases
+- Trusted-mode normalization producing the same transcript as the validated path, and rejecting what it rejects
+- Vectorized timestamp formatting matching format_timestamp and rejecting non-finite starts
 """
+import random
 import pytest
-from pipeline.transcribers.normalize import normalize_transcript_v1
+from pipeline.transcribers.normalize import format_timestamp, format_timestamps, normalize_transcript_v1
 from pipeline.transcribers.adapters.whisper import WhisperAdapter
 from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
 
@@ -87,3 +90,58 @@ def test_normalize_transcript_v1_no_segments_key(adapter):
 
     transcript = normalize_transcript_v1(raw, adapter)
     assert transcript.transcript == []
+
+class StubAdapter:
+    def get_engine_info(self):
+        return "whisper", "base"
+
+def make_raw(count, seed=0, max_start=20000):
+    rng = random.Random(seed)
+    confidences = [None, 1, 0, lambda: rng.random()]
+    segments = []
+    for _ in range(count):
+        confidence = rng.choice(confidences)
+        segments.append({
+            "text": f"segment {rng.randint(0, 10**6)}",
+            "start": rng.uniform(-5, max_start),
+            "confidence": confidence() if callable(confidence) else confidence,
+        })
+    return {"language": "en", "segments": segments}
+
+@pytest.mark.parametrize("raw", [
+    make_raw(5000), make_raw(0), {"language": "de"}, make_raw(3, seed=7), make_raw(2000, seed=5, max_start=86399.999)
+])
+def test_trusted_normalization_matches_validated(raw):
+    validated = normalize_transcript_v1(raw, StubAdapter())
+    trusted = normalize_transcript_v1(raw, StubAdapter(), trusted=True)
+
+    assert trusted.transcript == validated.transcript
+    assert [s.model_dump_json() for s in trusted.transcript] == [s.model_dump_json() for s in validated.transcript]
+    assert trusted.metadata.model_dump(exclude={"created_at"}) == validated.metadata.model_dump(exclude={"created_at"})
+
+def test_trusted_normalization_rejects_invalid_confidence():
+    raw = {"segments": [{"text": "loud", "start": 0.0, "confidence": 1.5}]}
+    with pytest.raises(ValueError):
+        normalize_transcript_v1(raw, StubAdapter())
+    with pytest.raises(ValueError, match="Confidence must be between"):
+        normalize_transcript_v1(raw, StubAdapter(), trusted=True)
+
+@pytest.mark.parametrize("start", [86400.0, 90000.5])
+def test_trusted_normalization_rejects_starts_past_24_hours(start):
+    raw = {"segments": [{"text": "late", "start": 1.0}, {"text": "later", "start": start}]}
+    with pytest.raises(ValueError):
+        normalize_transcript_v1(raw, StubAdapter())
+    with pytest.raises(ValueError, match="HH:MM:SS.mmm"):
+        normalize_transcript_v1(raw, StubAdapter(), trusted=True)
+
+def test_format_timestamps_matches_format_timestamp():
+    rng = random.Random(3)
+    starts = [rng.uniform(-10, 400000) for _ in range(20000)]
+    starts += [0.0, -0.0, 2.5, 0.1 + 0.2, 59.9995, 3599.9999999, 3600.0, 1e-9, 7.0005, 1e20]
+    assert format_timestamps(starts) == [format_timestamp(start) for start in starts]
+    assert format_timestamps([]) == []
+
+@pytest.mark.parametrize("bad", [float("nan"), float("inf"), float("-inf")])
+def test_format_timestamps_rejects_non_finite_starts(bad):
+    with pytest.raises(ValueError):
+        format_timestamps([1.0, bad])
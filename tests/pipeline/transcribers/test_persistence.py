@@ -7,10 +7,28 @@ Covers:
 - Saving TranscriptV1 objects to disk as JSON
 - Reloading and verifying persisted transcript content
 - File path resolution and overwrite behavior
+- JSONL segment streaming with a metadata footer and reading partial files
+- Background uploads of transcripts and artifacts to object storage
+- Atomic replacement of local transcripts, leaving the old file intact on failure
+- Write-behind persistence: non-blocking persist, batched fsyncs, flush barrier and error reporting
+- The write-behind writer surviving failed cleanups and unexpected errors
 """
 import json
-from pipeline.transcribers.persistence import LocalFilePersistence
-from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1
+import os
+import threading
+import pytest
+from pipeline.transcribers import persistence
+from pipeline.transcribers.persistence import (
+    CloudPersistence,
+    LocalFilePersistence,
+    PersistenceError,
+    WriteBehindPersistence,
+    JsonlStreamPersistence,
+    iter_jsonl_segments,
+    load_jsonl_transcript,
+)
+from pipeline.transcribers.schemas.transcript_v1 import TranscriptV1, TranscriptSegment, build_transcript_metadata
+from pipeline.utils.object_storage import ObjectStorageClient
 
 def test_local_file_persistence_with_real_data(tmp_path):
     # Load real transcript data
@@ -31,4 +49,168 @@ def test_local_file_persistence_with_real_data(tmp_path):
 
 
 
-    
\ No newline at end of file
+    
+
+
+def make_segments(count):
+    return [TranscriptSegment(text=f"line {i}", timestamp=f"00:00:{i:02}.000") for i in range(count)]
+
+def test_jsonl_persistence_round_trip(tmp_path):
+    transcript = TranscriptV1(metadata=build_transcript_metadata("whisper", "base", language="en"), transcript=make_segments(3))
+    output_path = tmp_path / "transcript.jsonl"
+
+    JsonlStreamPersistence().persist(transcript, output_path)
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1])["metadata"]["language"] == "en"
+    assert load_jsonl_transcript(output_path) == transcript
+
+def test_jsonl_persistence_keeps_segments_written_before_a_crash(tmp_path):
+    output_path = tmp_path / "transcript.jsonl"
+
+    def crashing_segments():
+        yield from make_segments(2)
+        raise RuntimeError("inference crashed")
+
+    with pytest.raises(RuntimeError):
+        JsonlStreamPersistence().persist_stream(crashing_segments(), lambda: None, output_path)
+
+    assert [s.text for s in iter_jsonl_segments(output_path)] == ["line 0", "line 1"]
+    with pytest.raises(ValueError, match="no metadata footer"):
+        load_jsonl_transcript(output_path)
+
+def test_iter_jsonl_segments_ignores_truncated_line(tmp_path):
+    output_path = tmp_path / "transcript.jsonl"
+    output_path.write_text(make_segments(1)[0].model_dump_json() + "\n" + '{"text": "par', encoding="utf-8")
+
+    assert len(list(iter_jsonl_segments(output_path))) == 1
+
+def test_cloud_persistence_uploads_in_background(s3_standin, tmp_path):
+    transcript = TranscriptV1(metadata=build_transcript_metadata("whisper", "base", language="en"), transcript=make_segments(3))
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"\xff\xfb" * 1000)
+    client = ObjectStorageClient(s3_standin.credentials, s3_endpoint=s3_standin.endpoint)
+
+    cloud = CloudPersistence(client=client)
+    assert cloud.persist(transcript, "s3://bucket/run/transcript.json") == "s3://bucket/run/transcript.json"
+    cloud.persist_file(audio, "s3://bucket/run/audio.mp3", "audio/mpeg")
+    stats = cloud.close()
+
+    assert (stats.objects, stats.bytes) == (2, len(s3_standin.objects["bucket/run/transcript.json"]) + 2000)
+    assert TranscriptV1(**json.loads(s3_standin.objects["bucket/run/transcript.json"])) == transcript
+    assert s3_standin.objects["bucket/run/audio.mp3"] == audio.read_bytes()
+    client.close()
+
+def make_transcript(count=3):
+    return TranscriptV1(metadata=build_transcript_metadata("whisper", "base", language="en"), transcript=make_segments(count))
+
+def test_local_file_persistence_keeps_old_file_when_write_fails(tmp_path, monkeypatch):
+    output_path = tmp_path / "transcript.json"
+    output_path.write_text("previous", encoding="utf-8")
+    monkeypatch.setattr(persistence.os, "replace", lambda src, dst: (_ for _ in ()).throw(OSError("disk full")))
+
+    with pytest.raises(OSError):
+        LocalFilePersistence().persist(make_transcript(), output_path)
+
+    assert output_path.read_text(encoding="utf-8") == "previous"
+    assert os.listdir(tmp_path) == ["transcript.json"]
+
+def test_write_behind_persist_returns_before_the_write(tmp_path, monkeypatch):
+    release = threading.Event()
+    fsync_path = persistence._fsync_path
+    monkeypatch.setattr(persistence, "_fsync_path", lambda *args, **kwargs: (release.wait(5), fsync_path(*args, **kwargs)))
+    transcript = make_transcript()
+    output_path = tmp_path / "transcript.json"
+
+    with WriteBehindPersistence() as strategy:
+        assert strategy.persist(transcript, output_path) == str(output_path)
+        assert not output_path.exists()
+        release.set()
+        assert strategy.flush() == 1
+
+    assert TranscriptV1(**json.loads(output_path.read_text(encoding="utf-8"))) == transcript
+    assert os.listdir(tmp_path) == ["transcript.json"]
+
+def test_write_behind_groups_fsyncs_per_batch(tmp_path, monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+    calls = []
+    replace = os.replace
+
+    def record_fsync(path, directory=False):
+        entered.set()
+        release.wait(5)
+        calls.append(("dir" if directory else "file", os.path.basename(path)))
+
+    def record_replace(src, dst):
+        calls.append(("rename", os.path.basename(dst)))
+        replace(src, dst)
+
+    monkeypatch.setattr(persistence, "_fsync_path", record_fsync)
+    monkeypatch.setattr(persistence.os, "replace", record_replace)
+    strategy = WriteBehindPersistence(batch_size=32)
+    futures = [strategy.submit(make_transcript(), tmp_path / "t0.json")]
+    assert entered.wait(5)
+    futures += [strategy.submit(make_transcript(), tmp_path / f"t{n}.json") for n in range(1, 11)]
+    release.set()
+
+    assert strategy.close() == 11
+    assert [f.result() for f in futures] == [str(tmp_path / f"t{n}.json") for n in range(11)]
+    # The rest queued up while the first transcript was being written
+    second_batch = [kind for kind, _ in calls[3:]]
+    assert second_batch == ["file"] * 10 + ["rename"] * 10 + ["dir"]
+
+def test_write_behind_reports_failures_at_flush(tmp_path):
+    strategy = WriteBehindPersistence()
+    strategy.persist(make_transcript(), tmp_path / "missing" / "transcript.json")
+    strategy.persist(make_transcript(), tmp_path / "ok.json")
+
+    with pytest.raises(PersistenceError) as error:
+        strategy.flush()
+
+    assert [path for path, _ in error.value.failures] == [str(tmp_path / "missing" / "transcript.json")]
+    assert os.listdir(tmp_path) == ["ok.json"]
+    assert strategy.close() == 0
+    with pytest.raises(RuntimeError):
+        strategy.persist(make_transcript(), tmp_path / "late.json")
+
+def test_write_behind_survives_failed_cleanup(tmp_path, monkeypatch):
+    replace, unlink = os.replace, os.unlink
+
+    def failing_replace(src, dst):
+        if os.path.basename(dst) == "bad.json":
+            raise OSError("rename failed")
+        replace(src, dst)
+
+    def failing_unlink(path):
+        if ".bad.json." in os.path.basename(path):
+            raise PermissionError("unlink failed")
+        unlink(path)
+
+    monkeypatch.setattr(persistence.os, "replace", failing_replace)
+    monkeypatch.setattr(persistence.os, "unlink", failing_unlink)
+    strategy = WriteBehindPersistence()
+    bad = strategy.submit(make_transcript(), tmp_path / "bad.json")
+    strategy.persist(make_transcript(), tmp_path / "ok.json")
+
+    with pytest.raises(PersistenceError) as error:
+        strategy.flush()
+
+    assert [path for path, _ in error.value.failures] == [str(tmp_path / "bad.json")]
+    assert isinstance(bad.exception(), OSError)
+    strategy.persist(make_transcript(), tmp_path / "after.json")
+    assert strategy.close() == 1
+    assert (tmp_path / "after.json").exists()
+
+def test_write_behind_survives_unexpected_errors(tmp_path, monkeypatch):
+    strategy = WriteBehindPersistence()
+    monkeypatch.setattr(strategy, "_write_batch", lambda writes: (_ for _ in ()).throw(RuntimeError("bug")))
+    future = strategy.submit(make_transcript(), tmp_path / "transcript.json")
+
+    with pytest.raises(PersistenceError):
+        strategy.flush()
+
+    assert isinstance(future.exception(), RuntimeError)
+    monkeypatch.undo()
+    strategy.persist(make_transcript(), tmp_path / "transcript.json")
+    assert strategy.close() == 1
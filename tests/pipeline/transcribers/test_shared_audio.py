@@ -0,0 +1,78 @@
+"""
+File: test_shared_audio.py
+
+Unit tests for the shared-memory audio transport.
+
+Covers:
+- Small picklable descriptors and zero-copy reads in worker processes
+- Reference-counted unlinking once the owner and every job have released the block
+- Cleanup when a worker process dies mid-job
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import numpy as np
+import pytest
+from pipeline.transcribers.shared_audio import SharedAudioBlock, call_with_shared_audio
+
+def window_sum(descriptor, start, end):
+    return call_with_shared_audio(descriptor, lambda audio: float(audio.sum()), start, end)
+
+def crash(descriptor):
+    call_with_shared_audio(descriptor, lambda audio: os._exit(1))
+
+def block_exists(name):
+    try:
+        shared_memory.SharedMemory(name=name).close()
+        return True
+    except FileNotFoundError:
+        return False
+
+def test_descriptor_is_small_and_views_share_memory():
+    audio = np.arange(1_000_000, dtype=np.float32)
+
+    with SharedAudioBlock(audio) as block:
+        assert len(pickle.dumps(block.descriptor)) < 200
+        window = call_with_shared_audio(block.descriptor, lambda view: view[10:20].copy(), 0, None)
+
+    np.testing.assert_array_equal(window, audio[10:20])
+
+def test_workers_read_windows_and_block_is_unlinked_after_last_release():
+    audio = np.ones(48_000, dtype=np.float32)
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        with SharedAudioBlock(audio) as block:
+            futures = []
+            for start in range(0, len(audio), 16_000):
+                future = pool.submit(window_sum, block.acquire(), start, start + 16_000)
+                future.add_done_callback(block.release)
+                futures.append(future)
+        assert [f.result() for f in futures] == [16_000.0] * 3
+
+    assert block.closed
+    assert not block_exists(block.descriptor.name)
+
+def test_block_survives_until_jobs_release_it():
+    block = SharedAudioBlock(np.zeros(10, dtype=np.float32))
+    block.acquire()
+
+    block.release()
+    assert block_exists(block.descriptor.name)
+
+    block.release()
+    assert not block_exists(block.descriptor.name)
+    with pytest.raises(RuntimeError):
+        block.acquire()
+
+def test_block_is_unlinked_when_worker_crashes():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        with SharedAudioBlock(np.zeros(1000, dtype=np.float32)) as block:
+            future = pool.submit(crash, block.acquire())
+            future.add_done_callback(block.release)
+        with pytest.raises(BrokenProcessPool):
+            future.result()
+
+    assert block.closed
+    assert not block_exists(block.descriptor.name)
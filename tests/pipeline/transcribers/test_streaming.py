@@ -0,0 +1,78 @@
+"""
+File: test_streaming.py
+
+Unit tests for incremental (streaming) transcription output.
+
+Covers:
+- Window-by-window segment generation on the original timeline
+- Streaming normalization and metadata built after the stream ends
+- Writing JSONL output while segments are still being produced
+"""
+import numpy as np
+from pipeline.transcribers.audio import SAMPLE_RATE
+from pipeline.transcribers.persistence import iter_jsonl_segments, load_jsonl_transcript
+from pipeline.transcribers.streaming import StreamingNormalizer, iter_window_segments, transcribe_to_jsonl
+
+class FakeStreamingAdapter:
+    """Yields a fixed list of segments and records how many were consumed before each yield."""
+    def __init__(self, segments, output_path=None):
+        self.segments = segments
+        self.output_path = output_path
+        self.lines_seen = []
+
+    def transcribe_stream(self, audio_path, language=None):
+        for segment in self.segments:
+            if self.output_path and self.output_path.exists():
+                self.lines_seen.append(len(self.output_path.read_text(encoding="utf-8").splitlines()))
+            yield segment
+
+    def get_engine_info(self):
+        return ("whisper", "tiny")
+
+def test_iter_window_segments_yields_per_window():
+    audio = np.zeros(75 * SAMPLE_RATE, dtype=np.float32)
+    calls = []
+
+    def transcribe_fn(window_audio, language):
+        calls.append(language)
+        return {"language": "de", "segments": [{"text": "x", "start": 2.0, "end": 3.0}]}
+
+    stream = iter_window_segments(transcribe_fn, audio, window_seconds=30.0)
+    first = next(stream)
+
+    # Only the first window has been transcribed when the first segment arrives
+    assert len(calls) == 1 and first["start"] == 2.0 and first["id"] == 0
+    rest = list(stream)
+    assert calls == [None, "de", "de"]
+    assert [s["id"] for s in rest] == [1, 2]
+    assert first["start"] < rest[0]["start"] < rest[1]["start"]
+
+def test_streaming_normalizer_builds_metadata_after_stream():
+    normalizer = StreamingNormalizer(FakeStreamingAdapter([]))
+    raw = [
+        {"text": "a", "start": 0.5, "confidence": 0.8, "language": "en"},
+        {"text": "b", "start": 61.25, "confidence": 0.6, "language": "en"},
+    ]
+
+    segments = list(normalizer.normalize_stream(raw))
+    metadata = normalizer.metadata()
+
+    assert [s.timestamp for s in segments] == ["00:00:00.500", "00:01:01.250"]
+    assert metadata.language == "en"
+    assert metadata.confidence_avg == 0.7
+    assert metadata.engine == "whisper"
+
+def test_transcribe_to_jsonl_writes_segments_incrementally(tmp_path):
+    output_path = tmp_path / "out.jsonl"
+    raw = [{"text": f"s{i}", "start": float(i), "language": "en"} for i in range(3)]
+    adapter = FakeStreamingAdapter(raw, output_path)
+
+    saved = transcribe_to_jsonl(adapter, "audio.mp3", output_path)
+
+    assert saved == str(output_path)
+    # Each earlier segment was already on disk when the next one was produced
+    assert adapter.lines_seen == [0, 1, 2]
+    assert [s.text for s in iter_jsonl_segments(output_path)] == ["s0", "s1", "s2"]
+    transcript = load_jsonl_transcript(output_path)
+    assert transcript.metadata.language == "en"
+    assert len(transcript.transcript) == 3
@@ -0,0 +1,100 @@
+"""
+File: test_vad.py
+
+Unit tests for the energy-based voice-activity pre-filter.
+
+Covers:
+- Speech detection over tone bursts separated by silence and low-level noise
+- Offset map restoring original-timeline timestamps, including region boundaries
+- VadTranscriber passing only speech to the wrapped adapter and reporting skipped time
+"""
+import wave
+import numpy as np
+import pytest
+from pipeline.transcribers.audio import SAMPLE_RATE
+from pipeline.transcribers.normalize import normalize_transcript_v1
+from pipeline.transcribers.vad import OffsetMap, VadTranscriber, apply_vad, detect_speech
+
+BURSTS = [(5.0, 8.0), (20.0, 22.5), (40.0, 41.0)]
+
+def bursts_audio(bursts, total_seconds, noise=0.0):
+    """Build a waveform of tone bursts at (start, end) seconds over an optional noise bed."""
+    rng = np.random.default_rng(0)
+    audio = (noise * rng.standard_normal(int(total_seconds * SAMPLE_RATE))).astype(np.float32)
+    t = np.arange(len(audio)) / SAMPLE_RATE
+    for start, end in bursts:
+        mask = (t >= start) & (t < end)
+        audio[mask] += 0.5 * np.sin(2 * np.pi * 220 * t[mask])
+    return audio
+
+def write_wav(path, audio):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+
+class RecordingAdapter:
+    """Fake adapter that reports one segment covering each second of received audio."""
+    def __init__(self):
+        self.received = []
+
+    def transcribe(self, audio, language=None):
+        self.received.append(len(audio))
+        seconds = int(len(audio) / SAMPLE_RATE)
+        segments = [{"id": i, "text": f" s{i}", "start": float(i), "end": float(i + 1)} for i in range(seconds)]
+        return {"text": "", "segments": segments, "language": "en"}
+
+    def get_engine_info(self):
+        return ("fake", "tiny")
+
+@pytest.mark.parametrize("noise", [0.0, 0.002])
+def test_detect_speech_finds_bursts(noise):
+    audio = bursts_audio(BURSTS, 50.0, noise=noise)
+
+    spans = detect_speech(audio)
+
+    assert len(spans) == len(BURSTS)
+    for (start, end), (burst_start, burst_end) in zip(spans, BURSTS):
+        assert burst_start - 0.3 <= start / SAMPLE_RATE <= burst_start
+        assert burst_end <= end / SAMPLE_RATE <= burst_end + 0.3
+
+def test_apply_vad_reports_skipped_seconds():
+    audio = bursts_audio(BURSTS, 50.0)
+
+    result = apply_vad(audio)
+
+    assert len(result.audio) == sum(end - start for start, end in result.spans)
+    assert result.total_seconds == pytest.approx(50.0)
+    assert result.skipped_seconds == pytest.approx(50.0 - len(result.audio) / SAMPLE_RATE)
+    assert result.skipped_seconds > 40.0
+
+def test_apply_vad_on_silence_keeps_nothing():
+    result = apply_vad(np.zeros(10 * SAMPLE_RATE, dtype=np.float32))
+
+    assert result.spans == [] and len(result.audio) == 0
+    assert result.skipped_seconds == pytest.approx(10.0)
+
+def test_offset_map_restores_original_times():
+    offset_map = OffsetMap([(2 * SAMPLE_RATE, 4 * SAMPLE_RATE), (10 * SAMPLE_RATE, 13 * SAMPLE_RATE)])
+
+    assert offset_map.to_original(0.0) == 2.0
+    assert offset_map.to_original(1.5) == 3.5
+    assert offset_map.to_original(2.0) == 10.0
+    assert offset_map.to_original(2.0, is_end=True) == 4.0
+    assert offset_map.to_original(4.0) == 12.0
+
+def test_vad_transcriber_restores_timeline(tmp_path):
+    audio_path = tmp_path / "intro.wav"
+    write_wav(audio_path, bursts_audio([(30.0, 33.0)], 40.0))
+    inner = RecordingAdapter()
+
+    transcriber = VadTranscriber(inner)
+    raw = transcriber.transcribe(str(audio_path))
+    transcript = normalize_transcript_v1(raw, transcriber)
+
+    assert inner.received[0] < 4 * SAMPLE_RATE
+    assert raw["segments"][0]["start"] == pytest.approx(29.8, abs=0.05)
+    assert transcript.transcript[0].timestamp.startswith("00:00:29.")
+    assert raw["vad"]["skipped_seconds"] > 35.0
+    assert transcriber.skipped_seconds == raw["vad"]["skipped_seconds"]
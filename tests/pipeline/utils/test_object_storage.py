@@ -0,0 +1,58 @@
+"""
+File: test_object_storage.py
+
+Unit tests for the pooled object storage client, against the local S3-compatible stand-in.
+
+Covers:
+- Resolving s3://, gs:// and https sources to HTTP locations
+- Ranged reads of a whole object or a slice over one keep-alive connection
+- Resuming a read after dropped connections
+- Failing when the object changes between ranges
+"""
+import pytest
+from pipeline.utils.object_storage import ObjectLocation, ObjectStorageClient, ObjectStorageError
+from pipeline.utils.sigv4 import Credentials
+
+DATA = bytes(range(256)) * 1000
+
+@pytest.fixture
+def client(s3_standin):
+    s3_standin.objects["bucket/blob.bin"] = DATA
+    client = ObjectStorageClient(s3_endpoint=s3_standin.endpoint, range_bytes=64 * 1024)
+    yield client
+    client.close()
+
+def test_locate():
+    client = ObjectStorageClient(Credentials("AKID", "secret", region="eu-west-1"))
+
+    assert client.locate("s3://bucket/dir/a b.mp4") == ObjectLocation("https", "bucket.s3.eu-west-1.amazonaws.com", "/dir/a%20b.mp4", True)
+    assert client.locate("gs://bucket/a.mp4") == ObjectLocation("https", "storage.googleapis.com", "/bucket/a.mp4", False)
+    assert client.locate("https://storage.googleapis.com/bucket/a.mp4").signed is False
+    assert ObjectStorageClient(s3_endpoint="http://minio:9000").locate("s3://bucket/a.mp4").url == "http://minio:9000/bucket/a.mp4"
+    with pytest.raises(ValueError):
+        client.locate("azure://container/a.mp4")
+
+def test_iter_object_reads_ranges_over_one_connection(s3_standin, client):
+    assert b"".join(client.iter_object("s3://bucket/blob.bin")) == DATA
+    assert b"".join(client.iter_object("s3://bucket/blob.bin", start=1000, length=100000)) == DATA[1000:101000]
+    assert client.head("s3://bucket/blob.bin").size == len(DATA)
+
+    assert len(s3_standin.ranges) == 4 + 2
+    assert len(s3_standin.connections) == 1
+    assert client.pool.opened == 1
+
+def test_iter_object_resumes_after_dropped_connections(s3_standin, client):
+    s3_standin.drop_after = 10000
+
+    assert b"".join(client.iter_object("s3://bucket/blob.bin")) == DATA
+    starts = [start for start, _ in s3_standin.ranges]
+    assert starts == sorted(set(starts))
+
+def test_iter_object_fails_when_object_changes(s3_standin, client):
+    chunks = client.iter_object("s3://bucket/blob.bin")
+    next(chunks)
+    s3_standin.objects["bucket/blob.bin"] = b"replaced" + DATA
+
+    with pytest.raises(ObjectStorageError) as error:
+        b"".join(chunks)
+    assert error.value.status == 412
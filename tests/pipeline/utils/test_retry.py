@@ -0,0 +1,59 @@
+"""
+File: test_retry.py
+
+Unit tests for the retry decorator.
+
+Covers:
+- Failures that make progress are retried immediately and not counted
+- Failures without progress are counted, with exponential backoff
+- Exceptions listed in no_retry are raised at once
+"""
+from types import SimpleNamespace
+import pytest
+from pipeline.utils.retry import retry
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("pipeline.utils.retry.time", SimpleNamespace(sleep=sleeps.append))
+    return sleeps
+
+def test_progress_is_not_counted_as_failure(sleeps):
+    state = {"saved": 0, "calls": 0}
+
+    @retry(max_attempts=2, delay=1, progress=lambda: state["saved"])
+    def download():
+        state["calls"] += 1
+        if state["saved"] < 5:
+            state["saved"] += 1
+            raise ConnectionError("dropped")
+        return "done"
+
+    assert download() == "done"
+    assert state["calls"] == 6
+    assert sleeps == []
+
+def test_failures_without_progress_back_off(sleeps):
+    calls = []
+
+    @retry(max_attempts=3, delay=1, backoff=2, progress=lambda: 0)
+    def download():
+        calls.append(1)
+        raise ConnectionError("refused")
+
+    with pytest.raises(ConnectionError):
+        download()
+    assert len(calls) == 3
+    assert sleeps == [1, 2]
+
+def test_no_retry_exceptions_are_raised_immediately(sleeps):
+    calls = []
+
+    @retry(max_attempts=3, no_retry=(KeyboardInterrupt,))
+    def download():
+        calls.append(1)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        download()
+    assert calls == [1] and sleeps == []
@@ -0,0 +1,115 @@
+"""
+File: test_uploads.py
+
+Background uploads to the local S3-compatible stand-in.
+
+Covers:
+- Many small objects uploaded over a few reused connections, with throughput statistics
+- Large objects uploaded as multipart uploads with parts in parallel, from bytes or files
+- A failed part aborts the multipart upload and surfaces in flush()
+- A full queue blocks the producer until a worker frees a slot
+- SigV4-signed multipart uploads
+"""
+import threading
+import time
+import pytest
+from pipeline.utils.object_storage import ObjectStorageClient
+from pipeline.utils.sigv4 import Credentials
+from pipeline.utils.uploads import UploadError, UploadQueue
+
+PART = 64 * 1024
+
+@pytest.fixture
+def client(s3_standin):
+    client = ObjectStorageClient(s3_standin.credentials, s3_endpoint=s3_standin.endpoint)
+    yield client
+    client.close()
+
+def test_small_objects_share_connections(s3_standin, client):
+    with UploadQueue(client, workers=2) as uploads:
+        futures = [uploads.put_bytes(f'{{"n": {n}}}'.encode(), f"s3://bucket/t/{n}.json") for n in range(200)]
+        stats = uploads.flush()
+
+    assert [f.result() for f in futures] == [f"s3://bucket/t/{n}.json" for n in range(200)]
+    assert s3_standin.objects["bucket/t/7.json"] == b'{"n": 7}'
+    assert (stats.objects, stats.failed) == (200, 0)
+    assert stats.objects_per_second > 0 and stats.megabytes_per_second > 0
+    assert len(s3_standin.connections) <= 2
+
+def test_large_object_uses_parallel_multipart(s3_standin, client, tmp_path):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    upload_part = client.upload_part
+
+    def slow_upload_part(*args):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        try:
+            return upload_part(*args)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    client.upload_part = slow_upload_part
+    data = bytes(range(256)) * (PART * 11 // 2 // 256)
+    path = tmp_path / "audio.flac"
+    path.write_bytes(data[::-1])
+
+    with UploadQueue(client, multipart_threshold=2 * PART, part_size=PART, part_workers=4) as uploads:
+        uploads.put_bytes(data, "s3://bucket/big.bin")
+        uploads.put_file(path, "s3://bucket/audio.flac")
+        uploads.put_bytes(b"small", "s3://bucket/small.txt")
+        stats = uploads.flush()
+
+    assert s3_standin.objects["bucket/big.bin"] == data
+    assert s3_standin.objects["bucket/audio.flac"] == data[::-1]
+    assert sorted(s3_standin.completed) == [("bucket/audio.flac", 6), ("bucket/big.bin", 6)]
+    assert stats.bytes == 2 * len(data) + 5
+    assert peak[0] > 1
+
+def test_failed_part_aborts_upload(s3_standin, client, monkeypatch):
+    monkeypatch.setattr("pipeline.utils.retry.time.sleep", lambda seconds: None)
+    s3_standin.fail_parts = {2}
+
+    with UploadQueue(client, multipart_threshold=2 * PART, part_size=PART) as uploads:
+        future = uploads.put_bytes(b"x" * (3 * PART), "s3://bucket/broken.bin")
+        uploads.put_bytes(b"fine", "s3://bucket/fine.txt")
+        with pytest.raises(UploadError) as error:
+            uploads.flush()
+
+    assert [destination for destination, _ in error.value.failures] == ["s3://bucket/broken.bin"]
+    assert future.exception() is not None
+    assert s3_standin.aborted == ["bucket/broken.bin"]
+    assert "bucket/broken.bin" not in s3_standin.objects
+    assert s3_standin.objects["bucket/fine.txt"] == b"fine"
+
+def test_full_queue_blocks_producer(s3_standin, client):
+    release = threading.Event()
+    put_object = client.put_object
+    client.put_object = lambda *args: (release.wait(5), put_object(*args))[1]
+    uploads = UploadQueue(client, workers=1, max_pending=1, batch_size=1)
+    uploads.put_bytes(b"1", "s3://bucket/1")
+    time.sleep(0.1)  # the worker takes the first upload and blocks
+    uploads.put_bytes(b"2", "s3://bucket/2")
+
+    third = threading.Thread(target=uploads.put_bytes, args=(b"3", "s3://bucket/3"))
+    third.start()
+    time.sleep(0.1)
+    assert third.is_alive()
+
+    release.set()
+    third.join(5)
+    assert uploads.close().objects == 3
+
+def test_signed_multipart_upload(s3_standin):
+    s3_standin.credentials = Credentials("AKIDSTANDIN", "standin-secret")
+    client = ObjectStorageClient(s3_standin.credentials, s3_endpoint=s3_standin.endpoint)
+
+    with UploadQueue(client, multipart_threshold=2 * PART, part_size=PART) as uploads:
+        uploads.put_bytes(b"y" * (2 * PART + 1), "s3://bucket/signed.bin")
+        uploads.flush()
+
+    assert len(s3_standin.objects["bucket/signed.bin"]) == 2 * PART + 1
+    client.close()